@@ -0,0 +1,71 @@
+"""Per-incident memory for a burst of alerts: plain dataclasses vs the slotted models.
+
+Run with: PYTHONPATH=src python3 benchmarks/bench_models.py
+"""
+
+from __future__ import annotations
+
+import gc
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List
+
+from openclaw_sentinel.models import Incident
+
+BURST = 50_000
+TENANTS = ("t1", "t2", "t3")
+SEVERITIES = ("critical", "warning")
+MONITORS = 200
+
+
+@dataclass(frozen=True)
+class _PlainIncident:
+    """The Incident layout before slots, interning and shared tags."""
+
+    id: str
+    tenant_id: str
+    source: str
+    severity: str
+    summary: str
+    tags: Dict[str, str] = field(default_factory=dict)
+
+
+def _burst(factory: Callable[..., object]) -> List[object]:
+    # Build every string at runtime, as a decoded JSON payload would, so literals are not
+    # shared behind the benchmark's back.
+    return [
+        factory(
+            id=f"evt-{n}",
+            tenant_id="".join(TENANTS[n % len(TENANTS)]),
+            source="".join("datadog"),
+            severity="".join(SEVERITIES[n % len(SEVERITIES)]),
+            summary="Latency is high",
+            tags={"".join("monitor_id"): f"m-{n % MONITORS}"},
+        )
+        for n in range(BURST)
+    ]
+
+
+def _bytes_per_incident(factory: Callable[..., object]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    incidents = _burst(factory)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del incidents
+    return total / BURST
+
+
+def main() -> None:
+    plain = _bytes_per_incident(_PlainIncident)
+    compact = _bytes_per_incident(Incident)
+    print(f"{'layout':>8} {'bytes/incident':>15}")
+    print(f"{'plain':>8} {plain:>15.0f}")
+    print(f"{'slotted':>8} {compact:>15.0f}")
+    print(f"saved {1 - compact / plain:.0%} across {BURST} incidents")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Policy evaluation cost as the blocked-command list grows.
+
+Run with: PYTHONPATH=src python3 benchmarks/bench_policy.py
+"""
+
+from __future__ import annotations
+
+import random
+import string
+import timeit
+
+from openclaw_sentinel.models import Action, AutonomyLevel, RiskProfile
+from openclaw_sentinel.policy import PolicyEngine, PolicyRule
+
+SIZES = (10, 100, 1_000, 10_000)
+ACTION = Action(
+    id="a1",
+    incident_id="i1",
+    tenant_id="t1",
+    action_type="scale_worker",
+    command="kubectl scale deployment/worker --replicas=6 --namespace=payments",
+)
+RISK = RiskProfile(impact=2, blast_radius=2, reversibility=5, confidence=0.85)
+
+
+def _patterns(count: int) -> set[str]:
+    rng = random.Random(count)
+    return {"".join(rng.choice(string.ascii_lowercase + " -") for _ in range(rng.randint(6, 18))) for _ in range(count)}
+
+
+def _substring_scan(blocked: set[str], command: str) -> bool:
+    for pattern in blocked:
+        if pattern in command:
+            return True
+    return False
+
+
+def main() -> None:
+    print(f"{'patterns':>9} {'scan_us':>9} {'evaluate_us':>12}")
+    for size in SIZES:
+        blocked = _patterns(size)
+        engine = PolicyEngine(
+            PolicyRule(
+                tenant_id="t1",
+                max_autonomy=AutonomyLevel.L2_BOUNDED_AUTO,
+                allowlisted_action_types={"scale_worker"},
+                blocked_commands=blocked,
+            ),
+            cache_size=0,  # time the matcher, not decision-cache hits
+        )
+        engine.evaluate(ACTION, RISK)  # build the matcher outside the timed loop
+        loops = 2_000
+        scan = timeit.timeit(lambda: _substring_scan(blocked, ACTION.command), number=loops) / loops
+        compiled = timeit.timeit(lambda: engine.evaluate(ACTION, RISK), number=loops) / loops
+        print(f"{size:>9} {scan * 1e6:>9.2f} {compiled * 1e6:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""CronSchedule.next_after: minute-by-minute scan vs the field-wise walk.
+
+Run with: PYTHONPATH=src python3 benchmarks/bench_scheduler.py
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta
+from typing import Callable
+
+from openclaw_sentinel.scheduler import CronSchedule
+
+START = datetime(2027, 3, 1, 12, 34, 56)
+EXPRESSIONS = ("*/5 * * * *", "30 14 * * *", "0 3 * * 1", "0 9 1 * *", "0 3 13 * 5", "0 3 29 2 *")
+
+
+def _scan_next_after(schedule: CronSchedule, dt: datetime) -> datetime:
+    """The previous implementation: step one minute at a time for up to a year."""
+    candidate = dt.replace(second=0, microsecond=0) + timedelta(minutes=1)
+    for _ in range(366 * 24 * 60):
+        if schedule.matches(candidate):
+            return candidate
+        candidate += timedelta(minutes=1)
+    raise ValueError("no match within a year")
+
+
+def _per_call_us(fn: Callable[[], datetime], min_seconds: float = 0.2) -> float:
+    calls = 0
+    started = time.perf_counter()
+    while True:
+        fn()
+        calls += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_seconds:
+            return elapsed / calls * 1e6
+
+
+def main() -> None:
+    print(f"{'expression':>14} {'scan_us':>12} {'walk_us':>9} {'speedup':>9}")
+    for expression in EXPRESSIONS:
+        schedule = CronSchedule.parse(expression)
+        assert schedule.next_after(START) == _scan_next_after(schedule, START)
+        scan = _per_call_us(lambda: _scan_next_after(schedule, START))
+        walk = _per_call_us(lambda: schedule.next_after(START))
+        print(f"{expression:>14} {scan:>12.1f} {walk:>9.1f} {scan / walk:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,56 +1,100 @@
 """OpenClaw Sentinel core package."""
 
 from .api import handle_webhook, run_server_forever, serve
-from .config import LiveConfig, load_live_config, load_webhook_config
+from .async_service import AsyncIncidentConnector, AsyncSentinelService
+from .batch import IncidentBatch
+from .config import LiveConfig, load_live_config, load_policy_rules, load_webhook_config
 from .connectors import DatadogConnector, GrafanaConnector, StaticConnector
 from .control_loop import ControlLoop
+from .cron_daemon import CronDaemon, CronJob
+from .dedup import IncidentDeduplicator, incident_fingerprint
+from .histogram import LatencyHistogram
 from .http_clients import DatadogAPIClient, GrafanaAPIClient
+from .http_pool import PooledTransport
+from .idempotency import IdempotencyCache, SQLiteIdempotencyStore
+from .ingest import IncidentIngestQueue, IngestQueueFull
 from .learning import EvalScore, PromotionGate, PromotionResult, PromotionThresholds
-from .live_connectors import LiveDatadogConnector, LiveGrafanaConnector
+from .live_connectors import EventWatermark, LiveDatadogConnector, LiveGrafanaConnector, WatermarkStore
 from .logging_utils import configure_logging
+from .metrics_exporter import DatadogMetricsExporter
 from .models import Action, AutonomyLevel, Incident, RiskProfile
-from .planner import RuleBasedPlanner
-from .policy import PolicyEngine, PolicyRule
-from .rate_limit import SlidingWindowRateLimiter
-from .reporting import ReportingStore
+from .pipeline import PipelineConfig, PipelinedEngine
+from .planner import ActionTemplate, RuleBasedPlanner
+from .policy import CommandMatcher, PolicyEngine, PolicyEvaluator, PolicyRegistry, PolicyRule
+from .prometheus import PrometheusRenderer, render_prometheus
+from .rate_limit import GCRARateLimiter, RateLimiter, SlidingWindowRateLimiter
+from .reporting import ReportingStore, RollingCycleStats
 from .scheduler import CronParseError, CronSchedule
+from .server import BoundedHTTPServer
 from .service import SentinelService
+from .state_store import SQLiteStateStore
 from .verification import VerificationService
-from .webhooks import WebhookConfig, WebhookSecrets, process_webhook
+from .webhooks import WebhookConfig, WebhookSecrets, parse_webhook, process_webhook
 
 __all__ = [
     "Action",
+    "ActionTemplate",
+    "AsyncIncidentConnector",
+    "AsyncSentinelService",
     "AutonomyLevel",
+    "BoundedHTTPServer",
+    "CommandMatcher",
     "ControlLoop",
     "DatadogAPIClient",
     "DatadogConnector",
+    "DatadogMetricsExporter",
     "EvalScore",
+    "EventWatermark",
+    "GCRARateLimiter",
     "GrafanaAPIClient",
     "GrafanaConnector",
+    "IdempotencyCache",
     "Incident",
+    "IncidentBatch",
+    "IncidentDeduplicator",
+    "IncidentIngestQueue",
+    "IngestQueueFull",
+    "LatencyHistogram",
     "LiveDatadogConnector",
     "LiveGrafanaConnector",
     "LiveConfig",
+    "PipelineConfig",
+    "PipelinedEngine",
     "PolicyEngine",
+    "PolicyEvaluator",
+    "PolicyRegistry",
     "PolicyRule",
+    "PooledTransport",
+    "PrometheusRenderer",
     "PromotionGate",
     "PromotionResult",
     "PromotionThresholds",
+    "RateLimiter",
     "ReportingStore",
     "RuleBasedPlanner",
+    "CronDaemon",
+    "CronJob",
     "CronParseError",
     "CronSchedule",
     "RiskProfile",
+    "RollingCycleStats",
     "SentinelService",
+    "SQLiteIdempotencyStore",
+    "SQLiteStateStore",
     "SlidingWindowRateLimiter",
     "StaticConnector",
     "VerificationService",
+    "WatermarkStore",
     "WebhookConfig",
     "WebhookSecrets",
     "handle_webhook",
+    "incident_fingerprint",
     "load_live_config",
+    "load_policy_rules",
     "load_webhook_config",
+    "parse_webhook",
     "process_webhook",
+    "render_prometheus",
     "run_server_forever",
     "serve",
     "configure_logging",
@@ -2,20 +2,30 @@ from __future__ import annotations
 
 import json
 import logging
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from http.server import BaseHTTPRequestHandler, HTTPServer, ThreadingHTTPServer
 from typing import Any, Callable
 
-from .rate_limit import SlidingWindowRateLimiter
+from .idempotency import IdempotencyCache
+from .ingest import IncidentIngestQueue, IngestQueueFull
+from .models import Incident
+from .prometheus import CONTENT_TYPE as PROMETHEUS_CONTENT_TYPE
+from .prometheus import PrometheusRenderer, accepts_gzip
+from .rate_limit import GCRARateLimiter, RateLimiter
+from .server import BoundedHTTPServer, keep_alive_handler
 from .service import SentinelService
-from .webhooks import WebhookConfig, process_webhook
+from .webhooks import WebhookConfig, parse_webhook
 
 logger = logging.getLogger("openclaw_sentinel.api")
 
+DEFAULT_MAX_BODY_BYTES = 1024 * 1024
 
-def _json(handler: BaseHTTPRequestHandler, status: int, payload: dict[str, Any]) -> None:
+
+def _json(handler: BaseHTTPRequestHandler, status: int, payload: dict[str, Any], close: bool = False) -> None:
     body = json.dumps(payload).encode("utf-8")
     handler.send_response(status)
     handler.send_header("Content-Type", "application/json")
+    if close:
+        handler.send_header("Connection", "close")
     handler.send_header("Content-Length", str(len(body)))
     handler.end_headers()
     handler.wfile.write(body)
@@ -31,6 +41,22 @@ def handle_get(path: str, service: SentinelService) -> tuple[int, dict[str, Any]
     return 404, {"error": "not_found"}
 
 
+def handle_ingest_status(path: str, ingest: IncidentIngestQueue | None) -> tuple[int, dict[str, Any]]:
+    ticket_id = path[len("/webhook/status/") :]
+    status = ingest.status(ticket_id) if ingest is not None and ticket_id else None
+    if status is None:
+        return 404, {"error": "not_found"}
+    return 200, status
+
+
+def handle_prometheus(headers: dict[str, str], renderer: PrometheusRenderer) -> tuple[int, bytes, dict[str, str]]:
+    gzipped = accepts_gzip(headers)
+    response_headers = {"Content-Type": PROMETHEUS_CONTENT_TYPE, "Vary": "Accept-Encoding"}
+    if gzipped:
+        response_headers["Content-Encoding"] = "gzip"
+    return 200, renderer.render(gzipped=gzipped), response_headers
+
+
 def handle_run_cycle(payload: dict[str, Any], service: SentinelService) -> tuple[int, dict[str, Any]]:
     cycle_id = str(payload.get("cycle_id", "api-cycle"))
     summary = service.run_cycle(cycle_id=cycle_id)
@@ -43,7 +69,9 @@ def handle_webhook(
     raw_body: bytes,
     service: SentinelService,
     webhook_cfg: WebhookConfig,
-    limiter: SlidingWindowRateLimiter,
+    limiter: RateLimiter,
+    ingest: IncidentIngestQueue | None = None,
+    idempotency: IdempotencyCache | None = None,
 ) -> tuple[int, dict[str, Any]]:
     parts = [p for p in path.split("/") if p]
     if len(parts) != 2 or parts[0] != "webhook":
@@ -58,7 +86,7 @@ def handle_webhook(
         return 429, {"error": "rate_limited"}
 
     try:
-        incident = process_webhook(source=source, headers=headers, raw_body=raw_body, cfg=webhook_cfg)
+        incident, delivery_id = parse_webhook(source=source, headers=headers, raw_body=raw_body, cfg=webhook_cfg)
     except PermissionError:
         logger.warning("Webhook unauthorized source=%s", source)
         return 401, {"error": "unauthorized"}
@@ -66,8 +94,41 @@ def handle_webhook(
         logger.warning("Webhook bad request source=%s", source)
         return 400, {"error": "bad_request"}
 
+    if idempotency is None or delivery_id is None:
+        return _run_webhook(source, incident, service, ingest)
+    # Checked after signature verification, so unauthenticated requests cannot poison it.
+    key = f"{webhook_cfg.tenant_id}:{source}:{delivery_id}"
+    cached = idempotency.begin(key)
+    if cached is not None:
+        service.reporting.increment("webhook_duplicates")
+        logger.info("Duplicate webhook delivery source=%s delivery_id=%s", source, delivery_id)
+        return cached
+    try:
+        response = _run_webhook(source, incident, service, ingest)
+    except BaseException:
+        idempotency.release(key)
+        raise
+    idempotency.complete(key, response)
+    return response
+
+
+def _run_webhook(
+    source: str, incident: Incident, service: SentinelService, ingest: IncidentIngestQueue | None
+) -> tuple[int, dict[str, Any]]:
     cycle_id = f"webhook-{source}-{incident.id}"
     logger.info("Webhook accepted source=%s incident_id=%s", source, incident.id)
+    if ingest is not None:
+        try:
+            ticket_id = ingest.submit(incident, cycle_id)
+        except IngestQueueFull:
+            logger.warning("Webhook ingest queue full source=%s incident_id=%s", source, incident.id)
+            return 503, {"error": "queue_full"}
+        return 202, {
+            "status": "queued",
+            "ticket_id": ticket_id,
+            "incident_id": incident.id,
+            "status_url": f"/webhook/status/{ticket_id}",
+        }
     summary = service.run_incident(cycle_id=cycle_id, incident=incident)
     return 202, summary.__dict__
 
@@ -75,15 +136,49 @@ def handle_webhook(
 def build_handler(
     service: SentinelService,
     webhook_cfg: WebhookConfig,
-    limiter: SlidingWindowRateLimiter,
+    limiter: RateLimiter,
+    max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+    ingest: IncidentIngestQueue | None = None,
+    idempotency: IdempotencyCache | None = None,
 ) -> type[BaseHTTPRequestHandler]:
+    renderer = PrometheusRenderer(service.reporting)
+
     class SentinelAPIHandler(BaseHTTPRequestHandler):
         def do_GET(self) -> None:  # noqa: N802
+            if self.path == "/metrics/prometheus":
+                status, body, headers = handle_prometheus({k.lower(): v for k, v in self.headers.items()}, renderer)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return
+            if self.path.startswith("/webhook/status/"):
+                status, payload = handle_ingest_status(self.path, ingest)
+                _json(self, status, payload)
+                return
             status, payload = handle_get(self.path, service)
             _json(self, status, payload)
 
         def do_POST(self) -> None:  # noqa: N802
-            content_len = int(self.headers.get("Content-Length", "0"))
+            # Chunked bodies are not decoded; without a length the body cannot be skipped either.
+            if "Transfer-Encoding" in self.headers:
+                service.reporting.increment("http_length_required")
+                _json(self, 411, {"error": "length_required"}, close=True)
+                return
+            try:
+                content_len = int(self.headers.get("Content-Length", "0"))
+            except ValueError:
+                content_len = -1
+            # Either way the body is left unread, so the connection cannot be reused.
+            if content_len < 0:
+                _json(self, 400, {"error": "bad_request"}, close=True)
+                return
+            if content_len > max_body_bytes:
+                service.reporting.increment("http_body_too_large")
+                _json(self, 413, {"error": "payload_too_large"}, close=True)
+                return
             raw = self.rfile.read(content_len) if content_len else b"{}"
             if self.path == "/run-cycle":
                 payload = json.loads(raw.decode("utf-8"))
@@ -99,6 +194,8 @@ def build_handler(
                     service=service,
                     webhook_cfg=webhook_cfg,
                     limiter=limiter,
+                    ingest=ingest,
+                    idempotency=idempotency,
                 )
                 _json(self, status, body)
                 return
@@ -117,13 +214,38 @@ def serve(
     host: str = "127.0.0.1",
     port: int = 8080,
     webhook_cfg: WebhookConfig | None = None,
-    limiter: SlidingWindowRateLimiter | None = None,
-) -> ThreadingHTTPServer:
+    limiter: RateLimiter | None = None,
+    workers: int = 0,
+    max_pending: int = 64,
+    backlog: int = 128,
+    max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+    keep_alive_seconds: float = 5.0,
+    max_requests_per_connection: int = 100,
+    ingest: IncidentIngestQueue | None = None,
+    idempotency: IdempotencyCache | None = None,
+) -> HTTPServer:
+    """Build the API server. ``workers=0`` keeps the thread-per-connection server; a
+    positive value serves HTTP/1.1 keep-alive from that many threads (see BoundedHTTPServer)."""
     effective_webhook_cfg = webhook_cfg or WebhookConfig(tenant_id="default")
-    effective_limiter = limiter or SlidingWindowRateLimiter(max_requests=30, window_seconds=60)
-    handler = build_handler(service, webhook_cfg=effective_webhook_cfg, limiter=effective_limiter)
-    server = ThreadingHTTPServer((host, port), handler)
-    return server
+    effective_limiter = limiter if limiter is not None else GCRARateLimiter(max_requests=30, window_seconds=60)
+    handler = build_handler(
+        service,
+        webhook_cfg=effective_webhook_cfg,
+        limiter=effective_limiter,
+        max_body_bytes=max_body_bytes,
+        ingest=ingest,
+        idempotency=idempotency,
+    )
+    if workers <= 0:
+        return ThreadingHTTPServer((host, port), handler)
+    return BoundedHTTPServer(
+        (host, port),
+        keep_alive_handler(handler, keep_alive_seconds, max_requests_per_connection),
+        workers=workers,
+        max_pending=max_pending,
+        backlog=backlog,
+        reporting=service.reporting,
+    )
 
 
 def run_server_forever(
@@ -131,7 +253,8 @@ def run_server_forever(
     host: str = "127.0.0.1",
     port: int = 8080,
     webhook_cfg: WebhookConfig | None = None,
-    limiter: SlidingWindowRateLimiter | None = None,
+    limiter: RateLimiter | None = None,
+    **server_options: Any,
 ) -> None:
-    server = serve(service=service, host=host, port=port, webhook_cfg=webhook_cfg, limiter=limiter)
+    server = serve(service=service, host=host, port=port, webhook_cfg=webhook_cfg, limiter=limiter, **server_options)
     server.serve_forever()
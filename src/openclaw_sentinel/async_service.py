@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Iterable, List, Protocol, Union
+
+from .connectors import IncidentConnector
+from .dedup import IncidentDeduplicator
+from .models import Action, ActionOutcome, CycleSummary, Incident
+from .policy import PolicyEvaluator
+from .reporting import ReportingStore
+from .service import PlannerFn, SummarySink, _commit_fetch, _plan_and_evaluate, _record_outcome
+from .state_store import SQLiteStateStore
+
+logger = logging.getLogger("openclaw_sentinel.async_service")
+
+
+class AsyncIncidentConnector(Protocol):
+    source_name: str
+
+    async def fetch_incidents(self) -> Iterable[Incident]:
+        ...
+
+
+class AsyncVerifier(Protocol):
+    async def verify(self, action: Action, executor_result: str) -> ActionOutcome:
+        ...
+
+
+AsyncExecutorFn = Callable[[Action], Awaitable[str]]
+AnyConnector = Union[IncidentConnector, AsyncIncidentConnector]
+
+
+def _is_async(fn: Any) -> bool:
+    return inspect.iscoroutinefunction(fn) or inspect.iscoroutinefunction(getattr(fn, "__call__", None))
+
+
+async def _in_executor(fn: Callable[..., Any], *args: Any) -> Any:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(fn, *args))
+
+
+def _as_list(incidents: Iterable[Incident]) -> List[Incident]:
+    # Lists are kept as they are so an incremental fetch can still be committed.
+    return incidents if isinstance(incidents, list) else list(incidents)
+
+
+async def _fetch(connector: AnyConnector) -> List[Incident]:
+    fetch = connector.fetch_incidents
+    if inspect.isasyncgenfunction(fetch):
+        return [incident async for incident in fetch()]
+    if _is_async(fetch):
+        return _as_list(await fetch())
+    # Sync connectors block on urllib; keep them off the event loop.
+    return await _in_executor(lambda: _as_list(fetch()))
+
+
+@dataclass
+class AsyncSentinelService:
+    """Asyncio-native counterpart of SentinelService.
+
+    Connectors, the executor and the verifier may each be sync or async. Sync connectors
+    and executors run on the loop's default executor; a sync verifier runs inline since the
+    bundled VerificationService is pure CPU. Planning and policy evaluation stay synchronous.
+    """
+
+    connectors: List[AnyConnector]
+    policy_engine: PolicyEvaluator
+    planner: PlannerFn
+    executor: Union[AsyncExecutorFn, Callable[[Action], str]]
+    verifier: Any
+    reporting: ReportingStore = field(default_factory=ReportingStore)
+    connector_timeout_seconds: float | None = None
+    cycle_timeout_seconds: float | None = None
+    max_concurrent_incidents: int = 1
+    deduplicator: IncidentDeduplicator | None = None
+    state_store: SQLiteStateStore | None = None
+
+    async def _execute_action(self, action: Action) -> bool:
+        with self.reporting.timer("stage_execute"):
+            if _is_async(self.executor):
+                result = await self.executor(action)
+            else:
+                result = await _in_executor(self.executor, action)
+        verify = self.verifier.verify
+        with self.reporting.timer("stage_verify"):
+            outcome = await verify(action, result) if _is_async(verify) else verify(action, result)
+        return _record_outcome(self.reporting, outcome, self.state_store)
+
+    async def _process_incident(self, incident: Incident) -> tuple[int, int, int]:
+        with self.reporting.timer("stage_incident"):
+            approved, actions_blocked = _plan_and_evaluate(
+                self.planner, self.policy_engine, self.reporting, incident, self.deduplicator, self.state_store
+            )
+            actions_succeeded = 0
+            for action in approved:
+                if await self._execute_action(action):
+                    actions_succeeded += 1
+        return len(approved), actions_blocked, actions_succeeded
+
+    async def _fetch_one(self, connector: AnyConnector) -> List[Incident]:
+        source = connector.source_name
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            incidents = await asyncio.wait_for(_fetch(connector), timeout=self.connector_timeout_seconds)
+        except asyncio.TimeoutError:
+            self.reporting.increment_labeled("connector_timeouts", (source,))
+            logger.warning("Connector fetch timed out source=%s", source)
+            return []
+        except Exception as exc:
+            self.reporting.increment_labeled("connector_failures", (source,))
+            logger.warning("Connector fetch failed source=%s error=%s", source, exc)
+            return []
+        self.reporting.record_latency(f"connector_fetch_{source}", loop.time() - started)
+        return incidents
+
+    async def _fetch_all(self) -> List[List[Incident]]:
+        tasks = [asyncio.ensure_future(self._fetch_one(connector)) for connector in self.connectors]
+        if not tasks:
+            return []
+        done, pending = await asyncio.wait(tasks, timeout=self.cycle_timeout_seconds)
+        for task in pending:
+            task.cancel()
+            source = self.connectors[tasks.index(task)].source_name
+            self.reporting.increment_labeled("connector_timeouts", (source,))
+            logger.warning("Connector fetch exceeded cycle deadline source=%s", source)
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        return [task.result() for task in tasks if task in done]
+
+    async def run_incident(self, cycle_id: str, incident: Incident) -> CycleSummary:
+        logger.info("Running incident cycle id=%s incident=%s", cycle_id, incident.id)
+        approved, blocked, succeeded = await self._process_incident(incident)
+        return self._finish_cycle(
+            CycleSummary(
+                cycle_id=cycle_id,
+                incidents_seen=1,
+                actions_approved=approved,
+                actions_blocked=blocked,
+                actions_succeeded=succeeded,
+            )
+        )
+
+    def _finish_cycle(self, summary: CycleSummary) -> CycleSummary:
+        if self.state_store is not None:
+            self.state_store.record_cycle(summary, self.reporting.counter_state())
+        return summary
+
+    async def run_cycle(self, cycle_id: str) -> CycleSummary:
+        with self.reporting.timer("stage_cycle"):
+            return await self._run_cycle(cycle_id)
+
+    async def _run_cycle(self, cycle_id: str) -> CycleSummary:
+        logger.info("Starting async cycle id=%s", cycle_id)
+        fetches = await self._fetch_all()
+        incidents = [incident for fetched in fetches for incident in fetched]
+        limit = asyncio.Semaphore(max(1, self.max_concurrent_incidents))
+
+        async def bounded(incident: Incident) -> tuple[int, int, int]:
+            async with limit:
+                return await self._process_incident(incident)
+
+        results = await asyncio.gather(*(bounded(incident) for incident in incidents))
+        for fetched in fetches:
+            _commit_fetch(fetched)
+        return self._finish_cycle(
+            CycleSummary(
+                cycle_id=cycle_id,
+                incidents_seen=len(incidents),
+                actions_approved=sum(r[0] for r in results),
+                actions_blocked=sum(r[1] for r in results),
+                actions_succeeded=sum(r[2] for r in results),
+            )
+        )
+
+    async def run_forever(
+        self,
+        interval_seconds: float = 60,
+        max_cycles: int | None = None,
+        sink: SummarySink | None = None,
+    ) -> List[CycleSummary]:
+        logger.info("Running async service loop interval_seconds=%s max_cycles=%s", interval_seconds, max_cycles)
+        summaries: List[CycleSummary] = []
+        cycle = 1
+        try:
+            while True:
+                summary = await self.run_cycle(cycle_id=f"cycle-{cycle}")
+                if sink is None:
+                    summaries.append(summary)
+                else:
+                    sink(summary)
+                if max_cycles is not None and cycle >= max_cycles:
+                    return summaries
+                cycle += 1
+                await asyncio.sleep(interval_seconds)
+        except asyncio.CancelledError:
+            logger.info("Async service loop cancelled completed_cycles=%s", cycle - 1)
+            raise
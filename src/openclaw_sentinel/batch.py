@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Mapping, Sequence
+
+from .dedup import incident_fingerprint
+from .models import FrozenTags, Incident, _intern, shared_tags
+
+
+@dataclass
+class IncidentBatch:
+    """Columnar incidents: one list per field and dictionary-encoded tags.
+
+    ``tag_codes[row]`` indexes ``tag_dictionary``, so a dump where every alert carries one
+    of a handful of label sets stores each set once. Iterating (or indexing) yields regular
+    Incident objects, so a batch can stand in for ``List[Incident]`` anywhere; the bulk
+    planner path reads the columns directly and never builds them.
+    """
+
+    ids: List[str] = field(default_factory=list)
+    tenant_ids: List[str] = field(default_factory=list)
+    sources: List[str] = field(default_factory=list)
+    severities: List[str] = field(default_factory=list)
+    summaries: List[str] = field(default_factory=list)
+    tag_codes: List[int] = field(default_factory=list)
+    tag_dictionary: List[FrozenTags] = field(default_factory=list)
+    _tag_index: Dict[FrozenTags, int] = field(default_factory=dict, repr=False, compare=False)
+
+    @classmethod
+    def from_incidents(cls, incidents: Iterable[Incident]) -> "IncidentBatch":
+        batch = cls()
+        for incident in incidents:
+            batch.append(
+                incident.id, incident.tenant_id, incident.source, incident.severity, incident.summary, incident.tags
+            )
+        return batch
+
+    def append(
+        self,
+        id: str,
+        tenant_id: str,
+        source: str,
+        severity: str,
+        summary: str,
+        tags: Mapping[str, str] | None = None,
+    ) -> None:
+        frozen = shared_tags(tags)
+        code = self._tag_index.get(frozen)
+        if code is None:
+            code = len(self.tag_dictionary)
+            self.tag_dictionary.append(frozen)
+            self._tag_index[frozen] = code
+        self.ids.append(id)
+        self.tenant_ids.append(_intern(tenant_id))
+        self.sources.append(_intern(source))
+        self.severities.append(_intern(severity))
+        self.summaries.append(summary)
+        self.tag_codes.append(code)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, row: int) -> Incident:
+        return Incident(
+            id=self.ids[row],
+            tenant_id=self.tenant_ids[row],
+            source=self.sources[row],
+            severity=self.severities[row],
+            summary=self.summaries[row],
+            tags=self.tag_dictionary[self.tag_codes[row]],
+        )
+
+    def __iter__(self) -> Iterator[Incident]:
+        for row in range(len(self.ids)):
+            yield self[row]
+
+    def tags(self, row: int) -> FrozenTags:
+        return self.tag_dictionary[self.tag_codes[row]]
+
+    def fingerprint(self, row: int) -> str:
+        return incident_fingerprint(self.sources[row], self.tenant_ids[row], self.ids[row], self.tags(row))
+
+    def select(self, rows: Sequence[int]) -> "IncidentBatch":
+        """Return a new batch with only ``rows``, sharing this batch's tag dictionary."""
+        return IncidentBatch(
+            ids=[self.ids[row] for row in rows],
+            tenant_ids=[self.tenant_ids[row] for row in rows],
+            sources=[self.sources[row] for row in rows],
+            severities=[self.severities[row] for row in rows],
+            summaries=[self.summaries[row] for row in rows],
+            tag_codes=[self.tag_codes[row] for row in rows],
+            tag_dictionary=list(self.tag_dictionary),
+            _tag_index=dict(self._tag_index),
+        )
@@ -1,25 +1,34 @@
 from __future__ import annotations
 
 import argparse
+import dataclasses
 import json
 import logging
-import time
-from datetime import datetime
+import threading
 from typing import List
 
 from .api import run_server_forever
-from .config import load_live_config, load_webhook_config
+from .config import load_live_config, load_policy_rules, load_webhook_config
 from .connectors import DatadogConnector, GrafanaConnector
+from .cron_daemon import CATCH_UP_POLICIES, CronDaemon, CronJob
+from .dedup import IncidentDeduplicator
 from .http_clients import DatadogAPIClient, GrafanaAPIClient
+from .http_pool import PooledTransport
+from .idempotency import IdempotencyCache, SQLiteIdempotencyStore
+from .ingest import IncidentIngestQueue
 from .live_connectors import LiveDatadogConnector, LiveGrafanaConnector
+from .metrics_exporter import DatadogMetricsExporter
+from .pipeline import PipelineConfig
 from .planner import RuleBasedPlanner
-from .policy import PolicyEngine, PolicyRule
-from .rate_limit import SlidingWindowRateLimiter
-from .scheduler import CronSchedule
+from .policy import PolicyEngine, PolicyRegistry, PolicyRule
+from .rate_limit import GCRARateLimiter, SlidingWindowRateLimiter
+from .reporting import ReportingStore, RollingCycleStats
+from .scheduler import CronParseError, CronSchedule
 from .service import SentinelService
+from .state_store import SQLiteStateStore
 from .logging_utils import configure_logging
 from .verification import VerificationService
-from .models import AutonomyLevel
+from .models import AutonomyLevel, CycleSummary
 
 logger = logging.getLogger("openclaw_sentinel.cli")
 
@@ -70,14 +79,18 @@ def _demo_service() -> SentinelService:
 
 def _live_service(cfg=None) -> SentinelService:
     cfg = cfg or load_live_config()
+    reporting = ReportingStore()
+    transport = PooledTransport(reporting=reporting)
     datadog_client = DatadogAPIClient(
         base_url=cfg.datadog_base_url,
         api_key=cfg.datadog_api_key,
         app_key=cfg.datadog_app_key,
+        opener=transport,
     )
     grafana_client = GrafanaAPIClient(
         base_url=cfg.grafana_base_url,
         api_token=cfg.grafana_api_token,
+        opener=transport,
     )
     rule = PolicyRule(
         tenant_id=cfg.tenant_id,
@@ -93,72 +106,223 @@ def _live_service(cfg=None) -> SentinelService:
 
     return SentinelService(
         connectors=[
-            LiveDatadogConnector(client=datadog_client, tenant_id=cfg.tenant_id),
-            LiveGrafanaConnector(client=grafana_client, tenant_id=cfg.tenant_id),
+            LiveDatadogConnector(client=datadog_client, tenant_id=cfg.tenant_id, incremental=True, streaming=True),
+            LiveGrafanaConnector(client=grafana_client, tenant_id=cfg.tenant_id, columnar=True),
         ],
-        policy_engine=PolicyEngine(rule),
+        policy_engine=PolicyEngine(rule, reporting=reporting),
         planner=planner.plan,
+        batch_planner=planner.plan_batch,
         executor=executor,
         verifier=VerificationService(),
+        reporting=reporting,
     )
 
 
+def _cron_job(service: SentinelService, spec: str, index: int, catch_up: str, emit) -> CronJob:
+    """Build a job from ``EXPR`` (whole service) or ``SOURCE=EXPR`` (one connector group)."""
+    source, _, expression = spec.rpartition("=")
+    target = service
+    name = f"cron-{index}"
+    if source:
+        connectors = [connector for connector in service.connectors if connector.source_name == source]
+        if not connectors:
+            raise SystemExit(f"--cron {spec!r}: no connector with source {source!r}")
+        # Shares policy, reporting and state with the main service; only fetches differ.
+        target = dataclasses.replace(service, connectors=connectors)
+        name = f"cron-{source}-{index}"
+    try:
+        schedule = CronSchedule.parse(expression)
+    except CronParseError as exc:
+        raise SystemExit(f"--cron {spec!r}: {exc}") from None
+    return CronJob(name=name, schedule=schedule, run=lambda run_id: emit(target.run_cycle(cycle_id=run_id)), catch_up=catch_up)
+
+
 def main(argv: List[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Run OpenClaw Sentinel demo")
     parser.add_argument("--mode", choices=["demo", "live"], default="demo", help="Execution mode")
     parser.add_argument("--cycles", type=int, default=1, help="Number of cycles to run")
-    parser.add_argument("--cron", default="", help="Cron expression for scheduled cycle runs (5 fields)")
+    parser.add_argument(
+        "--cron",
+        action="append",
+        default=[],
+        help="Cron schedule for cycle runs (5 fields); repeatable. 'SOURCE=EXPR' runs only that connector",
+    )
+    parser.add_argument("--cron-catch-up", choices=CATCH_UP_POLICIES, default="skip", help="What to do with missed cron fires")
     parser.add_argument("--serve", action="store_true", help="Start REST API server")
     parser.add_argument("--host", default="127.0.0.1", help="Host for --serve")
     parser.add_argument("--port", type=int, default=8080, help="Port for --serve")
+    parser.add_argument("--workers", type=int, default=0, help="API worker threads with keep-alive (0: thread per connection)")
+    parser.add_argument("--max-pending", type=int, default=64, help="Accepted connections waiting for a worker before 503s")
+    parser.add_argument("--max-body-bytes", type=int, default=1024 * 1024, help="Largest accepted request body (413 above)")
     parser.add_argument("--enable-webhooks", action="store_true", help="Enable /webhook/* endpoints")
+    parser.add_argument("--ingest-workers", type=int, default=0, help="Process webhooks asynchronously on N workers (0: inline)")
+    parser.add_argument("--ingest-queue-size", type=int, default=1000, help="Webhook incidents waiting before 503s")
+    parser.add_argument("--ingest-db", default="", help="SQLite path that makes the webhook queue survive restarts")
+    parser.add_argument("--idempotency-ttl", type=float, default=86400.0, help="Seconds to answer webhook retries from cache (0 disables)")
+    parser.add_argument("--idempotency-db", default="", help="SQLite path that keeps webhook idempotency keys across restarts")
     parser.add_argument("--webhook-rate-limit", type=int, default=30, help="Webhook max requests per window")
     parser.add_argument("--webhook-rate-window", type=int, default=60, help="Webhook rate limit window seconds")
+    parser.add_argument(
+        "--webhook-rate-limiter",
+        choices=("gcra", "sliding"),
+        default="gcra",
+        help="gcra: O(1) state per key with idle-key eviction; sliding: exact per-request window",
+    )
+    parser.add_argument("--webhook-rate-max-keys", type=int, default=100_000, help="Rate limit keys tracked at once (gcra)")
+    parser.add_argument("--fetch-workers", type=int, default=1, help="Concurrent connector fetches per cycle")
+    parser.add_argument("--connector-timeout", type=float, default=0.0, help="Per-connector fetch deadline seconds, needs --fetch-workers > 1 (0 disables)")
+    parser.add_argument("--cycle-timeout", type=float, default=0.0, help="Whole-cycle fetch deadline seconds, needs --fetch-workers > 1 (0 disables)")
+    parser.add_argument("--plan-workers", type=int, default=1, help="Plan/evaluate workers when pipelined")
+    parser.add_argument("--execute-workers", type=int, default=0, help="Execute/verify workers; > 0 enables the pipelined engine")
+    parser.add_argument("--pipeline-queue-size", type=int, default=64, help="Bounded queue size between pipeline stages")
+    parser.add_argument("--dedup-ttl", type=float, default=0.0, help="Suppress repeat incidents for this many seconds (0 disables)")
+    parser.add_argument("--dedup-max-entries", type=int, default=10000, help="Max fingerprints kept by the dedup index")
+    parser.add_argument("--state-db", default="", help="SQLite path for persisting incidents, decisions, outcomes and cycles")
+    parser.add_argument(
+        "--state-fsync",
+        choices=["always", "batch", "never"],
+        default="batch",
+        help="always: wait for each record's commit; batch: commit queued records in batches; never: batches without fsync",
+    )
+    parser.add_argument("--state-retention-days", type=float, default=30.0, help="Days of state records to keep")
+    parser.add_argument(
+        "--datadog-export-interval", type=float, default=0.0, help="Live mode: ship metrics to Datadog every N seconds (0 disables)"
+    )
+    parser.add_argument("--stream", action="store_true", help="Print one NDJSON line per cycle, then a final metrics line")
+    parser.add_argument("--policy-file", default="", help="JSON list of per-tenant policy rules (routes by action tenant)")
     parser.add_argument("--debug", action="store_true", help="Enable debug logs")
     parser.add_argument("--log-file", default="", help="Optional log file path")
     args = parser.parse_args(argv)
+    if (args.connector_timeout or args.cycle_timeout) and args.fetch_workers <= 1:
+        # Deadlines need the fan-out pool; a sequential fetch cannot be abandoned.
+        parser.error("--connector-timeout and --cycle-timeout require --fetch-workers > 1")
     configure_logging(debug=args.debug, log_file=args.log_file or None)
 
     live_cfg = load_live_config() if args.mode == "live" else None
     service = _demo_service() if args.mode == "demo" else _live_service(cfg=live_cfg)
+    if args.policy_file:
+        service.policy_engine = PolicyRegistry(load_policy_rules(args.policy_file), reporting=service.reporting)
+    service.fetch_workers = args.fetch_workers
+    service.connector_timeout_seconds = args.connector_timeout or None
+    service.cycle_timeout_seconds = args.cycle_timeout or None
+    if args.dedup_ttl > 0:
+        service.deduplicator = IncidentDeduplicator(ttl_seconds=args.dedup_ttl, max_entries=args.dedup_max_entries)
+    if args.state_db:
+        service.state_store = SQLiteStateStore(
+            path=args.state_db,
+            fsync=args.state_fsync,
+            retention_seconds=args.state_retention_days * 86400,
+        )
+        restored = service.state_store.latest_counters()
+        if restored:
+            service.reporting.restore(restored)
+            logger.info("Restored counters from state store path=%s", args.state_db)
+    exporter = None
+    if args.mode == "live" and args.datadog_export_interval > 0:
+        exporter = DatadogMetricsExporter(
+            base_url=live_cfg.datadog_base_url,
+            api_key=live_cfg.datadog_api_key,
+            opener=PooledTransport(reporting=service.reporting),
+            reporting=service.reporting,
+            flush_interval_seconds=args.datadog_export_interval,
+        )
+    if args.execute_workers > 0:
+        service.pipeline = PipelineConfig(
+            plan_workers=args.plan_workers,
+            execute_workers=args.execute_workers,
+            queue_size=args.pipeline_queue_size,
+        )
     if args.serve:
         webhook_cfg = None
         limiter = None
+        ingest = None
+        idempotency = None
         if args.enable_webhooks:
             tenant_id = "t1" if args.mode == "demo" else live_cfg.tenant_id
             webhook_cfg = load_webhook_config(tenant_id=tenant_id)
-            limiter = SlidingWindowRateLimiter(
-                max_requests=args.webhook_rate_limit,
-                window_seconds=args.webhook_rate_window,
-            )
-        logger.info("Starting API server host=%s port=%s webhooks=%s", args.host, args.port, args.enable_webhooks)
-        run_server_forever(service=service, host=args.host, port=args.port, webhook_cfg=webhook_cfg, limiter=limiter)
+            if args.webhook_rate_limiter == "gcra":
+                limiter = GCRARateLimiter(
+                    max_requests=args.webhook_rate_limit,
+                    window_seconds=args.webhook_rate_window,
+                    max_keys=args.webhook_rate_max_keys,
+                )
+            else:
+                limiter = SlidingWindowRateLimiter(
+                    max_requests=args.webhook_rate_limit,
+                    window_seconds=args.webhook_rate_window,
+                )
+            if args.ingest_workers > 0:
+                ingest = IncidentIngestQueue(
+                    service=service,
+                    workers=args.ingest_workers,
+                    max_queue=args.ingest_queue_size,
+                    path=args.ingest_db or None,
+                )
+            if args.idempotency_ttl > 0:
+                idempotency = IdempotencyCache(
+                    ttl_seconds=args.idempotency_ttl,
+                    store=SQLiteIdempotencyStore(args.idempotency_db) if args.idempotency_db else None,
+                )
+        logger.info(
+            "Starting API server host=%s port=%s webhooks=%s workers=%s",
+            args.host,
+            args.port,
+            args.enable_webhooks,
+            args.workers,
+        )
+        run_server_forever(
+            service=service,
+            host=args.host,
+            port=args.port,
+            webhook_cfg=webhook_cfg,
+            limiter=limiter,
+            workers=args.workers,
+            max_pending=args.max_pending,
+            max_body_bytes=args.max_body_bytes,
+            ingest=ingest,
+            idempotency=idempotency,
+        )
         return 0
 
+    rolling = RollingCycleStats()
+    summaries: List[CycleSummary] = []
+
+    emit_lock = threading.Lock()
+
+    def emit(summary: CycleSummary) -> None:
+        # Cron jobs may finish concurrently.
+        with emit_lock:
+            rolling.add(summary)
+            if args.stream:
+                print(json.dumps({"summary": summary.__dict__}, sort_keys=True), flush=True)
+            else:
+                summaries.append(summary)
+
     if args.cron:
-        schedule = CronSchedule.parse(args.cron)
-        logger.info("Cron mode enabled schedule=%s cycles=%s", args.cron, args.cycles)
-        summaries = []
-        for i in range(args.cycles):
-            now = datetime.now()
-            next_run = schedule.next_after(now)
-            sleep_seconds = max(0.0, (next_run - now).total_seconds())
-            logger.info("Waiting until next run cycle=%s run_at=%s sleep_seconds=%.3f", i + 1, next_run.isoformat(), sleep_seconds)
-            if sleep_seconds > 0:
-                time.sleep(sleep_seconds)
-            cycle_id = f"cron-{i + 1}"
-            summaries.append(service.run_cycle(cycle_id=cycle_id))
+        jobs = [_cron_job(service, spec, index, args.cron_catch_up, emit) for index, spec in enumerate(args.cron, start=1)]
+        daemon = CronDaemon(jobs=jobs, max_workers=len(jobs), reporting=service.reporting)
+        logger.info("Cron mode enabled schedules=%s cycles=%s", args.cron, args.cycles)
+        daemon.run(max_runs=args.cycles)
     else:
-        summaries = service.run_forever(interval_seconds=0, max_cycles=args.cycles)
+        service.run_forever(interval_seconds=0, max_cycles=args.cycles, sink=emit)
 
     payload = {
-        "summaries": [summary.__dict__ for summary in summaries],
         "metrics": service.reporting.snapshot(),
         "datadog_series": service.reporting.to_datadog_series(),
         "grafana_labels": service.reporting.to_grafana_labels(),
+        "rolling": rolling.snapshot(),
     }
+    service.close()
+    if service.state_store is not None:
+        service.state_store.close()
+    if exporter is not None:
+        exporter.close(timeout=30)
     logger.debug("Execution payload=%s", payload)
-    print(json.dumps(payload, indent=2, sort_keys=True))
+    if args.stream:
+        print(json.dumps(payload, sort_keys=True), flush=True)
+    else:
+        payload["summaries"] = [summary.__dict__ for summary in summaries]
+        print(json.dumps(payload, indent=2, sort_keys=True))
     return 0
 
 
@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+import json
 import os
 from dataclasses import dataclass
+from typing import List
 
 from .models import AutonomyLevel
+from .policy import PolicyRule
 from .webhooks import WebhookConfig, WebhookSecrets
 
+_LEVELS = {
+    "L0": AutonomyLevel.L0_OBSERVE,
+    "L1": AutonomyLevel.L1_ASSIST,
+    "L2": AutonomyLevel.L2_BOUNDED_AUTO,
+    "L3": AutonomyLevel.L3_RESTRICTED,
+}
+
 
 @dataclass(frozen=True)
 class LiveConfig:
@@ -28,13 +38,7 @@ def _require_env(name: str) -> str:
 
 def load_live_config() -> LiveConfig:
     level_raw = os.getenv("OPENCLAW_AUTONOMY_LEVEL", "L1").strip().upper()
-    levels = {
-        "L0": AutonomyLevel.L0_OBSERVE,
-        "L1": AutonomyLevel.L1_ASSIST,
-        "L2": AutonomyLevel.L2_BOUNDED_AUTO,
-        "L3": AutonomyLevel.L3_RESTRICTED,
-    }
-    if level_raw not in levels:
+    if level_raw not in _LEVELS:
         raise ValueError("OPENCLAW_AUTONOMY_LEVEL must be one of: L0, L1, L2, L3")
 
     risk_raw = os.getenv("OPENCLAW_MAX_RISK_SCORE", "2.8").strip()
@@ -50,7 +54,7 @@ def load_live_config() -> LiveConfig:
         datadog_app_key=_require_env("DATADOG_APP_KEY"),
         grafana_base_url=_require_env("GRAFANA_BASE_URL"),
         grafana_api_token=_require_env("GRAFANA_API_TOKEN"),
-        autonomy_level=levels[level_raw],
+        autonomy_level=_LEVELS[level_raw],
         max_risk_score_for_auto=max_risk_score,
     )
 
@@ -66,3 +70,26 @@ def load_webhook_config(tenant_id: str) -> WebhookConfig:
             twitter_signature_secret=os.getenv("OPENCLAW_TWITTER_SIGNATURE_SECRET", "").strip(),
         ),
     )
+
+
+def load_policy_rules(path: str) -> List[PolicyRule]:
+    with open(path, "r", encoding="utf-8") as fh:
+        raw = json.load(fh)
+    if not isinstance(raw, list):
+        raise ValueError("policy file must contain a JSON list of tenant rules")
+
+    rules: List[PolicyRule] = []
+    for entry in raw:
+        level_raw = str(entry.get("autonomy_level", "L1")).strip().upper()
+        if level_raw not in _LEVELS:
+            raise ValueError(f"autonomy_level must be one of: L0, L1, L2, L3 (tenant {entry.get('tenant_id')})")
+        rules.append(
+            PolicyRule(
+                tenant_id=str(entry["tenant_id"]),
+                max_autonomy=_LEVELS[level_raw],
+                allowlisted_action_types=set(entry.get("allowlisted_action_types", [])),
+                blocked_commands=set(entry.get("blocked_commands", [])),
+                max_risk_score_for_auto=float(entry.get("max_risk_score_for_auto", 2.8)),
+            )
+        )
+    return rules
@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Dict, Iterable, List, Protocol
 
+from .batch import IncidentBatch
 from .models import Incident
 
 
@@ -47,18 +48,22 @@ class DatadogConnector:
 class GrafanaConnector:
     raw_alerts: List[Dict[str, str]] = field(default_factory=list)
     source_name: str = "grafana"
+    columnar: bool = False
 
     def fetch_incidents(self) -> Iterable[Incident]:
-        incidents: List[Incident] = []
-        for alert in self.raw_alerts:
-            incidents.append(
-                Incident(
-                    id=alert["id"],
-                    tenant_id=alert["tenant_id"],
-                    source=self.source_name,
-                    severity=alert.get("severity", "medium"),
-                    summary=alert.get("name", "grafana alert"),
-                    tags={"rule_uid": alert.get("rule_uid", "unknown")},
-                )
-            )
-        return incidents
+        if self.columnar:
+            batch = IncidentBatch()
+            for alert in self.raw_alerts:
+                batch.append(**self._fields(alert))
+            return batch
+        return [Incident(**self._fields(alert)) for alert in self.raw_alerts]
+
+    def _fields(self, alert: Dict[str, str]) -> Dict[str, object]:
+        return {
+            "id": alert["id"],
+            "tenant_id": alert["tenant_id"],
+            "source": self.source_name,
+            "severity": alert.get("severity", "medium"),
+            "summary": alert.get("name", "grafana alert"),
+            "tags": {"rule_uid": alert.get("rule_uid", "unknown")},
+        }
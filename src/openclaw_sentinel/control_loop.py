@@ -4,7 +4,8 @@ from dataclasses import dataclass, field
 from typing import Callable, Iterable, List, Tuple
 
 from .models import Action, Incident, LoopResult, RiskProfile
-from .policy import PolicyEngine
+from .policy import PolicyEvaluator
+from .state_store import SQLiteStateStore
 
 ActionPlanner = Callable[[Incident], Iterable[Tuple[Action, RiskProfile]]]
 ActionExecutor = Callable[[Action], str]
@@ -12,19 +13,27 @@ ActionExecutor = Callable[[Action], str]
 
 @dataclass
 class ControlLoop:
-    policy_engine: PolicyEngine
+    policy_engine: PolicyEvaluator
     planner: ActionPlanner
     executor: ActionExecutor
     execution_log: List[str] = field(default_factory=list)
+    max_log_entries: int | None = None
+    state_store: SQLiteStateStore | None = None
 
     def run_once(self, incident: Incident) -> LoopResult:
         decisions = []
+        if self.state_store is not None:
+            self.state_store.record_incident(incident)
         for action, risk in self.planner(incident):
             decision = self.policy_engine.evaluate(action, risk)
             decisions.append(decision)
+            if self.state_store is not None:
+                self.state_store.record_decision(decision)
             if decision.approved:
                 result = self.executor(action)
                 self.execution_log.append(f"{action.id}:{result}")
             else:
                 self.execution_log.append(f"{action.id}:blocked:{decision.reason}")
+        if self.max_log_entries is not None and len(self.execution_log) > self.max_log_entries:
+            del self.execution_log[: len(self.execution_log) - self.max_log_entries]
         return LoopResult(incident=incident, decisions=decisions)
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, List, Tuple
+
+from .reporting import ReportingStore
+from .scheduler import CronParseError, CronSchedule
+
+logger = logging.getLogger("openclaw_sentinel.cron_daemon")
+
+CATCH_UP_POLICIES = ("skip", "run_once")
+# Bound on how many missed fire times are walked after a long stall (e.g. host suspend).
+MAX_MISSED_SCAN = 10_000
+
+JobFn = Callable[[str], Any]
+
+
+@dataclass(eq=False)
+class CronJob:
+    """One schedule and what to run on it; ``run`` receives a run id like ``<name>-<n>``.
+
+    ``catch_up`` decides what happens to fires that were missed by more than
+    ``misfire_grace_seconds``: ``skip`` drops them, ``run_once`` runs a single
+    catch-up for all of them. A fire that arrives while the previous run is still going
+    is never started concurrently; ``run_once`` defers one run until it finishes.
+    """
+
+    name: str
+    schedule: CronSchedule
+    run: JobFn
+    catch_up: str = "skip"
+    misfire_grace_seconds: float = 1.0
+    runs: int = 0
+    skipped: int = 0
+    overlaps: int = 0
+    failures: int = 0
+    _running: bool = field(default=False, repr=False)
+    _pending: bool = field(default=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.catch_up not in CATCH_UP_POLICIES:
+            raise ValueError(f"catch_up must be one of: {', '.join(CATCH_UP_POLICIES)}")
+
+
+@dataclass
+class CronDaemon:
+    """Runs many cron jobs off one timer heap keyed on the monotonic clock.
+
+    Fire times come from each schedule's ``next_after`` the previous *scheduled* time,
+    so slow runs never push later fires back. Only the thread in ``run`` sleeps; jobs
+    execute on a small worker pool. Wall-clock steps are handled when an entry comes
+    due: if the wall clock moved backwards the entry is re-armed, if it jumped forward
+    the skipped fire times go through the job's catch-up policy.
+    """
+
+    jobs: List[CronJob] = field(default_factory=list)
+    max_workers: int = 4
+    reporting: ReportingStore | None = None
+    wall_clock: Callable[[], datetime] = datetime.now
+    monotonic: Callable[[], float] = time.monotonic
+    started_runs: int = 0
+    _heap: List[Tuple[float, int, CronJob, datetime]] = field(default_factory=list, repr=False)
+    _seq: Any = field(default_factory=itertools.count, repr=False)
+    _cond: threading.Condition = field(default_factory=threading.Condition, repr=False)
+    _pool: ThreadPoolExecutor | None = field(default=None, repr=False)
+    _max_runs: int | None = field(default=None, repr=False)
+    _stopping: bool = field(default=False, repr=False)
+    _active: int = field(default=0, repr=False)
+
+    def __post_init__(self) -> None:
+        jobs, self.jobs = list(self.jobs), []
+        for job in jobs:
+            self.add(job)
+
+    def add(self, job: CronJob) -> None:
+        with self._cond:
+            self.jobs.append(job)
+            self._arm(job, self.wall_clock())
+            self._cond.notify_all()
+
+    def tick(self) -> float | None:
+        """Fire everything due now; return seconds until the next entry (None if empty)."""
+        while True:
+            with self._cond:
+                if not self._heap:
+                    return None
+                wait = self._heap[0][0] - self.monotonic()
+                if wait > 0 or self._stopping or self._budget_spent():
+                    return max(0.0, wait)
+                _deadline, _seq, job, scheduled = heapq.heappop(self._heap)
+            self._fire(job, scheduled)
+
+    def run(self, max_runs: int | None = None) -> None:
+        """Sleep/fire loop in the calling thread until ``stop``, ``max_runs`` starts or
+        no job has a fire time left."""
+        with self._cond:
+            self._max_runs = max_runs
+            self._stopping = False
+        try:
+            while True:
+                wait = self.tick()
+                with self._cond:
+                    if wait is None or self._stopping or self._budget_spent():
+                        break
+                    self._cond.wait(wait)
+        finally:
+            self.wait_idle()
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._pool = None
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        with self._cond:
+            return self._cond.wait_for(lambda: self._active == 0, timeout=timeout)
+
+    def _budget_spent(self) -> bool:
+        return self._max_runs is not None and self.started_runs >= self._max_runs
+
+    def _arm(self, job: CronJob, after: datetime) -> None:
+        try:
+            fire_at = job.schedule.next_after(after)
+        except CronParseError as exc:
+            logger.error("Cron job has no future fire time job=%s error=%s", job.name, exc)
+            return
+        self._push(job, fire_at)
+
+    def _push(self, job: CronJob, fire_at: datetime) -> None:
+        delay = max(0.0, (fire_at - self.wall_clock()).total_seconds())
+        heapq.heappush(self._heap, (self.monotonic() + delay, next(self._seq), job, fire_at))
+
+    def _fire(self, job: CronJob, scheduled: datetime) -> None:
+        now = self.wall_clock()
+        with self._cond:
+            if now < scheduled:
+                # The wall clock was stepped back (or the monotonic clock ran fast).
+                self._push(job, scheduled)
+                return
+            latest, due = scheduled, 1
+            upcoming = job.schedule.next_after(latest)
+            while upcoming <= now and due < MAX_MISSED_SCAN:
+                latest, due = upcoming, due + 1
+                upcoming = job.schedule.next_after(latest)
+            if upcoming <= now:
+                upcoming = job.schedule.next_after(now)
+            on_time = (now - latest).total_seconds() <= job.misfire_grace_seconds
+            run = on_time or job.catch_up == "run_once"
+            missed = due - 1 if run else due
+            if missed:
+                job.skipped += missed
+                self._count("cron_fires_skipped", job, missed)
+                logger.warning("Cron job missed fires job=%s missed=%s catch_up=%s", job.name, missed, job.catch_up)
+            if run:
+                self._start(job)
+            self._push(job, upcoming)
+
+    def _start(self, job: CronJob) -> None:
+        # Caller holds self._cond.
+        if self._budget_spent() or self._stopping:
+            return
+        if job._running:
+            job.overlaps += 1
+            self._count("cron_overlaps", job)
+            if job.catch_up == "run_once":
+                job._pending = True
+            logger.warning("Cron job still running, fire not started job=%s", job.name)
+            return
+        job._running = True
+        job.runs += 1
+        self.started_runs += 1
+        self._active += 1
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="sentinel-cron")
+        self._pool.submit(self._execute, job, f"{job.name}-{job.runs}")
+
+    def _execute(self, job: CronJob, run_id: str) -> None:
+        started = time.perf_counter()
+        try:
+            job.run(run_id)
+        except Exception:
+            job.failures += 1
+            self._count("cron_failures", job)
+            logger.exception("Cron job failed job=%s run=%s", job.name, run_id)
+        finally:
+            if self.reporting is not None:
+                self.reporting.record_latency(f"cron_job_{job.name}", time.perf_counter() - started)
+            with self._cond:
+                job._running = False
+                self._active -= 1
+                if job._pending:
+                    job._pending = False
+                    self._start(job)
+                self._cond.notify_all()
+
+    def _count(self, key: str, job: CronJob, amount: int = 1) -> None:
+        if self.reporting is not None:
+            self.reporting.increment_labeled(key, (job.name,), amount)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Mapping
+
+from .models import Incident
+
+
+def incident_fingerprint(source: str, tenant_id: str, incident_id: str, tags: Mapping[str, str]) -> str:
+    digest = hashlib.sha1()
+    for part in (source, tenant_id, incident_id):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    for key in sorted(tags):
+        digest.update(f"{key}={tags[key]}".encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+@dataclass
+class IncidentDeduplicator:
+    """Bounded LRU of incident fingerprints with a suppression TTL.
+
+    The TTL runs from the first sighting and is not refreshed by repeats, so an alert
+    that keeps firing is processed again once per ``ttl_seconds``.
+    """
+
+    ttl_seconds: float = 900.0
+    max_entries: int = 10_000
+    clock: Callable[[], float] = time.monotonic
+    hits: int = 0
+    misses: int = 0
+    _entries: "OrderedDict[str, float]" = field(default_factory=OrderedDict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def seen(self, incident: Incident) -> bool:
+        """Return True if the incident is a repeat; otherwise remember it and return False."""
+        return self.seen_fingerprint(
+            incident_fingerprint(incident.source, incident.tenant_id, incident.id, incident.tags)
+        )
+
+    def seen_fingerprint(self, key: str) -> bool:
+        now = self.clock()
+        with self._lock:
+            expires_at = self._entries.get(key)
+            if expires_at is not None and expires_at > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True
+            self._entries[key] = now + self.ttl_seconds
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self.misses += 1
+            return False
+
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return 0.0 if total == 0 else self.hits / total
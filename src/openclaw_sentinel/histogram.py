@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import bisect
+import math
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence
+
+# 16 buckets per doubling keeps any reported quantile within ~2.2% of the true value.
+BUCKETS_PER_DOUBLING = 16
+MIN_SECONDS = 1e-6
+# 1µs .. ~1.2 days; anything outside is clamped to the first/last bucket.
+MAX_BUCKETS = BUCKETS_PER_DOUBLING * 37
+
+_LOG_BASE = math.log(2) / BUCKETS_PER_DOUBLING
+
+
+def _bucket(seconds: float) -> int:
+    if seconds <= MIN_SECONDS:
+        return 0
+    return min(MAX_BUCKETS - 1, int(math.log(seconds / MIN_SECONDS) / _LOG_BASE))
+
+
+def _bucket_midpoint(index: int) -> float:
+    return MIN_SECONDS * math.exp((index + 0.5) * _LOG_BASE)
+
+
+def _bucket_upper(index: int) -> float:
+    return MIN_SECONDS * math.exp((index + 1) * _LOG_BASE)
+
+
+@dataclass
+class LatencyHistogram:
+    """Log-bucketed latency histogram with a fixed upper bound on memory.
+
+    Buckets are stored sparsely, so a histogram costs only as many entries as distinct
+    latency ranges observed (at most ``MAX_BUCKETS``). Histograms merge by adding bucket
+    counts, which is how per-thread shards are combined into one view.
+    """
+
+    buckets: Dict[int, int] = field(default_factory=dict)
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        index = _bucket(seconds)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.total_seconds += seconds
+        if seconds > self.max_seconds:
+            self.max_seconds = seconds
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for index, count in dict(other.buckets).items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.total_seconds += other.total_seconds
+        self.max_seconds = max(self.max_seconds, other.max_seconds)
+
+    def copy(self) -> "LatencyHistogram":
+        return LatencyHistogram(dict(self.buckets), self.total_seconds, self.max_seconds)
+
+    @property
+    def count(self) -> int:
+        return sum(self.buckets.values())
+
+    def cumulative_counts(self, bounds: Sequence[float]) -> List[int]:
+        """Samples at or below each of the ascending ``bounds`` (seconds), Prometheus-style.
+
+        A log bucket counts towards the first bound at or above its upper edge, so counts
+        are exact to within one bucket width.
+        """
+        counts = [0] * len(bounds)
+        for index, count in dict(self.buckets).items():
+            position = bisect.bisect_left(bounds, _bucket_upper(index))
+            if position < len(bounds):
+                counts[position] += count
+        running = 0
+        for position, count in enumerate(counts):
+            running += count
+            counts[position] = running
+        return counts
+
+    def quantile(self, q: float) -> float:
+        """Approximate ``q`` quantile in seconds (0.0 when empty), capped at the observed max."""
+        total = self.count
+        if total == 0:
+            return 0.0
+        if q >= 1.0:
+            return self.max_seconds
+        rank = max(1, math.ceil(q * total))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(_bucket_midpoint(index), self.max_seconds)
+        return self.max_seconds
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "p50_ms": round(self.quantile(0.50) * 1000, 3),
+            "p95_ms": round(self.quantile(0.95) * 1000, 3),
+            "p99_ms": round(self.quantile(0.99) * 1000, 3),
+            "max_ms": round(self.max_seconds * 1000, 3),
+        }
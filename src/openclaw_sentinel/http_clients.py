@@ -1,11 +1,32 @@
 from __future__ import annotations
 
 import json
+import logging
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, Iterator, List, Tuple
 from urllib import parse, request
 
+from .json_stream import DEFAULT_CHUNK_SIZE, iter_chunks, iter_json_array
+
 Opener = Callable[[request.Request], Any]
+logger = logging.getLogger("openclaw_sentinel.http_clients")
+
+
+def _page_params(
+    query: str, since_ms: int | None, until_ms: int | None, limit: int, cursor: str | None
+) -> Dict[str, str]:
+    params = {"filter[query]": query, "page[limit]": str(limit), "sort": "timestamp"}
+    if since_ms is not None:
+        params["filter[from]"] = str(since_ms)
+    if until_ms is not None:
+        params["filter[to]"] = str(until_ms)
+    if cursor:
+        params["page[cursor]"] = cursor
+    return params
+
+
+def _next_cursor(payload: Dict[str, Any]) -> str | None:
+    return payload.get("meta", {}).get("page", {}).get("after") or None
 
 
 @dataclass
@@ -15,11 +36,60 @@ class DatadogAPIClient:
     app_key: str
     opener: Opener = request.urlopen
     timeout_seconds: int = 10
+    stream_chunk_size: int = DEFAULT_CHUNK_SIZE
 
     def fetch_events(self, query: str = "status:error", limit: int = 50) -> List[Dict[str, Any]]:
-        params = parse.urlencode({"filter[query]": query, "page[limit]": str(limit)})
-        url = f"{self.base_url.rstrip('/')}/api/v2/events?{params}"
-        req = request.Request(
+        payload = self._get_events({"filter[query]": query, "page[limit]": str(limit)})
+        return payload.get("data", [])
+
+    def stream_events(self, query: str = "status:error", limit: int = 50) -> Iterator[Dict[str, Any]]:
+        """Like ``fetch_events`` but yields each event as it is parsed off the response."""
+        yield from self._stream_events({"filter[query]": query, "page[limit]": str(limit)}, {})
+
+    def fetch_events_page(
+        self,
+        query: str = "status:error",
+        since_ms: int | None = None,
+        until_ms: int | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> Tuple[List[Dict[str, Any]], str | None]:
+        payload = self._get_events(_page_params(query, since_ms, until_ms, limit, cursor))
+        return payload.get("data", []), _next_cursor(payload)
+
+    def iter_events(
+        self,
+        query: str = "status:error",
+        since_ms: int | None = None,
+        until_ms: int | None = None,
+        limit: int = 50,
+        max_pages: int = 100,
+        stream: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield events across pages. With ``stream`` each page is parsed incrementally and
+        the next cursor is read from ``meta`` once that page's events are exhausted."""
+        cursor: str | None = None
+        for _ in range(max_pages):
+            if stream:
+                extras: Dict[str, Any] = {}
+                count = 0
+                for event in self._stream_events(_page_params(query, since_ms, until_ms, limit, cursor), extras):
+                    count += 1
+                    yield event
+                cursor = _next_cursor(extras)
+            else:
+                events, cursor = self.fetch_events_page(
+                    query, since_ms=since_ms, until_ms=until_ms, limit=limit, cursor=cursor
+                )
+                count = len(events)
+                yield from events
+            if not count or cursor is None:
+                return
+        logger.warning("Datadog pagination stopped at max_pages=%s query=%s", max_pages, query)
+
+    def _events_request(self, params: Dict[str, str]) -> request.Request:
+        url = f"{self.base_url.rstrip('/')}/api/v2/events?{parse.urlencode(params)}"
+        return request.Request(
             url,
             headers={
                 "Accept": "application/json",
@@ -27,9 +97,14 @@ class DatadogAPIClient:
                 "DD-APPLICATION-KEY": self.app_key,
             },
         )
-        with self.opener(req, timeout=self.timeout_seconds) as resp:
-            payload = json.loads(resp.read().decode("utf-8"))
-        return payload.get("data", [])
+
+    def _get_events(self, params: Dict[str, str]) -> Dict[str, Any]:
+        with self.opener(self._events_request(params), timeout=self.timeout_seconds) as resp:
+            return json.loads(resp.read().decode("utf-8"))
+
+    def _stream_events(self, params: Dict[str, str], extras: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        with self.opener(self._events_request(params), timeout=self.timeout_seconds) as resp:
+            yield from iter_json_array(iter_chunks(resp, self.stream_chunk_size), key="data", extras=extras)
 
 
 @dataclass
@@ -39,18 +114,25 @@ class GrafanaAPIClient:
     alert_path: str = "/api/alertmanager/grafana/api/v2/alerts"
     opener: Opener = request.urlopen
     timeout_seconds: int = 10
+    stream_chunk_size: int = DEFAULT_CHUNK_SIZE
 
     def fetch_alerts(self) -> List[Dict[str, Any]]:
-        url = f"{self.base_url.rstrip('/')}{self.alert_path}"
-        req = request.Request(
-            url,
+        with self.opener(self._alerts_request(), timeout=self.timeout_seconds) as resp:
+            payload = json.loads(resp.read().decode("utf-8"))
+        if isinstance(payload, list):
+            return payload
+        return payload.get("alerts", [])
+
+    def iter_alerts(self) -> Iterator[Dict[str, Any]]:
+        """Like ``fetch_alerts`` but yields each alert as it is parsed off the response."""
+        with self.opener(self._alerts_request(), timeout=self.timeout_seconds) as resp:
+            yield from iter_json_array(iter_chunks(resp, self.stream_chunk_size), key="alerts")
+
+    def _alerts_request(self) -> request.Request:
+        return request.Request(
+            f"{self.base_url.rstrip('/')}{self.alert_path}",
             headers={
                 "Accept": "application/json",
                 "Authorization": f"Bearer {self.api_token}",
             },
         )
-        with self.opener(req, timeout=self.timeout_seconds) as resp:
-            payload = json.loads(resp.read().decode("utf-8"))
-        if isinstance(payload, list):
-            return payload
-        return payload.get("alerts", [])
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import http.client
+import io
+import logging
+import ssl
+import threading
+import time
+import zlib
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Tuple
+from urllib import error, parse, request
+
+from .reporting import ReportingStore
+
+logger = logging.getLogger("openclaw_sentinel.http_pool")
+
+HostKey = Tuple[str, str, int]
+
+# A reused keep-alive socket may have been closed by the server while idle; these
+# surface before any response bytes are read, so the request is retried once.
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+
+
+class PoolTimeout(OSError):
+    pass
+
+
+class _HostPool:
+    def __init__(self, max_connections: int) -> None:
+        self.slots = threading.BoundedSemaphore(max_connections)
+        self.idle: Deque[Tuple[http.client.HTTPConnection, float]] = deque()
+        self.lock = threading.Lock()
+        self.closed = False
+
+
+class PooledResponse:
+    """File-like response that hands its connection back to the pool once fully read."""
+
+    def __init__(self, transport: PooledTransport, pool: _HostPool, conn: http.client.HTTPConnection, resp: http.client.HTTPResponse) -> None:
+        self._transport = transport
+        self._pool = pool
+        self._conn = conn
+        self._resp = resp
+        self._released = False
+        self.status = resp.status
+        self.reason = resp.reason
+        self.headers = resp.headers
+        encoding = (resp.getheader("Content-Encoding") or "").lower()
+        self._inflater = zlib.decompressobj(16 + zlib.MAX_WBITS) if encoding == "gzip" else None
+
+    def getcode(self) -> int:
+        return self.status
+
+    def read(self, amt: int | None = None) -> bytes:
+        if self._inflater is None:
+            data = self._resp.read() if amt is None else self._resp.read(amt)
+        elif amt is None:
+            data = self._inflater.decompress(self._resp.read()) + self._inflater.flush()
+        else:
+            data = b""
+            while not data:
+                raw = self._resp.read(amt)
+                if not raw:
+                    data = self._inflater.flush()
+                    break
+                data = self._inflater.decompress(raw)
+        if self._resp.isclosed():
+            self.close()
+        return data
+
+    def close(self) -> None:
+        if self._released:
+            return
+        self._released = True
+        reusable = self._resp.isclosed() and not self._resp.will_close
+        if not reusable:
+            self._resp.close()
+        self._transport._release(self._pool, self._conn, reusable=reusable)
+
+    def __enter__(self) -> PooledResponse:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.close()
+        return False
+
+
+@dataclass
+class PooledTransport:
+    """Keep-alive HTTP(S) transport usable as the ``opener`` of the API clients.
+
+    Connections are pooled per (scheme, host, port). At most ``max_connections_per_host``
+    are open to a host at once; callers wait up to the request timeout for a free slot.
+    Idle connections older than ``idle_timeout_seconds`` are closed instead of reused.
+    Redirects are followed like ``urlopen`` does, up to ``max_redirects``. Requests to
+    hosts that ``proxies`` (by default HTTP(S)_PROXY/NO_PROXY from the environment) send
+    through a proxy are handed to a plain urllib opener instead of the pool.
+    """
+
+    max_connections_per_host: int = 4
+    idle_timeout_seconds: float = 30.0
+    reporting: ReportingStore | None = None
+    ssl_context: ssl.SSLContext | None = None
+    max_redirects: int = 10
+    proxies: Dict[str, str] | None = None
+    handshakes: int = 0
+    reuses: int = 0
+    _pools: Dict[HostKey, _HostPool] = field(default_factory=dict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _proxy_opener: request.OpenerDirector | None = field(default=None, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.proxies is None:
+            self.proxies = request.getproxies()
+
+    def __call__(self, req: request.Request, timeout: float = 10) -> Any:
+        for _ in range(self.max_redirects + 1):
+            if self._proxied(req):
+                return self._open_via_proxy(req, timeout)
+            response = self._open(req, timeout)
+            location = response.headers.get("Location")
+            if response.status not in _REDIRECT_STATUSES or not location:
+                break
+            body = response.read()
+            response.close()
+            redirected = parse.urljoin(req.full_url, location)
+            # Same method/body rewriting rules as urlopen; raises HTTPError where it would.
+            req = request.HTTPRedirectHandler().redirect_request(
+                req, io.BytesIO(body), response.status, response.reason, response.headers, redirected
+            )
+        else:
+            raise error.HTTPError(
+                req.full_url, response.status, "too many redirects", response.headers, io.BytesIO(b"")
+            )
+        if response.status >= 400:
+            body = response.read()
+            response.close()
+            raise error.HTTPError(req.full_url, response.status, response.reason, response.headers, io.BytesIO(body))
+        return response
+
+    def _proxied(self, req: request.Request) -> bool:
+        scheme = parse.urlsplit(req.full_url).scheme.lower()
+        if scheme not in self.proxies:
+            return False
+        return not request.proxy_bypass_environment(req.host, self.proxies)
+
+    def _open_via_proxy(self, req: request.Request, timeout: float) -> Any:
+        with self._lock:
+            if self._proxy_opener is None:
+                self._proxy_opener = request.build_opener(request.ProxyHandler(self.proxies))
+            opener = self._proxy_opener
+        return opener.open(req, timeout=timeout)
+
+    def _open(self, req: request.Request, timeout: float) -> PooledResponse:
+        parsed = parse.urlsplit(req.full_url)
+        scheme = parsed.scheme.lower()
+        if scheme not in {"http", "https"}:
+            raise ValueError(f"unsupported scheme: {scheme}")
+        port = parsed.port or (443 if scheme == "https" else 80)
+        key: HostKey = (scheme, parsed.hostname or "", port)
+        headers = dict(req.header_items())
+        headers.setdefault("Accept-Encoding", "gzip")
+        headers.setdefault("Connection", "keep-alive")
+
+        pool = self._pool(key)
+        if not pool.slots.acquire(timeout=timeout):
+            raise PoolTimeout(f"no free connection to {key[1]}:{key[2]} within {timeout}s")
+        conn, reused = self._checkout(key, pool, timeout)
+        try:
+            try:
+                resp = self._send(conn, req, headers)
+            except _STALE_CONNECTION_ERRORS:
+                if not reused:
+                    raise
+                conn.close()
+                conn, reused = self._connect(key, timeout), False
+                resp = self._send(conn, req, headers)
+        except BaseException:
+            conn.close()
+            pool.slots.release()
+            raise
+
+        return PooledResponse(self, pool, conn, resp)
+
+    def close(self) -> None:
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            with pool.lock:
+                pool.closed = True
+                while pool.idle:
+                    pool.idle.popleft()[0].close()
+
+    def _pool(self, key: HostKey) -> _HostPool:
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = _HostPool(self.max_connections_per_host)
+                self._pools[key] = pool
+            return pool
+
+    def _checkout(self, key: HostKey, pool: _HostPool, timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        now = time.monotonic()
+        with pool.lock:
+            while pool.idle:
+                conn, last_used = pool.idle.pop()
+                if now - last_used <= self.idle_timeout_seconds:
+                    conn.timeout = timeout
+                    if conn.sock is not None:
+                        conn.sock.settimeout(timeout)
+                    self._count("reuses")
+                    return conn, True
+                conn.close()
+        return self._connect(key, timeout), False
+
+    def _connect(self, key: HostKey, timeout: float) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        self._count("handshakes")
+        logger.debug("Opening pooled connection scheme=%s host=%s port=%s", scheme, host, port)
+        if scheme == "https":
+            if self.ssl_context is None:
+                self.ssl_context = ssl.create_default_context()
+            return http.client.HTTPSConnection(host, port, timeout=timeout, context=self.ssl_context)
+        return http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def _send(self, conn: http.client.HTTPConnection, req: request.Request, headers: Dict[str, str]) -> http.client.HTTPResponse:
+        conn.request(req.get_method(), req.selector, body=req.data, headers=headers)
+        return conn.getresponse()
+
+    def _release(self, pool: _HostPool, conn: http.client.HTTPConnection, reusable: bool) -> None:
+        with pool.lock:
+            if reusable and not pool.closed:
+                pool.idle.append((conn, time.monotonic()))
+            else:
+                conn.close()
+        pool.slots.release()
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+        if self.reporting is not None:
+            self.reporting.increment(f"http_pool_{name}")
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Set, Tuple
+
+Response = Tuple[int, Dict[str, Any]]
+
+IN_PROGRESS: Response = (409, {"error": "duplicate_in_progress"})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS idempotency (
+    key TEXT PRIMARY KEY,
+    expires_at REAL NOT NULL,
+    status INTEGER NOT NULL,
+    body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idempotency_expiry ON idempotency (expires_at);
+"""
+
+
+@dataclass
+class SQLiteIdempotencyStore:
+    """Persistent response cache so retries are still recognised after a restart."""
+
+    path: str
+    purge_every: int = 256
+    _conn: sqlite3.Connection = field(init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _writes: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def get(self, key: str, now: float) -> Tuple[float, Response] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT expires_at, status, body FROM idempotency WHERE key = ? AND expires_at > ?", (key, now)
+            ).fetchone()
+        if row is None:
+            return None
+        expires_at, status, body = row
+        return expires_at, (status, json.loads(body))
+
+    def put(self, key: str, expires_at: float, response: Response) -> None:
+        status, body = response
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO idempotency (key, expires_at, status, body) VALUES (?, ?, ?, ?)",
+                    (key, expires_at, status, json.dumps(body, sort_keys=True)),
+                )
+                self._writes += 1
+                if self._writes % self.purge_every == 0:
+                    self._conn.execute("DELETE FROM idempotency WHERE expires_at <= ?", (time.time(),))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+@dataclass
+class IdempotencyCache:
+    """Remembers the response to each provider delivery id for ``ttl_seconds``.
+
+    ``begin`` claims a key before the delivery is processed: a repeat of a finished
+    delivery gets its cached response, a repeat that arrives while the first is still
+    being processed gets IN_PROGRESS, and only the first caller gets None and goes on to
+    process it. ``complete`` caches the response; 5xx responses are not cached so the
+    provider's retry is processed again. Entries live in a bounded LRU and, with a
+    ``store``, in SQLite as well. The TTL uses the wall clock so persisted entries expire
+    correctly across restarts.
+    """
+
+    ttl_seconds: float = 86400.0
+    max_entries: int = 10_000
+    store: SQLiteIdempotencyStore | None = None
+    clock: Callable[[], float] = time.time
+    hits: int = 0
+    misses: int = 0
+    _entries: "OrderedDict[str, Tuple[float, Response]]" = field(default_factory=OrderedDict, repr=False)
+    _in_flight: Set[str] = field(default_factory=set, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def begin(self, key: str) -> Response | None:
+        now = self.clock()
+        with self._lock:
+            cached = self._cached(key, now)
+            if cached is None and key in self._in_flight:
+                cached = IN_PROGRESS
+            if cached is not None:
+                self.hits += 1
+                return cached
+            self._in_flight.add(key)
+            self.misses += 1
+        if self.store is not None:
+            stored = self.store.get(key, now)
+            if stored is not None:
+                with self._lock:
+                    self._in_flight.discard(key)
+                    self._remember(key, stored)
+                    self.misses -= 1
+                    self.hits += 1
+                return stored[1]
+        return None
+
+    def complete(self, key: str, response: Response) -> None:
+        if response[0] >= 500:
+            self.release(key)
+            return
+        expires_at = self.clock() + self.ttl_seconds
+        if self.store is not None:
+            self.store.put(key, expires_at, response)
+        with self._lock:
+            self._in_flight.discard(key)
+            self._remember(key, (expires_at, response))
+
+    def release(self, key: str) -> None:
+        with self._lock:
+            self._in_flight.discard(key)
+
+    def _cached(self, key: str, now: float) -> Response | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= now:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def _remember(self, key: str, entry: Tuple[float, Response]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
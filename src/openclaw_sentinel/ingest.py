@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+from .models import Incident
+from .service import SentinelService
+
+logger = logging.getLogger("openclaw_sentinel.ingest")
+
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ingest_queue (
+    ticket_id TEXT PRIMARY KEY,
+    cycle_id TEXT NOT NULL,
+    incident TEXT NOT NULL,
+    state TEXT NOT NULL,
+    enqueued_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    result TEXT
+);
+CREATE INDEX IF NOT EXISTS ingest_queue_state ON ingest_queue (state, enqueued_at);
+"""
+
+_STOP = object()
+
+
+class IngestQueueFull(Exception):
+    pass
+
+
+def _incident_to_json(incident: Incident) -> str:
+    return json.dumps(
+        {
+            "id": incident.id,
+            "tenant_id": incident.tenant_id,
+            "source": incident.source,
+            "severity": incident.severity,
+            "summary": incident.summary,
+            "tags": dict(incident.tags),
+        },
+        sort_keys=True,
+    )
+
+
+@dataclass
+class IncidentIngestQueue:
+    """Accepts webhook incidents immediately and runs them on a fixed pool of workers.
+
+    ``submit`` returns a ticket id without touching the planner, policy or executor; the
+    workers call ``service.run_incident`` and each ticket moves queued -> running ->
+    done/failed. At most ``max_queue`` incidents wait at once, beyond that ``submit``
+    raises IngestQueueFull so the caller can answer 503 and the provider retries.
+
+    With ``path`` set, tickets are also written to SQLite (WAL) before ``submit`` returns
+    and unfinished ones are re-queued on startup, so an accepted delivery survives a
+    restart (and may run twice if the process died mid-run). Without it, only the last
+    ``max_statuses`` ticket states are kept in memory.
+    """
+
+    service: SentinelService
+    workers: int = 2
+    max_queue: int = 1000
+    path: str | None = None
+    max_statuses: int = 10_000
+    retention_seconds: float = 86400.0
+    _queue: "queue.Queue[Any]" = field(init=False, repr=False)
+    _statuses: "OrderedDict[str, Dict[str, Any]]" = field(default_factory=OrderedDict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _db: sqlite3.Connection | None = field(default=None, init=False, repr=False)
+    _threads: List[threading.Thread] = field(default_factory=list, init=False, repr=False)
+    _completed: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.workers < 1 or self.max_queue < 1:
+            raise ValueError("workers and max_queue must be >= 1")
+        self._queue = queue.Queue(maxsize=self.max_queue)
+        recovered: List[Tuple[str, str, Incident]] = []
+        if self.path is not None:
+            self._db = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.executescript(_SCHEMA)
+            self._purge()
+            rows = self._db.execute(
+                "SELECT ticket_id, cycle_id, incident FROM ingest_queue WHERE state IN (?, ?) ORDER BY enqueued_at",
+                (QUEUED, RUNNING),
+            ).fetchall()
+            recovered = [(ticket_id, cycle_id, Incident(**json.loads(raw))) for ticket_id, cycle_id, raw in rows]
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"sentinel-ingest-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        if recovered:
+            logger.info("Re-queueing unfinished webhook incidents count=%s path=%s", len(recovered), self.path)
+        for ticket_id, cycle_id, incident in recovered:
+            self._set_status(ticket_id, incident, QUEUED)
+            # Blocks while the queue is full; the workers are already draining it.
+            self._queue.put((ticket_id, cycle_id, incident))
+
+    def submit(self, incident: Incident, cycle_id: str) -> str:
+        """Queue ``incident`` and return its ticket id; raises IngestQueueFull when saturated."""
+        ticket_id = uuid.uuid4().hex
+        with self._lock:
+            if self._queue.full():
+                self.service.reporting.increment("ingest_rejected_full")
+                raise IngestQueueFull(f"ingest queue is full ({self.max_queue})")
+            if self._db is not None:
+                now = time.time()
+                with self._db:
+                    self._db.execute(
+                        "INSERT INTO ingest_queue (ticket_id, cycle_id, incident, state, enqueued_at, updated_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (ticket_id, cycle_id, _incident_to_json(incident), QUEUED, now, now),
+                    )
+            self._remember(ticket_id, {"ticket_id": ticket_id, "incident_id": incident.id, "state": QUEUED})
+            # Only submit() adds under the lock, so the fullness check above still holds.
+            self._queue.put_nowait((ticket_id, cycle_id, incident))
+        self.service.reporting.increment("ingest_enqueued")
+        return ticket_id
+
+    def status(self, ticket_id: str) -> Dict[str, Any] | None:
+        with self._lock:
+            status = self._statuses.get(ticket_id)
+            if status is not None:
+                return dict(status)
+            if self._db is None:
+                return None
+            row = self._db.execute(
+                "SELECT incident, state, result FROM ingest_queue WHERE ticket_id = ?", (ticket_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        raw, state, result = row
+        status = {"ticket_id": ticket_id, "incident_id": json.loads(raw)["id"], "state": state}
+        if result is not None:
+            status.update(json.loads(result))
+        return status
+
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    def close(self) -> None:
+        """Let the workers finish what is queued, then stop them."""
+        for _ in self._threads:
+            self._queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def _worker(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            ticket_id, cycle_id, incident = item
+            self._set_status(ticket_id, incident, RUNNING)
+            try:
+                summary = self.service.run_incident(cycle_id=cycle_id, incident=incident)
+            except Exception as exc:
+                logger.exception("Webhook incident failed ticket=%s incident=%s", ticket_id, incident.id)
+                self.service.reporting.increment("ingest_failed")
+                self._set_status(ticket_id, incident, FAILED, {"error": type(exc).__name__})
+                continue
+            self.service.reporting.increment("ingest_processed")
+            self._set_status(ticket_id, incident, DONE, {"summary": summary.__dict__})
+
+    def _set_status(self, ticket_id: str, incident: Incident, state: str, result: Dict[str, Any] | None = None) -> None:
+        status = {"ticket_id": ticket_id, "incident_id": incident.id, "state": state}
+        if result:
+            status.update(result)
+        with self._lock:
+            self._remember(ticket_id, status)
+            if self._db is None:
+                return
+            with self._db:
+                self._db.execute(
+                    "UPDATE ingest_queue SET state = ?, updated_at = ?, result = ? WHERE ticket_id = ?",
+                    (state, time.time(), json.dumps(result) if result else None, ticket_id),
+                )
+            if state in (DONE, FAILED):
+                self._completed += 1
+                if self._completed % 256 == 0:
+                    self._purge()
+
+    def _remember(self, ticket_id: str, status: Dict[str, Any]) -> None:
+        # Caller holds self._lock.
+        self._statuses[ticket_id] = status
+        self._statuses.move_to_end(ticket_id)
+        while len(self._statuses) > self.max_statuses:
+            self._statuses.popitem(last=False)
+
+    def _purge(self) -> None:
+        cutoff = time.time() - self.retention_seconds
+        with self._db:
+            self._db.execute(
+                "DELETE FROM ingest_queue WHERE state IN (?, ?) AND updated_at < ?", (DONE, FAILED, cutoff)
+            )
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import Any, BinaryIO, Dict, Iterable, Iterator
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+_DECODER = json.JSONDecoder()
+# Text that could still extend a number ("12" + "34", "1" + ".5", "2e" + "-3").
+_NUMBER_TAIL = re.compile(r"[0-9.eE+-]*\Z")
+
+
+def iter_chunks(resp: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    while True:
+        chunk = resp.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+class _Buffer:
+    """Decoded text window over a byte-chunk stream; consumed text is dropped on refill."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Append the next chunk of text; return False once the input is exhausted."""
+        if self.eof:
+            return False
+        for chunk in self._chunks:
+            text = self._utf8.decode(chunk)
+            if text:
+                self.text = self.text[self.pos :] + text
+                self.pos = 0
+                return True
+        self.text = self.text[self.pos :] + self._utf8.decode(b"", final=True)
+        self.pos = 0
+        self.eof = True
+        return False
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, or "" at end of input."""
+        while True:
+            text, pos = self.text, self.pos
+            while pos < len(text) and text[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < len(text):
+                return text[pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        ch = self.peek()
+        if not ch or ch not in chars:
+            found = repr(ch) if ch else "end of input"
+            raise json.JSONDecodeError(f"Expected one of {chars!r}, found {found}", self.text, self.pos)
+        self.pos += 1
+        return ch
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                obj, end = _DECODER.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            if (
+                not self.eof
+                and isinstance(obj, (int, float))
+                and not isinstance(obj, bool)
+                and _NUMBER_TAIL.match(self.text, end)
+            ):
+                # A number at the edge of the window may continue in the next chunk.
+                self.fill()
+                continue
+            self.pos = end
+            return obj
+
+
+def _items(buf: _Buffer) -> Iterator[Any]:
+    if buf.peek() == "]":
+        buf.pos += 1
+        return
+    while True:
+        yield buf.value()
+        if buf.expect(",]") == "]":
+            return
+
+
+def iter_json_array(
+    chunks: Iterable[bytes],
+    key: str | None = None,
+    extras: Dict[str, Any] | None = None,
+) -> Iterator[Any]:
+    """Yield the elements of a JSON array as they are decoded from ``chunks``.
+
+    The document is either a top-level array or an object whose ``key`` member is the
+    array. Other top-level members are decoded whole into ``extras``; members after the
+    array (Datadog's ``meta``) are only there once iteration finishes. Only the current
+    element and one chunk of text are held in memory at a time.
+    """
+    buf = _Buffer(chunks)
+    if buf.expect("[{") == "[":
+        yield from _items(buf)
+        return
+    if buf.peek() == "}":
+        buf.pos += 1
+        return
+    while True:
+        name = buf.value()
+        if not isinstance(name, str):
+            raise json.JSONDecodeError("Expected an object key", buf.text, buf.pos)
+        buf.expect(":")
+        if name == key and buf.peek() == "[":
+            buf.pos += 1
+            yield from _items(buf)
+        else:
+            value = buf.value()
+            if extras is not None:
+                extras[name] = value
+        if buf.expect(",}") == "}":
+            return
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterable, List, Sequence, Tuple
+from urllib import error, request
+
+from .reporting import ReportingStore
+
+logger = logging.getLogger("openclaw_sentinel.metrics_exporter")
+
+Opener = Callable[..., Any]
+# (metric, value, timestamp, tags, type) with Datadog v2 intake types: 1 count, 3 gauge.
+Point = Tuple[str, float, int, Tuple[str, ...], int]
+
+COUNT, GAUGE = 1, 3
+OVERFLOW_POLICIES = ("drop_newest", "drop_oldest", "block")
+METRIC_PREFIX = "openclaw_sentinel"
+
+
+def _retryable(exc: Exception) -> bool:
+    if isinstance(exc, error.HTTPError):
+        return exc.code == 429 or exc.code >= 500
+    return isinstance(exc, OSError)
+
+
+def store_points(store: ReportingStore, timestamp: int) -> List[Point]:
+    """Gauges for every counter and latency summary; labeled counters become tagged series."""
+    points: List[Point] = []
+    for key, value in sorted(store.unlabeled_snapshot().items()):
+        points.append((f"{METRIC_PREFIX}.{key}", float(value), timestamp, (), GAUGE))
+    for key, series in sorted(store.labeled_snapshot().items()):
+        names = store.label_names.get(key, ())
+        for values, value in sorted(series.items()):
+            labels = names if len(names) == len(values) else [f"label{i}" for i in range(len(values))]
+            tags = tuple(f"{name}:{label}" for name, label in zip(labels, values))
+            points.append((f"{METRIC_PREFIX}.{key}", float(value), timestamp, tags, GAUGE))
+    for key, summary in store.latency_snapshot().items():
+        for stat in ("p50_ms", "p95_ms", "p99_ms", "max_ms"):
+            points.append((f"{METRIC_PREFIX}.{key}.{stat}", float(summary[stat]), timestamp, (), GAUGE))
+    return points
+
+
+def series_payload(points: Sequence[Point]) -> Dict[str, Any]:
+    """Group points into the Datadog ``/api/v2/series`` body, one series per metric/tags/type."""
+    series: Dict[Tuple[str, Tuple[str, ...], int], List[Dict[str, Any]]] = {}
+    for metric, value, timestamp, tags, kind in points:
+        series.setdefault((metric, tags, kind), []).append({"timestamp": timestamp, "value": value})
+    return {
+        "series": [
+            {"metric": metric, "type": kind, "points": values, "tags": list(tags)}
+            for (metric, tags, kind), values in series.items()
+        ]
+    }
+
+
+@dataclass
+class DatadogMetricsExporter:
+    """Ships metric points to Datadog from one background thread.
+
+    ``submit`` only appends to a bounded in-memory buffer, so callers on the cycle or
+    webhook path never wait on the network. The sender flushes once ``batch_size`` points
+    are buffered or every ``flush_interval_seconds``, and with ``reporting`` set it also
+    exports a snapshot of that store on each interval. When the buffer is full,
+    ``overflow`` decides: drop the new point, drop the oldest one, or block the caller
+    for up to ``block_timeout_seconds`` before dropping. Failed posts are retried with
+    full-jitter exponential backoff; 4xx responses other than 429 are not retried.
+    """
+
+    base_url: str
+    api_key: str
+    opener: Opener = request.urlopen
+    reporting: ReportingStore | None = None
+    batch_size: int = 500
+    flush_interval_seconds: float = 10.0
+    max_queue: int = 10_000
+    overflow: str = "drop_newest"
+    block_timeout_seconds: float = 0.05
+    max_retries: int = 3
+    backoff_base_seconds: float = 0.5
+    backoff_max_seconds: float = 10.0
+    timeout_seconds: float = 10.0
+    compress: bool = True
+    sent: int = 0
+    dropped: int = 0
+    failed: int = 0
+    retries: int = 0
+    _points: Deque[Point] = field(default_factory=deque, init=False, repr=False)
+    _cond: threading.Condition = field(default_factory=threading.Condition, init=False, repr=False)
+    _flush_requested: int = field(default=0, init=False, repr=False)
+    _flush_done: int = field(default=0, init=False, repr=False)
+    _closing: bool = field(default=False, init=False, repr=False)
+    _thread: threading.Thread = field(init=False, repr=False)
+    _random: random.Random = field(default_factory=random.Random, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of: {', '.join(OVERFLOW_POLICIES)}")
+        if self.batch_size < 1 or self.max_queue < 1:
+            raise ValueError("batch_size and max_queue must be >= 1")
+        self._thread = threading.Thread(target=self._sender, name="sentinel-metrics-exporter", daemon=True)
+        self._thread.start()
+
+    def submit(
+        self,
+        metric: str,
+        value: float,
+        tags: Iterable[str] = (),
+        timestamp: int | None = None,
+        kind: int = GAUGE,
+    ) -> bool:
+        """Buffer one point; returns False if the overflow policy dropped it."""
+        point: Point = (metric, float(value), int(time.time()) if timestamp is None else timestamp, tuple(tags), kind)
+        return self.submit_many([point]) == 1
+
+    def submit_many(self, points: Iterable[Point]) -> int:
+        accepted = 0
+        with self._cond:
+            for point in points:
+                if self._closing:
+                    self._count("dropped")
+                    continue
+                if len(self._points) >= self.max_queue:
+                    if self.overflow == "drop_oldest":
+                        self._points.popleft()
+                        self._count("dropped")
+                    elif self.overflow != "block" or not self._wait_for_room():
+                        self._count("dropped")
+                        continue
+                self._points.append(point)
+                accepted += 1
+            if self._batch_ready():
+                self._cond.notify_all()
+        return accepted
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Send everything buffered (plus a store snapshot) and wait for the attempt to finish."""
+        with self._cond:
+            self._flush_requested += 1
+            target = self._flush_requested
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: self._flush_done >= target, timeout=timeout)
+
+    def close(self, timeout: float | None = None) -> None:
+        with self._cond:
+            if self._closing:
+                return
+            self._closing = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def _batch_ready(self) -> bool:
+        return len(self._points) >= min(self.batch_size, self.max_queue)
+
+    def _wait_for_room(self) -> bool:
+        self._cond.notify_all()
+        self._cond.wait_for(
+            lambda: len(self._points) < self.max_queue or self._closing, timeout=self.block_timeout_seconds
+        )
+        return len(self._points) < self.max_queue and not self._closing
+
+    def _sender(self) -> None:
+        next_export = time.monotonic() + self.flush_interval_seconds
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._closing
+                    or self._flush_requested > self._flush_done
+                    or self._batch_ready()
+                    or time.monotonic() >= next_export,
+                    timeout=max(0.0, next_export - time.monotonic()),
+                )
+                closing = self._closing
+                flush_target = self._flush_requested
+                interval_due = time.monotonic() >= next_export
+                points = list(self._points)
+                self._points.clear()
+                # Wake producers blocked on a full buffer.
+                self._cond.notify_all()
+
+            if self.reporting is not None and (interval_due or flush_target > self._flush_done or closing):
+                points.extend(store_points(self.reporting, int(time.time())))
+            if interval_due:
+                next_export = time.monotonic() + self.flush_interval_seconds
+            for start in range(0, len(points), self.batch_size):
+                self._send(points[start : start + self.batch_size])
+
+            with self._cond:
+                self._flush_done = max(self._flush_done, flush_target)
+                self._cond.notify_all()
+            if closing:
+                return
+
+    def _send(self, points: List[Point]) -> None:
+        body = json.dumps(series_payload(points), separators=(",", ":")).encode("utf-8")
+        headers = {"Content-Type": "application/json", "DD-API-KEY": self.api_key}
+        if self.compress:
+            body = gzip.compress(body, compresslevel=6)
+            headers["Content-Encoding"] = "gzip"
+        url = f"{self.base_url.rstrip('/')}/api/v2/series"
+        for attempt in range(self.max_retries + 1):
+            req = request.Request(url, data=body, headers=headers, method="POST")
+            try:
+                with self.opener(req, timeout=self.timeout_seconds) as resp:
+                    resp.read()
+            except Exception as exc:  # noqa: BLE001 - a failed export must not kill the sender
+                if attempt < self.max_retries and _retryable(exc):
+                    self._count("retries")
+                    cap = min(self.backoff_max_seconds, self.backoff_base_seconds * (2**attempt))
+                    delay = self._random.uniform(0, cap)
+                    logger.debug("Datadog series post failed attempt=%s retry_in=%.3fs error=%s", attempt + 1, delay, exc)
+                    time.sleep(delay)
+                    continue
+                self._count("failed", len(points))
+                logger.warning("Dropping %s metric points after %s attempts error=%s", len(points), attempt + 1, exc)
+                return
+            self._count("sent", len(points))
+            return
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        # ``dropped`` is only written under self._cond; the rest only by the sender thread.
+        setattr(self, name, getattr(self, name) + amount)
+        if self.reporting is not None:
+            self.reporting.increment(f"datadog_export_{name}", amount)
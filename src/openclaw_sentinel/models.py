@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from enum import IntEnum
-from typing import Dict, List
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
+
+# Distinct tag sets kept for sharing; beyond this new sets are still frozen, just not pooled.
+TAG_POOL_MAX = 4096
 
 
 class AutonomyLevel(IntEnum):
@@ -12,7 +17,54 @@ class AutonomyLevel(IntEnum):
     L3_RESTRICTED = 3
 
 
-@dataclass(frozen=True)
+class FrozenTags(dict):
+    """Read-only, hashable tag mapping. Still a dict, so equality, ``json.dumps`` and
+    ``dict(tags)`` behave exactly as before; any mutation raises TypeError."""
+
+    __slots__ = ("_hash",)
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        try:
+            return self._hash
+        except AttributeError:
+            value = hash(frozenset(self.items()))
+            self._hash = value
+            return value
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (type(self), (dict(self),))
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("tags are immutable; build a new dict instead")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = _readonly  # type: ignore[assignment]
+
+
+_EMPTY_TAGS = FrozenTags()
+_TAG_POOL: Dict[Tuple[Tuple[str, str], ...], FrozenTags] = {}
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+def shared_tags(tags: Mapping[str, str] | Iterable[Tuple[str, str]] | None) -> FrozenTags:
+    """Return a FrozenTags equal to ``tags``, reusing one instance per distinct tag set."""
+    if type(tags) is FrozenTags:
+        return tags
+    items = tuple((_intern(k), _intern(v)) for k, v in (tags.items() if isinstance(tags, Mapping) else tags or ()))
+    if not items:
+        return _EMPTY_TAGS
+    frozen = _TAG_POOL.get(items)
+    if frozen is None:
+        frozen = FrozenTags(items)
+        if len(_TAG_POOL) < TAG_POOL_MAX:
+            frozen = _TAG_POOL.setdefault(items, frozen)
+    return frozen
+
+
+@dataclass(frozen=True, slots=True)
 class Incident:
     id: str
     tenant_id: str
@@ -21,8 +73,15 @@ class Incident:
     summary: str
     tags: Dict[str, str] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        # Bursts repeat the same tenant/source/severity strings and tag sets; share them.
+        object.__setattr__(self, "tenant_id", _intern(self.tenant_id))
+        object.__setattr__(self, "source", _intern(self.source))
+        object.__setattr__(self, "severity", _intern(self.severity))
+        object.__setattr__(self, "tags", shared_tags(self.tags))
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Action:
     id: str
     incident_id: str
@@ -32,6 +91,11 @@ class Action:
     requires_high_privilege: bool = False
     tags: Dict[str, str] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "tenant_id", _intern(self.tenant_id))
+        object.__setattr__(self, "action_type", _intern(self.action_type))
+        object.__setattr__(self, "tags", shared_tags(self.tags))
+
 
 @dataclass(frozen=True)
 class RiskProfile:
@@ -41,11 +105,18 @@ class RiskProfile:
     confidence: float
 
     def score(self) -> float:
-        # Higher reversibility should reduce risk.
-        inverse_reversibility = 6 - self.reversibility
-        weighted = (self.impact * 0.35) + (self.blast_radius * 0.35) + (inverse_reversibility * 0.2)
-        confidence_penalty = (1.0 - self.confidence) * 5 * 0.1
-        return round(weighted + confidence_penalty, 3)
+        return _risk_score(self.impact, self.blast_radius, self.reversibility, self.confidence)
+
+
+@lru_cache(maxsize=4096)
+def _risk_score(impact: int, blast_radius: int, reversibility: int, confidence: float) -> float:
+    # Pure function of four small fields, and planners emit the same few profiles over and
+    # over, so memoizing it is cheaper than redoing the arithmetic.
+    # Higher reversibility should reduce risk.
+    inverse_reversibility = 6 - reversibility
+    weighted = (impact * 0.35) + (blast_radius * 0.35) + (inverse_reversibility * 0.2)
+    confidence_penalty = (1.0 - confidence) * 5 * 0.1
+    return round(weighted + confidence_penalty, 3)
 
 
 @dataclass
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, List
+
+from .models import Action, CycleSummary, Incident
+
+if TYPE_CHECKING:
+    from .service import SentinelService
+
+logger = logging.getLogger("openclaw_sentinel.pipeline")
+
+_DONE = object()
+_POLL_SECONDS = 0.05
+
+
+@dataclass(frozen=True)
+class PipelineConfig:
+    """Per-stage concurrency and queue bounds for PipelinedEngine.
+
+    Fetch concurrency is the service's own ``fetch_workers`` fan-out.
+    """
+
+    plan_workers: int = 1
+    execute_workers: int = 4
+    queue_size: int = 64
+
+    def __post_init__(self) -> None:
+        if self.plan_workers < 1 or self.execute_workers < 1:
+            raise ValueError("pipeline stages need at least one worker")
+        if self.queue_size < 1:
+            raise ValueError("pipeline queue_size must be >= 1")
+
+
+class PipelinedEngine:
+    """Runs one cycle as fetch -> plan/evaluate -> execute/verify stages joined by bounded queues.
+
+    All approved actions of an incident are executed, in plan order, by a single execute
+    worker, so ordering holds per incident while separate incidents run in parallel. A full
+    queue blocks the stage feeding it. The executor and verifier must be thread-safe when
+    ``execute_workers > 1``.
+    """
+
+    def __init__(self, service: SentinelService, config: PipelineConfig) -> None:
+        self.service = service
+        self.config = config
+        self._incidents: queue.Queue[Any] = queue.Queue(maxsize=config.queue_size)
+        self._work: queue.Queue[Any] = queue.Queue(maxsize=config.queue_size)
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._errors: List[BaseException] = []
+        self._planners_left = config.plan_workers
+        self._incidents_seen = 0
+        self._actions_approved = 0
+        self._actions_blocked = 0
+        self._actions_succeeded = 0
+
+    def run(self, cycle_id: str) -> CycleSummary:
+        logger.debug(
+            "Pipelined cycle id=%s plan_workers=%s execute_workers=%s queue_size=%s",
+            cycle_id,
+            self.config.plan_workers,
+            self.config.execute_workers,
+            self.config.queue_size,
+        )
+        threads = [self._spawn(self._fetch_stage, "sentinel-pipeline-fetch")]
+        threads += [self._spawn(self._plan_stage, f"sentinel-pipeline-plan-{i}") for i in range(self.config.plan_workers)]
+        threads += [
+            self._spawn(self._execute_stage, f"sentinel-pipeline-exec-{i}") for i in range(self.config.execute_workers)
+        ]
+        for thread in threads:
+            thread.join()
+        if self._errors:
+            raise self._errors[0]
+        return CycleSummary(
+            cycle_id=cycle_id,
+            incidents_seen=self._incidents_seen,
+            actions_approved=self._actions_approved,
+            actions_blocked=self._actions_blocked,
+            actions_succeeded=self._actions_succeeded,
+        )
+
+    def _spawn(self, target: Callable[[], None], name: str) -> threading.Thread:
+        def guarded() -> None:
+            try:
+                target()
+            except BaseException as exc:  # noqa: BLE001 - re-raised on the caller thread
+                with self._lock:
+                    self._errors.append(exc)
+                self._stop.set()
+
+        thread = threading.Thread(target=guarded, name=name, daemon=True)
+        thread.start()
+        return thread
+
+    def _put(self, q: queue.Queue[Any], item: Any) -> bool:
+        while not self._stop.is_set():
+            try:
+                q.put(item, timeout=_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, q: queue.Queue[Any]) -> Any:
+        while not self._stop.is_set():
+            try:
+                return q.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def _fetch_stage(self) -> None:
+        try:
+            for incident in self.service._iter_incidents():
+                if not self._put(self._incidents, incident):
+                    return
+        finally:
+            for _ in range(self.config.plan_workers):
+                self._put(self._incidents, _DONE)
+
+    def _plan_stage(self) -> None:
+        try:
+            while True:
+                incident = self._get(self._incidents)
+                if incident is _DONE:
+                    return
+                self._plan_one(incident)
+        finally:
+            with self._lock:
+                self._planners_left -= 1
+                last = self._planners_left == 0
+            if last:
+                for _ in range(self.config.execute_workers):
+                    self._put(self._work, _DONE)
+
+    def _plan_one(self, incident: Incident) -> None:
+        approved, blocked = self.service._plan_incident(incident)
+        with self._lock:
+            self._incidents_seen += 1
+            self._actions_approved += len(approved)
+            self._actions_blocked += blocked
+        if approved:
+            self._put(self._work, approved)
+
+    def _execute_stage(self) -> None:
+        while True:
+            actions = self._get(self._work)
+            if actions is _DONE:
+                return
+            self._execute_in_order(actions)
+
+    def _execute_in_order(self, actions: List[Action]) -> None:
+        succeeded = sum(1 for action in actions if self.service._execute_action(action))
+        with self._lock:
+            self._actions_succeeded += succeeded
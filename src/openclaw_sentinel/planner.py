@@ -1,36 +1,71 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, Tuple
+from typing import Dict, Iterable, List, Tuple
 
+from .batch import IncidentBatch
 from .models import Action, Incident, RiskProfile
 
 
+@dataclass(frozen=True)
+class ActionTemplate:
+    """A runbook step independent of the incident it is applied to."""
+
+    name: str
+    action_type: str
+    command: str
+    risk: RiskProfile
+    requires_high_privilege: bool = False
+
+    def bind(self, incident_id: str, tenant_id: str) -> Action:
+        return Action(
+            id=f"{incident_id}:{self.name}",
+            incident_id=incident_id,
+            tenant_id=tenant_id,
+            action_type=self.action_type,
+            command=self.command,
+            requires_high_privilege=self.requires_high_privilege,
+        )
+
+
+RESTART_WORKER = ActionTemplate(
+    name="restart_worker",
+    action_type="restart_service",
+    command="systemctl restart worker",
+    risk=RiskProfile(impact=2, blast_radius=2, reversibility=5, confidence=0.85),
+)
+SCALE_WORKER = ActionTemplate(
+    name="scale_worker",
+    action_type="scale_worker",
+    command="kubectl scale deployment/worker --replicas=6",
+    risk=RiskProfile(impact=3, blast_radius=2, reversibility=4, confidence=0.8),
+)
+
+
 @dataclass
 class RuleBasedPlanner:
     """Maps incident severity to bounded runbook actions and risk estimates."""
 
-    def plan(self, incident: Incident) -> Iterable[Tuple[Action, RiskProfile]]:
-        severity = incident.severity.lower()
-        if severity in {"critical", "high"}:
-            yield (
-                Action(
-                    id=f"{incident.id}:restart_worker",
-                    incident_id=incident.id,
-                    tenant_id=incident.tenant_id,
-                    action_type="restart_service",
-                    command="systemctl restart worker",
-                ),
-                RiskProfile(impact=2, blast_radius=2, reversibility=5, confidence=0.85),
-            )
+    def templates(self, severity: str) -> Tuple[ActionTemplate, ...]:
+        severity = severity.lower()
         if severity == "critical":
-            yield (
-                Action(
-                    id=f"{incident.id}:scale_worker",
-                    incident_id=incident.id,
-                    tenant_id=incident.tenant_id,
-                    action_type="scale_worker",
-                    command="kubectl scale deployment/worker --replicas=6",
-                ),
-                RiskProfile(impact=3, blast_radius=2, reversibility=4, confidence=0.8),
-            )
+            return (RESTART_WORKER, SCALE_WORKER)
+        if severity == "high":
+            return (RESTART_WORKER,)
+        return ()
+
+    def plan(self, incident: Incident) -> Iterable[Tuple[Action, RiskProfile]]:
+        for template in self.templates(incident.severity):
+            yield template.bind(incident.id, incident.tenant_id), template.risk
+
+    def plan_batch(self, batch: IncidentBatch) -> List[Tuple[ActionTemplate, List[int]]]:
+        """Plan a whole batch: each template with the rows it applies to, in first-use order."""
+        by_severity: Dict[str, Tuple[ActionTemplate, ...]] = {}
+        rows_by_template: Dict[ActionTemplate, List[int]] = {}
+        for row, severity in enumerate(batch.severities):
+            templates = by_severity.get(severity)
+            if templates is None:
+                templates = by_severity[severity] = self.templates(severity)
+            for template in templates:
+                rows_by_template.setdefault(template, []).append(row)
+        return list(rows_by_template.items())
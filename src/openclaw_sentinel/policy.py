@@ -1,43 +1,356 @@
 from __future__ import annotations
 
+import itertools
+import threading
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
-from typing import Set
+from typing import Any, Callable, Dict, Iterable, List, Protocol, Sequence, Set, Tuple
 
 from .models import Action, AutonomyLevel, Decision, RiskProfile
+from .reporting import ReportingStore
+
+_RULE_VERSIONS = itertools.count(1)
+_SET_FIELDS = frozenset({"allowlisted_action_types", "blocked_commands"})
+
+_CacheKey = Tuple[str, str, str, bool, RiskProfile]
+_CachedDecision = Tuple[bool, str, AutonomyLevel]
+
+
+class CommandMatcher:
+    """Aho-Corasick automaton answering "does the command contain any blocked substring?"."""
+
+    __slots__ = ("_goto", "_fail", "_terminal", "_match_all", "pattern_count")
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        goto: List[Dict[str, int]] = [{}]
+        terminal = [False]
+        self._match_all = False
+        self.pattern_count = 0
+        for pattern in patterns:
+            self.pattern_count += 1
+            if not pattern:
+                # `"" in command` is always true, which the substring loop treated as a block.
+                self._match_all = True
+                continue
+            node = 0
+            for ch in pattern:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    terminal.append(False)
+                node = nxt
+            terminal[node] = True
+
+        fail = [0] * len(goto)
+        pending = deque(goto[0].values())
+        while pending:
+            node = pending.popleft()
+            for ch, child in goto[node].items():
+                pending.append(child)
+                state = fail[node]
+                while state and ch not in goto[state]:
+                    state = fail[state]
+                fail[child] = goto[state].get(ch, 0)
+                terminal[child] = terminal[child] or terminal[fail[child]]
+
+        self._goto = goto
+        self._fail = fail
+        self._terminal = terminal
+
+    def search(self, text: str) -> bool:
+        if self._match_all:
+            return True
+        goto, fail, terminal = self._goto, self._fail, self._terminal
+        node = 0
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if terminal[node]:
+                return True
+        return False
+
+
+class _TrackedSet(set):
+    """Set that reports in-place changes to its owning PolicyRule."""
+
+    __slots__ = ("_on_change",)
+
+    def __init__(self, items: Iterable[str] = (), on_change: Callable[[], None] | None = None) -> None:
+        super().__init__(items)
+        self._on_change = on_change
+
+    def __repr__(self) -> str:
+        return repr(set(self))
+
+    def _changed(self) -> None:
+        if self._on_change is not None:
+            self._on_change()
+
+
+def _tracking(name: str) -> Callable[..., Any]:
+    method = getattr(set, name)
+
+    def mutate(self: _TrackedSet, *args: Any) -> Any:
+        result = method(self, *args)
+        self._changed()
+        return result
+
+    mutate.__name__ = name
+    return mutate
+
+
+for _name in (
+    "add",
+    "clear",
+    "difference_update",
+    "discard",
+    "intersection_update",
+    "pop",
+    "remove",
+    "symmetric_difference_update",
+    "update",
+    "__iand__",
+    "__ior__",
+    "__isub__",
+    "__ixor__",
+):
+    setattr(_TrackedSet, _name, _tracking(_name))
 
 
 @dataclass
 class PolicyRule:
+    """Tenant policy; any change bumps ``version`` and drops the compiled matcher."""
+
     tenant_id: str
     max_autonomy: AutonomyLevel = AutonomyLevel.L1_ASSIST
     allowlisted_action_types: Set[str] = field(default_factory=set)
     blocked_commands: Set[str] = field(default_factory=set)
     max_risk_score_for_auto: float = 2.8
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in _SET_FIELDS:
+            value = _TrackedSet(value, self._touch)
+        object.__setattr__(self, name, value)
+        self._touch()
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        # copy/pickle: re-wrap the sets so in-place edits on the copy track the copy.
+        for name, value in state.items():
+            if not name.startswith("_"):
+                setattr(self, name, value)
+
+    def _touch(self) -> None:
+        object.__setattr__(self, "_version", next(_RULE_VERSIONS))
+        object.__setattr__(self, "_matcher", None)
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def command_matcher(self) -> CommandMatcher:
+        matcher = self._matcher
+        if matcher is None:
+            matcher = CommandMatcher(self.blocked_commands)
+            object.__setattr__(self, "_matcher", matcher)
+        return matcher
+
 
 class PolicyEngine:
-    def __init__(self, rule: PolicyRule) -> None:
+    """Evaluates actions against one PolicyRule; outcomes are cached per rule version."""
+
+    def __init__(self, rule: PolicyRule, cache_size: int = 1024, reporting: ReportingStore | None = None) -> None:
         self.rule = rule
+        self.cache_size = cache_size
+        self.reporting = reporting
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[_CacheKey, _CachedDecision]" = OrderedDict()
+        self._cache_version = rule.version
+        self._lock = threading.Lock()
 
     def evaluate(self, action: Action, risk: RiskProfile) -> Decision:
-        if action.tenant_id != self.rule.tenant_id:
+        rule = self.rule
+        version = rule.version
+        key = (action.tenant_id, action.action_type, action.command, action.requires_high_privilege, risk)
+        cached = self._lookup(version, key)
+        if cached is not None:
+            return Decision(cached[0], cached[1], cached[2], action)
+        decision = self._precheck(rule, action)
+        if decision is None:
+            decision = self._risk_decision(rule, action, risk.score())
+        self._store(version, key, decision)
+        return decision
+
+    def evaluate_batch(self, actions: Sequence[Action], risks: Sequence[RiskProfile]) -> List[Decision]:
+        """Evaluate a whole plan in one pass; decisions match ``evaluate`` element for element."""
+        if len(actions) != len(risks):
+            raise ValueError("actions and risks must have the same length")
+        rule = self.rule
+        version = rule.version
+        decisions: List[Decision | None] = []
+        keys: List[_CacheKey] = []
+        misses: List[int] = []
+        for i, (action, risk) in enumerate(zip(actions, risks)):
+            key = (action.tenant_id, action.action_type, action.command, action.requires_high_privilege, risk)
+            keys.append(key)
+            cached = self._lookup(version, key)
+            if cached is not None:
+                decisions.append(Decision(cached[0], cached[1], cached[2], action))
+                continue
+            decisions.append(self._precheck(rule, action))
+            misses.append(i)
+
+        for i in misses:
+            if decisions[i] is None:
+                decisions[i] = self._risk_decision(rule, actions[i], risks[i].score())
+        for i in misses:
+            self._store(version, keys[i], decisions[i])
+        return decisions  # type: ignore[return-value]
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return 0.0 if total == 0 else self.hits / total
+
+    def _lookup(self, version: int, key: _CacheKey) -> _CachedDecision | None:
+        if self.cache_size <= 0:
+            return None
+        with self._lock:
+            if version != self._cache_version:
+                self._cache.clear()
+                self._cache_version = version
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if self.reporting is not None:
+            self.reporting.increment("policy_cache_hits" if cached is not None else "policy_cache_misses")
+        return cached
+
+    def _store(self, version: int, key: _CacheKey, decision: Decision) -> None:
+        if self.cache_size <= 0:
+            return
+        with self._lock:
+            # A rule edit during evaluation bumps the version; don't cache a stale outcome.
+            if version != self._cache_version:
+                return
+            self._cache[key] = (decision.approved, decision.reason, decision.required_level)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    @staticmethod
+    def _precheck(rule: PolicyRule, action: Action) -> Decision | None:
+        if action.tenant_id != rule.tenant_id:
             return Decision(False, "tenant_mismatch", AutonomyLevel.L3_RESTRICTED, action)
 
-        if action.action_type not in self.rule.allowlisted_action_types:
+        if action.action_type not in rule.allowlisted_action_types:
             return Decision(False, "action_type_not_allowlisted", AutonomyLevel.L3_RESTRICTED, action)
 
-        for blocked in self.rule.blocked_commands:
-            if blocked in action.command:
-                return Decision(False, "command_blocked", AutonomyLevel.L3_RESTRICTED, action)
+        if rule.command_matcher().search(action.command):
+            return Decision(False, "command_blocked", AutonomyLevel.L3_RESTRICTED, action)
 
         if action.requires_high_privilege:
             return Decision(False, "high_privilege_requires_human", AutonomyLevel.L3_RESTRICTED, action)
+        return None
 
-        risk_score = risk.score()
-        if risk_score > self.rule.max_risk_score_for_auto:
+    @staticmethod
+    def _risk_decision(rule: PolicyRule, action: Action, risk_score: float) -> Decision:
+        if risk_score > rule.max_risk_score_for_auto:
             return Decision(False, f"risk_too_high:{risk_score}", AutonomyLevel.L1_ASSIST, action)
 
-        if self.rule.max_autonomy < AutonomyLevel.L2_BOUNDED_AUTO:
+        if rule.max_autonomy < AutonomyLevel.L2_BOUNDED_AUTO:
             return Decision(False, "autonomy_level_requires_human", AutonomyLevel.L1_ASSIST, action)
 
         return Decision(True, "approved_for_auto", AutonomyLevel.L2_BOUNDED_AUTO, action)
+
+
+class PolicyEvaluator(Protocol):
+    def evaluate(self, action: Action, risk: RiskProfile) -> Decision:
+        ...
+
+
+class PolicyRegistry:
+    """Per-tenant PolicyEngines routed by ``action.tenant_id``; unknown tenants get ``tenant_mismatch``."""
+
+    def __init__(
+        self,
+        rules: Iterable[PolicyRule] = (),
+        cache_size: int = 1024,
+        reporting: ReportingStore | None = None,
+    ) -> None:
+        self.cache_size = cache_size
+        self.reporting = reporting
+        self._engines: Dict[str, PolicyEngine] = {rule.tenant_id: self._engine(rule) for rule in rules}
+
+    def __len__(self) -> int:
+        return len(self._engines)
+
+    def __contains__(self, tenant_id: object) -> bool:
+        return tenant_id in self._engines
+
+    def tenants(self) -> List[str]:
+        return list(self._engines)
+
+    def engine_for(self, tenant_id: str) -> PolicyEngine | None:
+        return self._engines.get(tenant_id)
+
+    def register(self, rule: PolicyRule) -> None:
+        self._engines[rule.tenant_id] = self._engine(rule)
+
+    def remove(self, tenant_id: str) -> None:
+        self._engines.pop(tenant_id, None)
+
+    def hit_rate(self) -> float:
+        engines = list(self._engines.values())
+        hits = sum(engine.hits for engine in engines)
+        total = hits + sum(engine.misses for engine in engines)
+        return 0.0 if total == 0 else hits / total
+
+    def sync(self, rules: Iterable[PolicyRule]) -> List[str]:
+        """Make the registry match ``rules``, touching only tenants whose rule changed."""
+        incoming = {rule.tenant_id: rule for rule in rules}
+        changed = [tenant for tenant in self._engines if tenant not in incoming]
+        for tenant in changed:
+            self.remove(tenant)
+        for tenant, rule in incoming.items():
+            engine = self._engines.get(tenant)
+            if engine is None or engine.rule != rule:
+                self.register(rule)
+                changed.append(tenant)
+        return changed
+
+    def evaluate(self, action: Action, risk: RiskProfile) -> Decision:
+        engine = self._engines.get(action.tenant_id)
+        if engine is None:
+            return Decision(False, "tenant_mismatch", AutonomyLevel.L3_RESTRICTED, action)
+        return engine.evaluate(action, risk)
+
+    def evaluate_batch(self, actions: Sequence[Action], risks: Sequence[RiskProfile]) -> List[Decision]:
+        if len(actions) != len(risks):
+            raise ValueError("actions and risks must have the same length")
+        by_tenant: Dict[str, List[int]] = {}
+        for i, action in enumerate(actions):
+            by_tenant.setdefault(action.tenant_id, []).append(i)
+
+        decisions: List[Decision | None] = [None] * len(actions)
+        for tenant_id, indexes in by_tenant.items():
+            engine = self._engines.get(tenant_id)
+            if engine is None:
+                for i in indexes:
+                    decisions[i] = Decision(False, "tenant_mismatch", AutonomyLevel.L3_RESTRICTED, actions[i])
+                continue
+            group = engine.evaluate_batch([actions[i] for i in indexes], [risks[i] for i in indexes])
+            for i, decision in zip(indexes, group):
+                decisions[i] = decision
+        return decisions  # type: ignore[return-value]
+
+    def _engine(self, rule: PolicyRule) -> PolicyEngine:
+        return PolicyEngine(rule, cache_size=self.cache_size, reporting=self.reporting)
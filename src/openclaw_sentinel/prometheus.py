@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import gzip
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Tuple
+
+from .reporting import ReportingStore
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+NAMESPACE = "openclaw_sentinel"
+# Fixed `le` bounds (seconds) so series stay stable across scrapes.
+LATENCY_BOUNDS: Tuple[float, ...] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_INVALID_NAME = re.compile(r"[^a-zA-Z0-9_:]")
+
+
+def _metric_name(name: str) -> str:
+    name = _INVALID_NAME.sub("_", name)
+    return f"{NAMESPACE}_{name}"
+
+
+def _label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(pairs: Iterable[Tuple[str, str]]) -> str:
+    body = ",".join(f'{name}="{_label_value(value)}"' for name, value in pairs)
+    return f"{{{body}}}" if body else ""
+
+
+def _number(value: float) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+def render_prometheus(store: ReportingStore) -> str:
+    """Render counters, labeled counters and latency histograms in text exposition format."""
+    histograms = store.histograms()
+    # record_latency also writes <key>_count/<key>_ms_total counters; the histogram carries
+    # both. Restored keys have no histogram until the next sample and are left out too.
+    latency_keys = set(store.latency_keys()) | set(histograms)
+    shadowed = {f"{key}_count" for key in latency_keys} | {f"{key}_ms_total" for key in latency_keys}
+    lines: List[str] = []
+
+    for key, value in sorted(store.unlabeled_snapshot().items()):
+        if key in shadowed:
+            continue
+        name = _metric_name(key) + "_total"
+        lines.append(f"# TYPE {name} counter")
+        lines.append(f"{name} {value}")
+
+    for key, series in sorted(store.labeled_snapshot().items()):
+        name = _metric_name(key) + "_total"
+        label_names = store.label_names.get(key, ())
+        lines.append(f"# TYPE {name} counter")
+        for values, value in sorted(series.items()):
+            names = label_names if len(label_names) == len(values) else [f"label{i}" for i in range(len(values))]
+            lines.append(f"{name}{_labels(zip(names, values))} {value}")
+
+    for key, histogram in sorted(histograms.items()):
+        name = _metric_name(key) + "_seconds"
+        lines.append(f"# TYPE {name} histogram")
+        total = histogram.count
+        for bound, count in zip(LATENCY_BOUNDS, histogram.cumulative_counts(LATENCY_BOUNDS)):
+            lines.append(f'{name}_bucket{{le="{_number(bound)}"}} {count}')
+        lines.append(f'{name}_bucket{{le="+Inf"}} {total}')
+        lines.append(f"{name}_sum {_number(histogram.total_seconds)}")
+        lines.append(f"{name}_count {total}")
+
+    return "\n".join(lines) + "\n"
+
+
+@dataclass
+class PrometheusRenderer:
+    """Caches the rendered exposition (plain and gzipped) until the store's generation moves.
+
+    Concurrent scrapes of an unchanged store return the same bytes without touching the
+    counters; only one thread re-renders after a change.
+    """
+
+    store: ReportingStore
+    renders: int = 0
+    _generation: int = field(default=-1, repr=False)
+    _body: bytes = field(default=b"", repr=False)
+    _gzipped: bytes | None = field(default=None, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def render(self, gzipped: bool = False) -> bytes:
+        with self._lock:
+            generation = self.store.generation()
+            if generation != self._generation:
+                # Take the generation first: anything written after it bumps it again.
+                self._body = render_prometheus(self.store).encode("utf-8")
+                self._gzipped = None
+                self._generation = generation
+                self.renders += 1
+            if not gzipped:
+                return self._body
+            if self._gzipped is None:
+                self._gzipped = gzip.compress(self._body, compresslevel=6, mtime=0)
+            return self._gzipped
+
+
+def accepts_gzip(headers: Dict[str, str]) -> bool:
+    encodings = headers.get("accept-encoding", headers.get("Accept-Encoding", ""))
+    for part in encodings.split(","):
+        coding, _, params = part.partition(";")
+        if coding.strip().lower() == "gzip":
+            return params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
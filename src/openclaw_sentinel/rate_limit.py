@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import threading
 import time
-from collections import deque
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
-from typing import Deque, Dict
+from typing import Callable, Deque, Dict, Protocol
+
+
+class RateLimiter(Protocol):
+    def allow(self, key: str) -> bool:
+        ...
 
 
 @dataclass
@@ -25,3 +31,55 @@ class SlidingWindowRateLimiter:
 
         q.append(now)
         return True
+
+
+@dataclass
+class GCRARateLimiter:
+    """``max_requests`` per ``window_seconds`` per key with one float of state per key.
+
+    Generic cell rate algorithm: each key stores its theoretical arrival time (TAT) and a
+    request is allowed while the TAT is at most ``window - window / max_requests`` ahead
+    of now, so a full burst of ``max_requests`` passes and then requests are spaced
+    evenly. A key whose TAT is in the past has fully recovered and carries no state, so
+    it is dropped; keys are kept in LRU order and at most ``max_keys`` are tracked, the
+    least recently seen one being forgotten (and thus reset) when the cap is hit.
+    """
+
+    max_requests: int
+    window_seconds: float
+    max_keys: int = 100_000
+    clock: Callable[[], float] = time.monotonic
+    _tats: "OrderedDict[str, float]" = field(default_factory=OrderedDict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.max_requests < 1 or self.window_seconds <= 0 or self.max_keys < 1:
+            raise ValueError("max_requests, window_seconds and max_keys must be positive")
+        self._interval = self.window_seconds / self.max_requests
+        self._tolerance = self.window_seconds - self._interval
+
+    def __len__(self) -> int:
+        return len(self._tats)
+
+    def allow(self, key: str) -> bool:
+        now = self.clock()
+        with self._lock:
+            tat = max(self._tats.get(key, now), now)
+            if tat - now > self._tolerance:
+                self._tats.move_to_end(key)
+                return False
+            self._tats[key] = tat + self._interval
+            self._tats.move_to_end(key)
+            self._evict(now)
+            return True
+
+    def _evict(self, now: float) -> None:
+        # Caller holds self._lock. Amortised O(1): each key is popped at most once per insert.
+        tats = self._tats
+        while len(tats) > self.max_keys:
+            tats.popitem(last=False)
+        while tats:
+            oldest, tat = next(iter(tats.items()))
+            if tat > now:
+                break
+            del tats[oldest]
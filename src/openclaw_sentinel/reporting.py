@@ -1,33 +1,325 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Dict
+import threading
+import time
+from collections import deque
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from dataclasses import InitVar, dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterator, List, Mapping, Set, Tuple
+
+from .histogram import LatencyHistogram
+from .models import CycleSummary
+
+_SUMMARY_FIELDS = ("incidents_seen", "actions_approved", "actions_blocked", "actions_succeeded")
+
+
+LabelValues = Tuple[str, ...]
+
+# Label names for the built-in labeled counters; exporters use them, snapshot() ignores them.
+DEFAULT_LABEL_NAMES: Dict[str, Tuple[str, ...]] = {
+    "blocked_reason": ("reason",),
+    "connector_busy": ("source",),
+    "connector_failures": ("source",),
+    "connector_timeouts": ("source",),
+    "incidents_by_source": ("tenant", "source"),
+    "actions_by_type": ("tenant", "action_type", "decision"),
+    "cron_failures": ("job",),
+    "cron_fires_skipped": ("job",),
+    "cron_overlaps": ("job",),
+}
+
+
+def _flat_key(key: Any) -> str:
+    return "_".join((key[0],) + key[1]) if isinstance(key, tuple) else key
+
+
+class _Shard:
+    __slots__ = ("counters", "histograms", "version")
+
+    def __init__(self) -> None:
+        self.counters: Dict[Any, int] = {}
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        # Bumped by the owning thread after each write; only that thread ever writes it.
+        self.version = 0
+
+
+class _CounterView(MutableMapping):
+    """Live flat view behind ``ReportingStore.counters``; item assignment writes through."""
+
+    def __init__(self, store: ReportingStore) -> None:
+        self._store = store
+
+    def __getitem__(self, key: str) -> int:
+        return self._store.counter_snapshot()[key]
+
+    def __setitem__(self, key: str, value: int) -> None:
+        self._store.set_counter(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if not self._store.delete_counter(key):
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store.counter_snapshot())
+
+    def __len__(self) -> int:
+        return len(self._store.counter_snapshot())
+
+    def __repr__(self) -> str:
+        return repr(self._store.counter_snapshot())
 
 
 @dataclass
 class ReportingStore:
-    counters: Dict[str, int] = field(default_factory=dict)
+    """Counters and latency histograms; each thread writes to its own shard, readers merge."""
+
+    counters: InitVar[Mapping[str, int] | None] = None
+    label_names: Dict[str, Tuple[str, ...]] = field(default_factory=lambda: dict(DEFAULT_LABEL_NAMES))
+    _base: _Shard = field(default_factory=_Shard, repr=False, compare=False)
+    _shards: List[Tuple[threading.Thread, _Shard]] = field(default_factory=list, repr=False, compare=False)
+    _local: threading.local = field(default_factory=threading.local, repr=False, compare=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    _latency_keys: Set[str] = field(default_factory=set, repr=False, compare=False)
+
+    def __post_init__(self, counters: Mapping[str, int] | None) -> None:
+        # Without an argument the InitVar default is the ``counters`` property defined below.
+        if counters and not isinstance(counters, property):
+            self._base.counters.update(counters)
+
+    @property  # type: ignore[no-redef]
+    def counters(self) -> MutableMapping:
+        """Live flat view of ``counter_snapshot`` that writes through to the store."""
+        return _CounterView(self)
+
+    @counters.setter
+    def counters(self, counters: Mapping[str, int]) -> None:
+        for key in self.counter_snapshot():
+            if key not in counters:
+                self.delete_counter(key)
+        for key, value in counters.items():
+            self.set_counter(key, value)
+
+    def _shard(self) -> _Shard:
+        try:
+            return self._local.shard
+        except AttributeError:
+            pass
+        shard = _Shard()
+        with self._lock:
+            self._fold_dead_shards()
+            self._shards.append((threading.current_thread(), shard))
+        self._local.shard = shard
+        return shard
+
+    def _fold_dead_shards(self) -> None:
+        live = []
+        base = self._base
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                live.append((thread, shard))
+                continue
+            for key, value in shard.counters.items():
+                base.counters[key] = base.counters.get(key, 0) + value
+            for key, histogram in shard.histograms.items():
+                base.histograms.setdefault(key, LatencyHistogram()).merge(histogram)
+            base.version += shard.version
+        self._shards = live
 
     def increment(self, key: str, amount: int = 1) -> None:
-        self.counters[key] = self.counters.get(key, 0) + amount
+        shard = self._shard()
+        counters = shard.counters
+        counters[key] = counters.get(key, 0) + amount
+        shard.version += 1
+
+    def increment_labeled(self, name: str, values: LabelValues, amount: int = 1) -> None:
+        key = (name, values)
+        shard = self._shard()
+        counters = shard.counters
+        counters[key] = counters.get(key, 0) + amount
+        shard.version += 1
 
-    def snapshot(self) -> Dict[str, int]:
-        return dict(self.counters)
+    def set_counter(self, key: str, value: int) -> None:
+        """Make the merged value of unlabeled counter ``key`` equal ``value``."""
+        with self._lock:
+            self._fold_dead_shards()
+            base = self._base.counters
+            in_shards = sum(shard.counters.get(key, 0) for _thread, shard in self._shards)
+            if value == 0 and not any(key in shard.counters for _thread, shard in self._shards):
+                base.pop(key, None)
+            else:
+                base[key] = value - in_shards
+            self._base.version += 1
 
-    def to_datadog_series(self) -> Dict[str, int]:
-        # Placeholder shape used by future Datadog exporter.
-        return {f"openclaw_sentinel.{k}": v for k, v in self.counters.items()}
+    def delete_counter(self, key: str) -> bool:
+        """Drop every counter that flattens to ``key``; False if there was none."""
+        found = False
+        with self._lock:
+            self._fold_dead_shards()
+            for shard in [self._base] + [shard for _thread, shard in self._shards]:
+                for raw in [raw for raw in shard.counters if _flat_key(raw) == key]:
+                    # An owner incrementing this key right now may put it back.
+                    shard.counters.pop(raw, None)
+                    found = True
+            self._base.version += 1
+        return found
+
+    def counter_state(self) -> Dict[str, Any]:
+        """JSON-able counters for persistence; ``restore`` takes it back with labels intact."""
+        counters: Dict[str, int] = {}
+        labeled: List[List[Any]] = []
+        for key, value in self._merged_counters().items():
+            if isinstance(key, tuple):
+                labeled.append([key[0], list(key[1]), value])
+            else:
+                counters[key] = value
+        with self._lock:
+            latency_keys = set(self._latency_keys)
+        return {"counters": counters, "labeled": sorted(labeled), "latency_keys": sorted(latency_keys)}
+
+    def restore(self, state: Mapping[str, Any]) -> None:
+        """Add persisted counters: a ``counter_state`` dict, or a legacy flat snapshot whose
+        labeled keys are split back using ``label_names`` where that is unambiguous."""
+        if isinstance(state.get("counters"), Mapping) and "labeled" in state:
+            counters: Dict[Any, int] = dict(state["counters"])
+            for name, values, value in state["labeled"]:
+                counters[(name, tuple(values))] = value
+            latency_keys = set(state.get("latency_keys", ()))
+        else:
+            counters = {self._unflatten(key): value for key, value in state.items()}
+            latency_keys = {
+                key[: -len("_count")]
+                for key in state
+                if key.endswith("_count") and f"{key[: -len('_count')]}_ms_total" in state
+            }
+        with self._lock:
+            base = self._base.counters
+            for key, value in counters.items():
+                base[key] = base.get(key, 0) + int(value)
+            self._latency_keys |= latency_keys
+            self._base.version += 1
+
+    def _unflatten(self, key: str) -> Any:
+        for name in sorted(self.label_names, key=len, reverse=True):
+            if not key.startswith(f"{name}_"):
+                continue
+            rest = key[len(name) + 1 :]
+            labels = self.label_names[name]
+            parts = (rest,) if len(labels) == 1 else tuple(rest.split("_"))
+            if rest and len(parts) == len(labels):
+                return (name, parts)
+        return key
+
+    def latency_keys(self) -> List[str]:
+        """Keys ever passed to ``record_latency``, including ones restored from state."""
+        with self._lock:
+            return sorted(self._latency_keys)
+
+    def generation(self) -> int:
+        """Number that grows whenever any counter or histogram changes.
+
+        Each shard's version is written only by its owner after the value it guards, so a
+        reader that takes the generation before a snapshot never caches a stale view under
+        a current generation.
+        """
+        with self._lock:
+            return self._base.version + sum(shard.version for _thread, shard in self._shards)
+
+    def record_latency(self, key: str, seconds: float) -> None:
+        shard = self._shard()
+        histogram = shard.histograms.get(key)
+        if histogram is None:
+            histogram = shard.histograms[key] = LatencyHistogram()
+            with self._lock:
+                self._latency_keys.add(key)
+        histogram.record(seconds)
+        counters = shard.counters
+        count_key, total_key = f"{key}_count", f"{key}_ms_total"
+        counters[count_key] = counters.get(count_key, 0) + 1
+        counters[total_key] = counters.get(total_key, 0) + int(round(seconds * 1000))
+        shard.version += 1
+
+    @contextmanager
+    def timer(self, key: str) -> Iterator[None]:
+        """Record the duration of the ``with`` block under ``key``, even if it raises."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_latency(key, time.perf_counter() - started)
+
+    def _merged_counters(self) -> Dict[Any, int]:
+        with self._lock:
+            self._fold_dead_shards()
+            merged = dict(self._base.counters)
+            # dict() copies atomically, so owners can keep writing while we merge.
+            shards = [dict(shard.counters) for _thread, shard in self._shards]
+        for counters in shards:
+            for key, value in counters.items():
+                merged[key] = merged.get(key, 0) + value
+        return merged
+
+    def histograms(self) -> Dict[str, LatencyHistogram]:
+        """Merged per-key latency histograms across all threads."""
+        with self._lock:
+            self._fold_dead_shards()
+            merged = {key: histogram.copy() for key, histogram in self._base.histograms.items()}
+            shards = [dict(shard.histograms) for _thread, shard in self._shards]
+        for histograms in shards:
+            for key, histogram in histograms.items():
+                merged.setdefault(key, LatencyHistogram()).merge(histogram)
+        return merged
+
+    def counter_snapshot(self, timings: bool = True) -> Dict[str, int]:
+        """Flattened counters only; ``timings=False`` leaves out the ``<key>_count`` and
+        ``<key>_ms_total`` counters written by ``record_latency``."""
+        hidden = set()
+        if not timings:
+            for key in self.latency_keys():
+                hidden.update((f"{key}_count", f"{key}_ms_total"))
+        flat: Dict[str, int] = {}
+        for key, value in self._merged_counters().items():
+            if key in hidden:
+                continue
+            key = _flat_key(key)
+            flat[key] = flat.get(key, 0) + value
+        return flat
+
+    def latency_snapshot(self) -> Dict[str, Dict[str, float]]:
+        return {key: histogram.summary() for key, histogram in sorted(self.histograms().items())}
+
+    def snapshot(self) -> Dict[str, float]:
+        flat: Dict[str, float] = dict(self.counter_snapshot())
+        for key, summary in self.latency_snapshot().items():
+            for stat in ("p50_ms", "p95_ms", "p99_ms", "max_ms"):
+                flat[f"{key}_{stat}"] = summary[stat]
+        return flat
+
+    def unlabeled_snapshot(self) -> Dict[str, int]:
+        return {key: value for key, value in self._merged_counters().items() if not isinstance(key, tuple)}
+
+    def labeled_snapshot(self) -> Dict[str, Dict[LabelValues, int]]:
+        labeled: Dict[str, Dict[LabelValues, int]] = {}
+        for key, value in self._merged_counters().items():
+            if isinstance(key, tuple):
+                labeled.setdefault(key[0], {})[key[1]] = value
+        return labeled
+
+    def to_datadog_series(self) -> Dict[str, float]:
+        # Flat view for the CLI payload; DatadogMetricsExporter ships labeled counters as tags.
+        return {f"openclaw_sentinel.{k}": v for k, v in self.snapshot().items()}
 
     def to_grafana_labels(self) -> Dict[str, str]:
-        # Placeholder shape used by future Prometheus/Grafana exporter.
-        return {k: str(v) for k, v in self.counters.items()}
+        # Flat string view for the CLI payload; /metrics/prometheus serves the labeled form.
+        return {k: str(v) for k, v in self.snapshot().items()}
 
     def weekly_digest(self) -> str:
-        incidents = self.counters.get("incidents_seen", 0)
-        approved = self.counters.get("actions_approved", 0)
-        blocked = self.counters.get("actions_blocked", 0)
-        succeeded = self.counters.get("actions_succeeded", 0)
-        failed = self.counters.get("actions_failed", 0)
+        counters = self.counter_snapshot()
+        incidents = counters.get("incidents_seen", 0)
+        approved = counters.get("actions_approved", 0)
+        blocked = counters.get("actions_blocked", 0)
+        succeeded = counters.get("actions_succeeded", 0)
+        failed = counters.get("actions_failed", 0)
         success_rate = 0.0 if approved == 0 else round((succeeded / approved) * 100, 2)
         return (
             "OpenClaw Sentinel Weekly Digest\n"
@@ -38,3 +330,41 @@ class ReportingStore:
             f"- actions_failed: {failed}\n"
             f"- approved_action_success_rate_pct: {success_rate}\n"
         )
+
+
+@dataclass
+class RollingCycleStats:
+    """Constant-memory cycle aggregates: running totals plus the last ``windows`` time buckets.
+
+    Instances are callable so they can be passed directly as a ``run_forever`` sink.
+    """
+
+    window_seconds: int = 3600
+    windows: int = 24
+    clock: Callable[[], float] = time.time
+    totals: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(("cycles",) + _SUMMARY_FIELDS, 0))
+    _buckets: Deque[List[Any]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._buckets = deque(maxlen=self.windows)
+
+    def __call__(self, summary: CycleSummary) -> None:
+        self.add(summary)
+
+    def add(self, summary: CycleSummary) -> None:
+        window_start = int(self.clock() // self.window_seconds) * self.window_seconds
+        if not self._buckets or self._buckets[-1][0] != window_start:
+            self._buckets.append([window_start, dict.fromkeys(("cycles",) + _SUMMARY_FIELDS, 0)])
+        bucket = self._buckets[-1][1]
+        bucket["cycles"] += 1
+        self.totals["cycles"] += 1
+        for name in _SUMMARY_FIELDS:
+            value = getattr(summary, name)
+            bucket[name] += value
+            self.totals[name] += value
+
+    def per_window(self) -> List[Dict[str, int]]:
+        return [{"window_start": start, **counts} for start, counts in self._buckets]
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"totals": dict(self.totals), "windows": self.per_window()}
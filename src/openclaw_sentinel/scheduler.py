@@ -1,7 +1,15 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+import bisect
+import calendar
+from dataclasses import dataclass, field
+from datetime import MAXYEAR, date, datetime, timedelta
+from typing import Tuple
+
+# Gregorian dates and weekdays repeat every 400 years, so a schedule with no match in
+# that span never matches.
+_SEARCH_YEARS = 400
+_MAX_MONTH_DAYS = {1: 31, 2: 29, 3: 31, 4: 30, 5: 31, 6: 30, 7: 31, 8: 31, 9: 30, 10: 31, 11: 30, 12: 31}
 
 
 class CronParseError(ValueError):
@@ -52,6 +60,21 @@ class CronSchedule:
     day: set[int]
     month: set[int]
     weekday: set[int]
+    _minutes: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    _hours: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    _days: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    _months: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_minutes", tuple(sorted(self.minute)))
+        object.__setattr__(self, "_hours", tuple(sorted(self.hour)))
+        object.__setattr__(self, "_days", tuple(sorted(self.day)))
+        object.__setattr__(self, "_months", tuple(sorted(self.month)))
+        satisfiable = bool(self.minute and self.hour and self.weekday) and any(
+            self.day and min(self.day) <= _MAX_MONTH_DAYS[month] for month in self.month
+        )
+        if not satisfiable:
+            raise CronParseError("cron expression never matches")
 
     @classmethod
     def parse(cls, expression: str) -> "CronSchedule":
@@ -79,9 +102,30 @@ class CronSchedule:
         )
 
     def next_after(self, dt: datetime) -> datetime:
-        candidate = dt.replace(second=0, microsecond=0) + timedelta(minutes=1)
-        for _ in range(366 * 24 * 60):
-            if self.matches(candidate):
-                return candidate
-            candidate += timedelta(minutes=1)
+        """First matching minute strictly after ``dt`` (day and weekday must both match).
+
+        Walks the sorted field values from month down to minute, so each call touches at
+        most a few dozen candidate days instead of scanning minute by minute.
+        """
+        start = dt.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        if self.matches(start):
+            return start
+        minutes, hours, days = self._minutes, self._hours, self._days
+
+        for year in range(start.year, min(start.year + _SEARCH_YEARS, MAXYEAR + 1)):
+            first_year = year == start.year
+            months = self._months[bisect.bisect_left(self._months, start.month) :] if first_year else self._months
+            for month in months:
+                first_month = first_year and month == start.month
+                last_day = calendar.monthrange(year, month)[1]
+                for day in days[bisect.bisect_left(days, start.day) :] if first_month else days:
+                    if day > last_day:
+                        break
+                    if date(year, month, day).weekday() not in self.weekday:
+                        continue
+                    first_day = first_month and day == start.day
+                    for hour in hours[bisect.bisect_left(hours, start.hour) :] if first_day else hours:
+                        index = bisect.bisect_left(minutes, start.minute) if first_day and hour == start.hour else 0
+                        if index < len(minutes):
+                            return start.replace(year=year, month=month, day=day, hour=hour, minute=minutes[index])
         raise CronParseError("unable to find next cron execution within search window")
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import select
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any, List, Tuple
+
+from .reporting import ReportingStore
+
+logger = logging.getLogger("openclaw_sentinel.server")
+
+_OVERLOADED_BODY = json.dumps({"error": "overloaded"}).encode("utf-8")
+_OVERLOADED = (
+    b"HTTP/1.1 503 Service Unavailable\r\n"
+    b"Content-Type: application/json\r\n"
+    b"Content-Length: " + str(len(_OVERLOADED_BODY)).encode("ascii") + b"\r\n"
+    b"Retry-After: 1\r\n"
+    b"Connection: close\r\n\r\n" + _OVERLOADED_BODY
+)
+_STOP = object()
+# How often an idle keep-alive connection checks whether other connections are waiting.
+_IDLE_POLL_SECONDS = 0.05
+
+
+def keep_alive_handler(
+    handler: type[BaseHTTPRequestHandler], idle_timeout_seconds: float, max_requests_per_connection: int
+) -> type[BaseHTTPRequestHandler]:
+    """HTTP/1.1 variant of ``handler`` that serves several requests per connection.
+
+    A connection is closed after ``idle_timeout_seconds`` without a request, after
+    ``max_requests_per_connection`` requests, or as soon as other connections are
+    waiting for a worker while it is idle, so idle keep-alive sockets never starve the
+    pool.
+    """
+
+    class KeepAliveHandler(handler):  # type: ignore[valid-type, misc]
+        protocol_version = "HTTP/1.1"
+        timeout = idle_timeout_seconds
+
+        def handle(self) -> None:
+            served = 0
+            self.close_connection = True
+            self.handle_one_request()
+            while not self.close_connection:
+                served += 1
+                if served >= max_requests_per_connection or not self._await_request():
+                    return
+                self.handle_one_request()
+
+        def _await_request(self) -> bool:
+            """Wait for the next request in short slices; False once the connection should close."""
+            deadline = time.monotonic() + idle_timeout_seconds
+            while not self._buffered():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self.server.has_pending():
+                    return False
+                readable, _, _ = select.select([self.connection], [], [], min(remaining, _IDLE_POLL_SECONDS))
+                if readable and not self._buffered():
+                    return False  # the client closed the connection
+            return True
+
+        def _buffered(self) -> bool:
+            # A non-blocking peek also sees pipelined bytes already buffered in rfile.
+            self.connection.settimeout(0)
+            try:
+                return bool(self.rfile.peek(1))
+            except OSError:
+                return False
+            finally:
+                self.connection.settimeout(self.timeout)
+
+    KeepAliveHandler.__name__ = handler.__name__
+    return KeepAliveHandler
+
+
+class BoundedHTTPServer(HTTPServer):
+    """HTTP server with a fixed pool of worker threads and a bounded accept queue.
+
+    The listening thread only accepts and hands sockets to ``workers`` threads through a
+    queue of at most ``max_pending`` connections. When that queue is full the connection
+    gets a canned 503 straight from the accept loop and is closed, so a burst costs one
+    small write per rejected client instead of a thread each. ``backlog`` is the kernel
+    listen backlog in front of the accept loop.
+    """
+
+    def __init__(
+        self,
+        server_address: Tuple[str, int],
+        handler: type[BaseHTTPRequestHandler],
+        workers: int = 8,
+        max_pending: int = 64,
+        backlog: int = 128,
+        reporting: ReportingStore | None = None,
+    ) -> None:
+        if workers < 1 or max_pending < 1:
+            raise ValueError("workers and max_pending must be >= 1")
+        self.request_queue_size = backlog
+        self.reporting = reporting
+        self._pending: "queue.Queue[Any]" = queue.Queue(maxsize=max_pending)
+        self._threads: List[threading.Thread] = []
+        super().__init__(server_address, handler)
+        for index in range(workers):
+            thread = threading.Thread(target=self._worker, name=f"sentinel-http-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def has_pending(self) -> bool:
+        return not self._pending.empty()
+
+    def process_request(self, request: socket.socket, client_address: Any) -> None:
+        try:
+            self._pending.put_nowait((request, client_address))
+        except queue.Full:
+            self._reject(request, client_address)
+
+    def server_close(self) -> None:
+        super().server_close()
+        for _ in self._threads:
+            self._pending.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def _reject(self, request: socket.socket, client_address: Any) -> None:
+        if self.reporting is not None:
+            self.reporting.increment("http_rejected_overload")
+        logger.debug("Rejecting connection under overload client=%s", client_address[0])
+        try:
+            request.settimeout(0.5)
+            request.sendall(_OVERLOADED)
+            # Drain whatever request bytes already arrived so close() sends FIN, not RST,
+            # and the client gets to read the 503.
+            request.setblocking(False)
+            request.recv(65536)
+        except OSError:
+            pass
+        self.shutdown_request(request)
+
+    def _worker(self) -> None:
+        while True:
+            item = self._pending.get()
+            if item is _STOP:
+                return
+            request, client_address = item
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        logger.exception("Unhandled error serving client=%s", client_address[0])
@@ -1,102 +1,379 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
 from dataclasses import dataclass, field
-from typing import Callable, Iterable, List
+from typing import Callable, Dict, Iterable, Iterator, List
 
+from .batch import IncidentBatch
 from .connectors import IncidentConnector
-from .models import Action, CycleSummary, Incident, RiskProfile
-from .policy import PolicyEngine
+from .dedup import IncidentDeduplicator
+from .models import Action, ActionOutcome, CycleSummary, Decision, Incident, RiskProfile
+from .pipeline import PipelineConfig, PipelinedEngine
+from .planner import ActionTemplate
+from .policy import PolicyEvaluator
 from .reporting import ReportingStore
+from .state_store import SQLiteStateStore
 from .verification import VerificationService
 
 PlannerFn = Callable[[Incident], Iterable[tuple[Action, RiskProfile]]]
+BatchPlannerFn = Callable[[IncidentBatch], List[tuple[ActionTemplate, List[int]]]]
 ExecutorFn = Callable[[Action], str]
+SummarySink = Callable[[CycleSummary], None]
 logger = logging.getLogger("openclaw_sentinel.service")
 
 
+def _timed_fetch(connector: IncidentConnector) -> tuple[Iterable[Incident], float]:
+    started = time.monotonic()
+    incidents = connector.fetch_incidents()
+    if not isinstance(incidents, (IncidentBatch, list)):
+        incidents = list(incidents)
+    return incidents, time.monotonic() - started
+
+
+def _commit_fetch(incidents: Iterable[Incident]) -> None:
+    # Incremental connectors only advance their watermark once the cycle took the results.
+    commit = getattr(incidents, "commit", None)
+    if commit is not None:
+        commit()
+
+
+def _plan_and_evaluate(
+    planner: PlannerFn,
+    policy_engine: PolicyEvaluator,
+    reporting: ReportingStore,
+    incident: Incident,
+    deduplicator: IncidentDeduplicator | None = None,
+    state_store: SQLiteStateStore | None = None,
+) -> tuple[List[Action], int]:
+    logger.debug("Processing incident id=%s source=%s severity=%s", incident.id, incident.source, incident.severity)
+    reporting.increment("incidents_seen")
+    reporting.increment_labeled("incidents_by_source", (incident.tenant_id, incident.source))
+    if deduplicator is not None:
+        if deduplicator.seen(incident):
+            reporting.increment("dedup_hits")
+            logger.debug("Skipping repeat incident id=%s source=%s", incident.id, incident.source)
+            return [], 0
+        reporting.increment("dedup_misses")
+    if state_store is not None:
+        state_store.record_incident(incident)
+    approved: List[Action] = []
+    actions_blocked = 0
+
+    with reporting.timer("stage_plan"):
+        plan = list(planner(incident))
+    if not plan:
+        return approved, actions_blocked
+    actions = [action for action, _risk in plan]
+    risks = [risk for _action, risk in plan]
+    if logger.isEnabledFor(logging.DEBUG):
+        for action, risk in plan:
+            logger.debug("Planned action id=%s type=%s risk_score=%.3f", action.id, action.action_type, risk.score())
+    evaluate_batch = getattr(policy_engine, "evaluate_batch", None)
+    with reporting.timer("stage_policy"):
+        if evaluate_batch is not None:
+            decisions = evaluate_batch(actions, risks)
+        else:
+            decisions = [policy_engine.evaluate(action, risk) for action, risk in plan]
+
+    for action, decision in zip(actions, decisions):
+        if state_store is not None:
+            state_store.record_decision(decision)
+        if not decision.approved:
+            actions_blocked += 1
+            reporting.increment("actions_blocked")
+            reporting.increment_labeled("blocked_reason", (decision.reason,))
+            reporting.increment_labeled("actions_by_type", (action.tenant_id, action.action_type, "blocked"))
+            logger.info("Blocked action id=%s reason=%s", action.id, decision.reason)
+            continue
+
+        reporting.increment("actions_approved")
+        reporting.increment_labeled("actions_by_type", (action.tenant_id, action.action_type, "approved"))
+        approved.append(action)
+    return approved, actions_blocked
+
+
+def _plan_and_evaluate_batch(
+    batch_planner: BatchPlannerFn,
+    policy_engine: PolicyEvaluator,
+    reporting: ReportingStore,
+    batch: IncidentBatch,
+    deduplicator: IncidentDeduplicator | None = None,
+    state_store: SQLiteStateStore | None = None,
+) -> tuple[List[Action], int]:
+    """Bulk counterpart of ``_plan_and_evaluate`` working on the batch's columns.
+
+    Policy is evaluated once per (template, tenant), which relies on decisions not
+    depending on action or incident ids (true for PolicyEngine and PolicyRegistry).
+    Actions are only built for approved rows, or for every row when a state store needs
+    the decisions.
+    """
+    reporting.increment("incidents_seen", len(batch))
+    for labels, count in Counter(zip(batch.tenant_ids, batch.sources)).items():
+        reporting.increment_labeled("incidents_by_source", labels, count)
+    if deduplicator is not None:
+        fresh = [row for row in range(len(batch)) if not deduplicator.seen_fingerprint(batch.fingerprint(row))]
+        if len(fresh) < len(batch):
+            reporting.increment("dedup_hits", len(batch) - len(fresh))
+            batch = batch.select(fresh)
+        if fresh:
+            reporting.increment("dedup_misses", len(fresh))
+    if state_store is not None:
+        for incident in batch:
+            state_store.record_incident(incident)
+    approved: List[Action] = []
+    actions_blocked = 0
+
+    with reporting.timer("stage_plan"):
+        plan = batch_planner(batch)
+    for template, rows in plan:
+        by_tenant: dict[str, List[int]] = {}
+        for row in rows:
+            by_tenant.setdefault(batch.tenant_ids[row], []).append(row)
+        for tenant_id, tenant_rows in by_tenant.items():
+            probe = template.bind(batch.ids[tenant_rows[0]], tenant_id)
+            with reporting.timer("stage_policy"):
+                decision = policy_engine.evaluate(probe, template.risk)
+            count = len(tenant_rows)
+            actions: List[Action] = []
+            if decision.approved or state_store is not None:
+                actions = [probe] + [template.bind(batch.ids[row], tenant_id) for row in tenant_rows[1:]]
+            if state_store is not None:
+                for action in actions:
+                    state_store.record_decision(
+                        Decision(decision.approved, decision.reason, decision.required_level, action)
+                    )
+            if not decision.approved:
+                actions_blocked += count
+                reporting.increment("actions_blocked", count)
+                reporting.increment_labeled("blocked_reason", (decision.reason,), count)
+                reporting.increment_labeled("actions_by_type", (tenant_id, template.action_type, "blocked"), count)
+                logger.info(
+                    "Blocked actions template=%s tenant=%s count=%s reason=%s",
+                    template.name,
+                    tenant_id,
+                    count,
+                    decision.reason,
+                )
+                continue
+            reporting.increment("actions_approved", count)
+            reporting.increment_labeled("actions_by_type", (tenant_id, template.action_type, "approved"), count)
+            approved.extend(actions)
+    return approved, actions_blocked
+
+
+def _record_outcome(reporting: ReportingStore, outcome: ActionOutcome, state_store: SQLiteStateStore | None = None) -> bool:
+    if state_store is not None:
+        state_store.record_outcome(outcome)
+    if outcome.success:
+        reporting.increment("actions_succeeded")
+        logger.info("Action success id=%s", outcome.action.id)
+        return True
+    reporting.increment("actions_failed")
+    logger.warning("Action failed id=%s details=%s", outcome.action.id, outcome.details)
+    return False
+
+
 @dataclass
 class SentinelService:
     connectors: List[IncidentConnector]
-    policy_engine: PolicyEngine
+    policy_engine: PolicyEvaluator
     planner: PlannerFn
     executor: ExecutorFn
     verifier: VerificationService
     reporting: ReportingStore = field(default_factory=ReportingStore)
+    fetch_workers: int = 1
+    connector_timeout_seconds: float | None = None
+    cycle_timeout_seconds: float | None = None
+    pipeline: PipelineConfig | None = None
+    deduplicator: IncidentDeduplicator | None = None
+    state_store: SQLiteStateStore | None = None
+    batch_planner: BatchPlannerFn | None = None
+    _fetch_pool: ThreadPoolExecutor | None = field(default=None, init=False, repr=False, compare=False)
+    _fetches: Dict[int, Future] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _fetch_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
 
-    def _process_incident(self, incident: Incident) -> tuple[int, int, int]:
-        logger.debug("Processing incident id=%s source=%s severity=%s", incident.id, incident.source, incident.severity)
-        actions_approved = 0
-        actions_blocked = 0
-        actions_succeeded = 0
-        self.reporting.increment("incidents_seen")
-
-        for action, risk in self.planner(incident):
-            logger.debug("Planned action id=%s type=%s risk_score=%.3f", action.id, action.action_type, risk.score())
-            decision = self.policy_engine.evaluate(action, risk)
-            if not decision.approved:
-                actions_blocked += 1
-                self.reporting.increment("actions_blocked")
-                self.reporting.increment(f"blocked_reason_{decision.reason}")
-                logger.info("Blocked action id=%s reason=%s", action.id, decision.reason)
-                continue
+    def _plan_incident(self, incident: Incident) -> tuple[List[Action], int]:
+        return _plan_and_evaluate(
+            self.planner, self.policy_engine, self.reporting, incident, self.deduplicator, self.state_store
+        )
 
-            actions_approved += 1
-            self.reporting.increment("actions_approved")
+    def _execute_action(self, action: Action) -> bool:
+        with self.reporting.timer("stage_execute"):
             result = self.executor(action)
+        with self.reporting.timer("stage_verify"):
             outcome = self.verifier.verify(action, result)
-            if outcome.success:
-                actions_succeeded += 1
-                self.reporting.increment("actions_succeeded")
-                logger.info("Action success id=%s", action.id)
-            else:
-                self.reporting.increment("actions_failed")
-                logger.warning("Action failed id=%s details=%s", action.id, outcome.details)
-        return actions_approved, actions_blocked, actions_succeeded
+        return _record_outcome(self.reporting, outcome, self.state_store)
+
+    def _process_incident(self, incident: Incident) -> tuple[int, int, int]:
+        with self.reporting.timer("stage_incident"):
+            approved, actions_blocked = self._plan_incident(incident)
+            actions_succeeded = sum(1 for action in approved if self._execute_action(action))
+        return len(approved), actions_blocked, actions_succeeded
 
     def run_incident(self, cycle_id: str, incident: Incident) -> CycleSummary:
         logger.info("Running incident cycle id=%s incident=%s", cycle_id, incident.id)
         approved, blocked, succeeded = self._process_incident(incident)
-        return CycleSummary(
-            cycle_id=cycle_id,
-            incidents_seen=1,
-            actions_approved=approved,
-            actions_blocked=blocked,
-            actions_succeeded=succeeded,
+        return self._finish_cycle(
+            CycleSummary(
+                cycle_id=cycle_id,
+                incidents_seen=1,
+                actions_approved=approved,
+                actions_blocked=blocked,
+                actions_succeeded=succeeded,
+            )
         )
 
+    def _finish_cycle(self, summary: CycleSummary) -> CycleSummary:
+        if self.state_store is not None:
+            self.state_store.record_cycle(summary, self.reporting.counter_state())
+        return summary
+
+    def _process_batch(self, batch: IncidentBatch) -> tuple[int, int, int]:
+        approved, actions_blocked = _plan_and_evaluate_batch(
+            self.batch_planner, self.policy_engine, self.reporting, batch, self.deduplicator, self.state_store
+        )
+        actions_succeeded = sum(1 for action in approved if self._execute_action(action))
+        return len(approved), actions_blocked, actions_succeeded
+
+    def _iter_sources(self) -> Iterator[Iterable[Incident]]:
+        if self.fetch_workers <= 1:
+            for connector in self.connectors:
+                started = time.perf_counter()
+                incidents = connector.fetch_incidents()
+                if isinstance(incidents, Iterator):
+                    # Drain streaming connectors before anything executes, so a slow action
+                    # can't leave the HTTP response idle mid-stream until the server drops it.
+                    # Streaming therefore bounds parse memory, not the memory of a cycle.
+                    incidents = list(incidents)
+                self.reporting.record_latency(f"connector_fetch_{connector.source_name}", time.perf_counter() - started)
+                yield incidents
+            return
+        yield from self._fetch_concurrently()
+
+    def _iter_incidents(self) -> Iterator[Incident]:
+        for incidents in self._iter_sources():
+            yield from incidents
+            _commit_fetch(incidents)
+
+    def _fetch_concurrently(self) -> List[Iterable[Incident]]:
+        # Connectors share one clock started at fan-out, so a connector queued behind a
+        # saturated pool spends part of its budget waiting. Timed-out or failing sources
+        # are dropped from this cycle; the remaining sources still produce results. The
+        # pool lives as long as the service and a connector whose previous fetch is still
+        # running is not submitted again, so hung connectors hold at most one thread each.
+        started = time.monotonic()
+        cycle_deadline = None if self.cycle_timeout_seconds is None else started + self.cycle_timeout_seconds
+        with self._fetch_lock:
+            if self._fetch_pool is None:
+                self._fetch_pool = ThreadPoolExecutor(max_workers=self.fetch_workers, thread_name_prefix="sentinel-fetch")
+            submitted = []
+            for connector in self.connectors:
+                previous = self._fetches.get(id(connector))
+                if previous is not None and not previous.done():
+                    self.reporting.increment_labeled("connector_busy", (connector.source_name,))
+                    logger.warning("Connector still fetching from an earlier cycle source=%s", connector.source_name)
+                    continue
+                future = self._fetch_pool.submit(_timed_fetch, connector)
+                self._fetches[id(connector)] = future
+                submitted.append((connector, future))
+        results: List[Iterable[Incident]] = []
+        for connector, future in submitted:
+            source = connector.source_name
+            deadline = cycle_deadline
+            if self.connector_timeout_seconds is not None:
+                connector_deadline = started + self.connector_timeout_seconds
+                deadline = connector_deadline if deadline is None else min(deadline, connector_deadline)
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                incidents, elapsed = future.result(timeout=timeout)
+            except FutureTimeout:
+                # Cancels fetches still queued; a running one finishes in the background.
+                future.cancel()
+                self.reporting.increment_labeled("connector_timeouts", (source,))
+                logger.warning("Connector fetch timed out source=%s", source)
+                continue
+            except Exception as exc:
+                self.reporting.increment_labeled("connector_failures", (source,))
+                logger.warning("Connector fetch failed source=%s error=%s", source, exc)
+                continue
+            self.reporting.record_latency(f"connector_fetch_{source}", elapsed)
+            results.append(incidents)
+        return results
+
+    def close(self) -> None:
+        """Release the fetch pool without waiting for hung connectors."""
+        with self._fetch_lock:
+            pool, self._fetch_pool = self._fetch_pool, None
+            self._fetches.clear()
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
     def run_cycle(self, cycle_id: str) -> CycleSummary:
+        with self.reporting.timer("stage_cycle"):
+            return self._run_cycle(cycle_id)
+
+    def _run_cycle(self, cycle_id: str) -> CycleSummary:
         logger.info("Starting cycle id=%s", cycle_id)
+        if self.pipeline is not None:
+            return self._finish_cycle(PipelinedEngine(self, self.pipeline).run(cycle_id))
         incidents_seen = 0
         actions_approved = 0
         actions_blocked = 0
         actions_succeeded = 0
 
-        for connector in self.connectors:
-            for incident in connector.fetch_incidents():
+        for incidents in self._iter_sources():
+            if self.batch_planner is not None and isinstance(incidents, IncidentBatch):
+                incidents_seen += len(incidents)
+                approved, blocked, succeeded = self._process_batch(incidents)
+                actions_approved += approved
+                actions_blocked += blocked
+                actions_succeeded += succeeded
+                _commit_fetch(incidents)
+                continue
+            for incident in incidents:
                 incidents_seen += 1
                 approved, blocked, succeeded = self._process_incident(incident)
                 actions_approved += approved
                 actions_blocked += blocked
                 actions_succeeded += succeeded
+            _commit_fetch(incidents)
 
-        return CycleSummary(
-            cycle_id=cycle_id,
-            incidents_seen=incidents_seen,
-            actions_approved=actions_approved,
-            actions_blocked=actions_blocked,
-            actions_succeeded=actions_succeeded,
+        return self._finish_cycle(
+            CycleSummary(
+                cycle_id=cycle_id,
+                incidents_seen=incidents_seen,
+                actions_approved=actions_approved,
+                actions_blocked=actions_blocked,
+                actions_succeeded=actions_succeeded,
+            )
         )
 
-    def run_forever(self, interval_seconds: int = 60, max_cycles: int | None = None) -> List[CycleSummary]:
-        logger.info("Running service loop interval_seconds=%s max_cycles=%s", interval_seconds, max_cycles)
-        summaries: List[CycleSummary] = []
+    def iter_cycles(self, interval_seconds: float = 60, max_cycles: int | None = None) -> Iterator[CycleSummary]:
         cycle = 1
         while True:
-            cycle_id = f"cycle-{cycle}"
-            summaries.append(self.run_cycle(cycle_id=cycle_id))
+            yield self.run_cycle(cycle_id=f"cycle-{cycle}")
             if max_cycles is not None and cycle >= max_cycles:
-                return summaries
+                return
             cycle += 1
             time.sleep(interval_seconds)
+
+    def run_forever(
+        self,
+        interval_seconds: int = 60,
+        max_cycles: int | None = None,
+        sink: SummarySink | None = None,
+    ) -> List[CycleSummary]:
+        """Run cycles until ``max_cycles``; with a ``sink`` summaries are streamed, not collected."""
+        logger.info("Running service loop interval_seconds=%s max_cycles=%s", interval_seconds, max_cycles)
+        summaries: List[CycleSummary] = []
+        for summary in self.iter_cycles(interval_seconds=interval_seconds, max_cycles=max_cycles):
+            if sink is None:
+                summaries.append(summary)
+            else:
+                sink(summary)
+        return summaries
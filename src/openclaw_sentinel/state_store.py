@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, List, Mapping
+
+from .models import ActionOutcome, CycleSummary, Decision, Incident
+
+logger = logging.getLogger("openclaw_sentinel.state_store")
+
+FSYNC_MODES = {"always": "FULL", "batch": "FULL", "never": "OFF"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    recorded_at REAL NOT NULL,
+    ref TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS records_kind_time ON records (kind, recorded_at);
+"""
+
+
+def _jsonable(value: Any) -> Any:
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {f.name: _jsonable(getattr(value, f.name)) for f in dataclasses.fields(value)}
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Mapping):
+        return {str(k): _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_jsonable(v) for v in value]
+    return value
+
+
+class _Flush:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+
+
+class _Compact:
+    pass
+
+
+_STOP = object()
+
+
+@dataclass
+class SQLiteStateStore:
+    """Append-only record log for incidents, decisions, outcomes and cycle summaries.
+
+    Writes are committed by one background thread using SQLite in WAL mode. ``fsync``
+    selects durability: ``always`` makes each ``record_*`` call wait until its record is
+    committed with synchronous=FULL; ``batch`` queues records and commits them in batches
+    with synchronous=FULL, so callers never touch the disk but the last batch can be lost
+    on a crash; ``never`` batches too and leaves syncing to the OS. In the queued modes a
+    full queue drops and counts new records rather than blocking the caller. Records
+    older than ``retention_seconds`` are deleted by periodic compaction.
+    """
+
+    path: str
+    batch_size: int = 256
+    flush_interval_seconds: float = 1.0
+    fsync: str = "batch"
+    retention_seconds: float | None = None
+    compact_interval_seconds: float = 3600.0
+    max_queue: int = 10_000
+    dropped: int = 0
+    written: int = 0
+    _queue: "queue.Queue[Any]" = field(init=False, repr=False)
+    _thread: threading.Thread = field(init=False, repr=False)
+    _closed: bool = field(default=False, init=False, repr=False)
+    _stats_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.fsync not in FSYNC_MODES:
+            raise ValueError(f"fsync must be one of: {', '.join(sorted(FSYNC_MODES))}")
+        if self.fsync == "always":
+            self.batch_size = 1
+        self._queue = queue.Queue(maxsize=self.max_queue)
+        ready = threading.Event()
+        startup_errors: List[BaseException] = []
+        self._thread = threading.Thread(
+            target=self._writer, args=(ready, startup_errors), name="sentinel-state-writer", daemon=True
+        )
+        self._thread.start()
+        ready.wait()
+        if startup_errors:
+            raise startup_errors[0]
+
+    def record_incident(self, incident: Incident) -> None:
+        self._enqueue("incident", incident.id, incident)
+
+    def record_decision(self, decision: Decision) -> None:
+        self._enqueue("decision", decision.action.incident_id, decision)
+
+    def record_outcome(self, outcome: ActionOutcome) -> None:
+        self._enqueue("outcome", outcome.action.incident_id, outcome)
+
+    def record_cycle(self, summary: CycleSummary, counters: Dict[str, Any] | None = None) -> None:
+        self._enqueue("cycle", summary.cycle_id, summary)
+        if counters is not None:
+            self._enqueue("counters", summary.cycle_id, counters)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        marker = _Flush()
+        self._queue.put(marker)
+        return marker.done.wait(timeout)
+
+    def compact(self) -> None:
+        self._queue.put(_Compact())
+        self.flush()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def records(self, kind: str, limit: int = 100) -> List[Dict[str, Any]]:
+        with closing(sqlite3.connect(self.path, timeout=5.0)) as conn:
+            rows = conn.execute(
+                "SELECT recorded_at, ref, payload FROM records WHERE kind = ? ORDER BY seq DESC LIMIT ?",
+                (kind, limit),
+            ).fetchall()
+        return [{"recorded_at": ts, "ref": ref, "payload": json.loads(payload)} for ts, ref, payload in rows]
+
+    def latest_counters(self) -> Dict[str, Any] | None:
+        """Last ``ReportingStore.counter_state()`` (or legacy flat snapshot) recorded."""
+        rows = self.records("counters", limit=1)
+        return rows[0]["payload"] if rows else None
+
+    def _enqueue(self, kind: str, ref: str, obj: Any) -> None:
+        item = (kind, time.time(), ref, obj)
+        if self.fsync == "always":
+            # batch_size is 1, so the record is committed before the flush marker is seen.
+            self._queue.put(item)
+            self.flush()
+            return
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            with self._stats_lock:
+                self.dropped += 1
+
+    def _writer(self, ready: threading.Event, startup_errors: List[BaseException]) -> None:
+        try:
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(f"PRAGMA synchronous={FSYNC_MODES[self.fsync]}")
+            conn.executescript(_SCHEMA)
+        except BaseException as exc:  # noqa: BLE001 - surfaced to the constructor
+            startup_errors.append(exc)
+            ready.set()
+            return
+        ready.set()
+
+        batch: List[tuple] = []
+        batch_deadline: float | None = None
+        next_compaction = time.monotonic() + self.compact_interval_seconds
+        try:
+            while True:
+                wait = self.flush_interval_seconds if batch_deadline is None else batch_deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=max(0.0, wait))
+                except queue.Empty:
+                    item = None
+
+                if isinstance(item, tuple):
+                    kind, ts, ref, obj = item
+                    batch.append((kind, ts, ref, json.dumps(_jsonable(obj), sort_keys=True)))
+                    if batch_deadline is None:
+                        batch_deadline = time.monotonic() + self.flush_interval_seconds
+                    if len(batch) < self.batch_size and time.monotonic() < batch_deadline:
+                        continue
+
+                self._write_batch(conn, batch)
+                batch = []
+                batch_deadline = None
+                if isinstance(item, _Compact) or time.monotonic() >= next_compaction:
+                    self._compact(conn)
+                    next_compaction = time.monotonic() + self.compact_interval_seconds
+                if isinstance(item, _Flush):
+                    item.done.set()
+                if item is _STOP:
+                    return
+        finally:
+            conn.close()
+
+    def _write_batch(self, conn: sqlite3.Connection, batch: List[tuple]) -> None:
+        if not batch:
+            return
+        try:
+            with conn:
+                conn.executemany("INSERT INTO records (kind, recorded_at, ref, payload) VALUES (?, ?, ?, ?)", batch)
+            with self._stats_lock:
+                self.written += len(batch)
+        except sqlite3.Error as exc:
+            with self._stats_lock:
+                self.dropped += len(batch)
+            logger.warning("State store batch write failed records=%s error=%s", len(batch), exc)
+
+    def _compact(self, conn: sqlite3.Connection) -> None:
+        if self.retention_seconds is not None:
+            cutoff = time.time() - self.retention_seconds
+            with conn:
+                deleted = conn.execute("DELETE FROM records WHERE recorded_at < ?", (cutoff,)).rowcount
+            logger.debug("State store compaction deleted=%s", deleted)
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
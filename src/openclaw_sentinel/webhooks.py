@@ -4,7 +4,7 @@ import hashlib
 import hmac
 import json
 from dataclasses import dataclass, field
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 from urllib.parse import parse_qs
 
 from .models import Incident
@@ -109,16 +109,43 @@ def _incident_from_payload(source: str, payload: Dict[str, Any], cfg: WebhookCon
     raise ValueError("unsupported_source")
 
 
-def process_webhook(
+def _delivery_id(source: str, payload: Dict[str, Any]) -> str | None:
+    """The provider's own id for this delivery, which stays the same across retries."""
+    source = source.lower()
+    if source == "telegram":
+        if payload.get("update_id") is not None:
+            return f"update-{payload['update_id']}"
+        msg = payload.get("message", {})
+        if msg.get("message_id") is None:
+            return None
+        return f"{msg.get('chat', {}).get('id', 'unknown')}-{msg['message_id']}"
+    if source == "whatsapp":
+        return payload.get("MessageSid") or None
+    if source == "twitter":
+        return None if payload.get("id") is None else str(payload["id"])
+    return None
+
+
+def parse_webhook(
     source: str,
     headers: Dict[str, str],
     raw_body: bytes,
     cfg: WebhookConfig,
-) -> Incident:
+) -> Tuple[Incident, str | None]:
+    """Verify and parse a delivery; also return the provider's delivery id when it has one."""
     normalized_headers = {k.lower(): v for k, v in headers.items()}
     if not _verify_signature(source, normalized_headers, raw_body, cfg):
         raise PermissionError("invalid_signature")
 
     content_type = normalized_headers.get("content-type", "application/json")
     payload = _parse_payload(source, raw_body, content_type)
-    return _incident_from_payload(source, payload, cfg)
+    return _incident_from_payload(source, payload, cfg), _delivery_id(source, payload)
+
+
+def process_webhook(
+    source: str,
+    headers: Dict[str, str],
+    raw_body: bytes,
+    cfg: WebhookConfig,
+) -> Incident:
+    return parse_webhook(source, headers, raw_body, cfg)[0]
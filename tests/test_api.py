@@ -58,6 +58,8 @@ class APITests(unittest.TestCase):
         status, metrics = handle_get("/metrics", service)
         self.assertEqual(status, 200)
         self.assertEqual(metrics["actions_approved"], 1)
+        for stage in ("plan", "policy", "execute", "verify", "incident", "cycle"):
+            self.assertIn(f"stage_{stage}_p95_ms", metrics)
 
 
 if __name__ == "__main__":
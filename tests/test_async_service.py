@@ -0,0 +1,108 @@
+import asyncio
+import unittest
+
+from openclaw_sentinel.async_service import AsyncSentinelService
+from openclaw_sentinel.connectors import StaticConnector
+from openclaw_sentinel.models import Action, ActionOutcome, AutonomyLevel, Incident
+from openclaw_sentinel.planner import RuleBasedPlanner
+from openclaw_sentinel.policy import PolicyEngine, PolicyRule
+from openclaw_sentinel.verification import VerificationService
+
+
+class _AsyncConnector:
+    source_name = "async-grafana"
+
+    async def fetch_incidents(self):
+        await asyncio.sleep(0)
+        return [Incident(id="g1", tenant_id="t1", source="grafana", severity="critical", summary="latency")]
+
+
+class _HangingConnector:
+    source_name = "hanging"
+
+    async def fetch_incidents(self):
+        await asyncio.sleep(30)
+        return []
+
+
+class _AsyncVerifier:
+    async def verify(self, action: Action, executor_result: str) -> ActionOutcome:
+        return ActionOutcome(action=action, success=executor_result == "ok", details=executor_result)
+
+
+def _policy() -> PolicyEngine:
+    return PolicyEngine(
+        PolicyRule(
+            tenant_id="t1",
+            max_autonomy=AutonomyLevel.L2_BOUNDED_AUTO,
+            allowlisted_action_types={"restart_service", "scale_worker"},
+        )
+    )
+
+
+class AsyncSentinelServiceTests(unittest.IsolatedAsyncioTestCase):
+    async def test_mixes_sync_and_async_connectors_and_executors(self) -> None:
+        sync_connector = StaticConnector(
+            source_name="datadog",
+            incidents=[Incident(id="d1", tenant_id="t1", source="datadog", severity="high", summary="cpu")],
+        )
+
+        async def executor(_action: Action) -> str:
+            return "ok"
+
+        service = AsyncSentinelService(
+            connectors=[sync_connector, _AsyncConnector()],
+            policy_engine=_policy(),
+            planner=RuleBasedPlanner().plan,
+            executor=executor,
+            verifier=_AsyncVerifier(),
+            max_concurrent_incidents=2,
+        )
+
+        summary = await service.run_cycle(cycle_id="c1")
+
+        self.assertEqual(summary.incidents_seen, 2)
+        self.assertEqual(summary.actions_approved, 3)
+        self.assertEqual(summary.actions_succeeded, 3)
+        latencies = service.reporting.latency_snapshot()
+        for stage in ("stage_cycle", "stage_incident", "stage_execute", "stage_verify"):
+            self.assertIn(stage, latencies)
+        self.assertEqual(service.reporting.snapshot()["stage_incident_count"], 2)
+
+    async def test_connector_timeout_yields_partial_results(self) -> None:
+        service = AsyncSentinelService(
+            connectors=[_HangingConnector(), _AsyncConnector()],
+            policy_engine=_policy(),
+            planner=RuleBasedPlanner().plan,
+            executor=lambda _action: "ok",
+            verifier=VerificationService(),
+            connector_timeout_seconds=0.05,
+        )
+
+        summary = await service.run_cycle(cycle_id="c1")
+
+        self.assertEqual(summary.incidents_seen, 1)
+        self.assertEqual(service.reporting.snapshot()["connector_timeouts_hanging"], 1)
+
+    async def test_run_forever_stops_cleanly_on_cancel(self) -> None:
+        service = AsyncSentinelService(
+            connectors=[_AsyncConnector()],
+            policy_engine=_policy(),
+            planner=RuleBasedPlanner().plan,
+            executor=lambda _action: "ok",
+            verifier=VerificationService(),
+        )
+
+        task = asyncio.create_task(service.run_forever(interval_seconds=30))
+        while service.reporting.snapshot().get("incidents_seen", 0) < 1:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+        summaries = await service.run_forever(interval_seconds=0, max_cycles=2)
+        self.assertEqual([s.cycle_id for s in summaries], ["cycle-1", "cycle-2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
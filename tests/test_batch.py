@@ -0,0 +1,104 @@
+import unittest
+
+from openclaw_sentinel.batch import IncidentBatch
+from openclaw_sentinel.connectors import GrafanaConnector
+from openclaw_sentinel.dedup import IncidentDeduplicator
+from openclaw_sentinel.models import Action, AutonomyLevel, Incident
+from openclaw_sentinel.planner import RuleBasedPlanner
+from openclaw_sentinel.policy import PolicyRegistry, PolicyRule
+from openclaw_sentinel.service import SentinelService
+from openclaw_sentinel.verification import VerificationService
+
+SEVERITIES = ("critical", "high", "low")
+
+
+def _alerts(count: int):
+    return [
+        {
+            "id": f"a{n}",
+            "tenant_id": f"t{n % 3}",
+            "severity": SEVERITIES[n % len(SEVERITIES)],
+            "name": "Latency high",
+            "rule_uid": f"r-{n % 4}",
+        }
+        for n in range(count)
+    ]
+
+
+class IncidentBatchTests(unittest.TestCase):
+    def test_round_trips_incidents_with_dictionary_encoded_tags(self) -> None:
+        incidents = list(GrafanaConnector(raw_alerts=_alerts(40)).fetch_incidents())
+        batch = IncidentBatch.from_incidents(incidents)
+
+        self.assertEqual(len(batch), 40)
+        self.assertEqual(list(batch), incidents)
+        self.assertEqual(len(batch.tag_dictionary), 4)
+        self.assertIs(batch.tags(0), batch.tags(4))
+        self.assertEqual(list(batch.select([3, 1])), [incidents[3], incidents[1]])
+
+    def test_plan_batch_matches_per_incident_plan(self) -> None:
+        planner = RuleBasedPlanner()
+        batch = GrafanaConnector(raw_alerts=_alerts(30), columnar=True).fetch_incidents()
+
+        bulk = {
+            (template.bind(batch.ids[row], batch.tenant_ids[row]), template.risk)
+            for template, rows in planner.plan_batch(batch)
+            for row in rows
+        }
+        scalar = [pair for incident in batch for pair in planner.plan(incident)]
+
+        self.assertEqual(len(scalar), 30)
+        self.assertEqual(bulk, set(scalar))
+
+
+class BulkServiceTests(unittest.TestCase):
+    def _service(self, columnar: bool, executed: list) -> SentinelService:
+        planner = RuleBasedPlanner()
+
+        def executor(action: Action) -> str:
+            executed.append(action.id)
+            return "ok"
+
+        return SentinelService(
+            connectors=[GrafanaConnector(raw_alerts=_alerts(60), columnar=columnar)],
+            policy_engine=PolicyRegistry(
+                [
+                    PolicyRule(
+                        tenant_id="t0",
+                        max_autonomy=AutonomyLevel.L2_BOUNDED_AUTO,
+                        allowlisted_action_types={"restart_service", "scale_worker"},
+                    ),
+                    PolicyRule(
+                        tenant_id="t1",
+                        max_autonomy=AutonomyLevel.L2_BOUNDED_AUTO,
+                        allowlisted_action_types={"restart_service"},
+                    ),
+                ]
+            ),
+            planner=planner.plan,
+            executor=executor,
+            verifier=VerificationService(),
+            batch_planner=planner.plan_batch,
+            deduplicator=IncidentDeduplicator(),
+        )
+
+    def test_bulk_path_matches_per_incident_path(self) -> None:
+        executed_scalar, executed_bulk = [], []
+        scalar = self._service(False, executed_scalar)
+        bulk = self._service(True, executed_bulk)
+
+        for cycle in ("c1", "c2"):
+            self.assertEqual(bulk.run_cycle(cycle), scalar.run_cycle(cycle))
+
+        self.assertEqual(sorted(executed_bulk), sorted(executed_scalar))
+        self.assertEqual(bulk.reporting.counter_snapshot(timings=False), scalar.reporting.counter_snapshot(timings=False))
+        self.assertEqual(bulk.reporting.snapshot()["dedup_hits"], 60)
+
+    def test_batch_is_still_an_iterable_of_incidents(self) -> None:
+        batch = IncidentBatch()
+        batch.append("i1", "t1", "grafana", "critical", "slow")
+        self.assertEqual(next(iter(batch)), Incident(id="i1", tenant_id="t1", source="grafana", severity="critical", summary="slow"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,10 @@
+import contextlib
+import io
+import json
 import os
 import unittest
 
-from openclaw_sentinel.cli import main
+from openclaw_sentinel.cli import _cron_job, _demo_service, main
 
 
 class CLITests(unittest.TestCase):
@@ -16,6 +19,34 @@ class CLITests(unittest.TestCase):
         rc = main(["--mode", "demo", "--cycles", "1"])
         self.assertEqual(rc, 0)
 
+    def test_stream_mode_prints_ndjson(self) -> None:
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            rc = main(["--mode", "demo", "--cycles", "3", "--stream"])
+
+        self.assertEqual(rc, 0)
+        lines = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual([line["summary"]["cycle_id"] for line in lines[:3]], ["cycle-1", "cycle-2", "cycle-3"])
+        self.assertEqual(lines[3]["rolling"]["totals"]["cycles"], 3)
+
+    def test_fetch_deadlines_require_fan_out(self) -> None:
+        with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            main(["--mode", "demo", "--cycles", "1", "--connector-timeout", "5"])
+
+    def test_cron_job_can_target_one_connector_group(self) -> None:
+        service = _demo_service()
+        summaries = []
+        job = _cron_job(service, "grafana=*/5 * * * *", 1, "skip", summaries.append)
+        job.run("cron-grafana-1")
+
+        self.assertEqual(job.name, "cron-grafana-1")
+        self.assertEqual([c.source_name for c in service.connectors], ["datadog", "grafana"])
+        self.assertEqual(summaries[0].cycle_id, "cron-grafana-1")
+        with self.assertRaises(SystemExit):
+            _cron_job(service, "pagerduty=* * * * *", 2, "skip", summaries.append)
+        with self.assertRaises(SystemExit):
+            _cron_job(service, "grafana=0 0 30 2 *", 3, "skip", summaries.append)
+
     def test_live_mode_fails_without_required_env(self) -> None:
         for key in [
             "OPENCLAW_TENANT_ID",
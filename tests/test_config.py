@@ -1,7 +1,10 @@
+import json
 import os
+import tempfile
 import unittest
 
-from openclaw_sentinel.config import load_live_config
+from openclaw_sentinel.config import load_live_config, load_policy_rules
+from openclaw_sentinel.models import AutonomyLevel
 
 
 class ConfigTests(unittest.TestCase):
@@ -31,6 +34,22 @@ class ConfigTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             load_live_config()
 
+    def test_load_policy_rules_from_json(self) -> None:
+        rules = [
+            {"tenant_id": "t1", "autonomy_level": "l2", "allowlisted_action_types": ["restart_service"]},
+            {"tenant_id": "t2", "blocked_commands": ["rm -rf"], "max_risk_score_for_auto": 1.5},
+        ]
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as fh:
+            json.dump(rules, fh)
+        self.addCleanup(os.unlink, fh.name)
+
+        loaded = load_policy_rules(fh.name)
+
+        self.assertEqual(loaded[0].max_autonomy, AutonomyLevel.L2_BOUNDED_AUTO)
+        self.assertEqual(loaded[0].allowlisted_action_types, {"restart_service"})
+        self.assertEqual(loaded[1].max_autonomy, AutonomyLevel.L1_ASSIST)
+        self.assertEqual(loaded[1].max_risk_score_for_auto, 1.5)
+
 
 if __name__ == "__main__":
     unittest.main()
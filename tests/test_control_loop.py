@@ -2,7 +2,7 @@ import unittest
 
 from openclaw_sentinel.control_loop import ControlLoop
 from openclaw_sentinel.models import Action, AutonomyLevel, Incident, RiskProfile
-from openclaw_sentinel.policy import PolicyEngine, PolicyRule
+from openclaw_sentinel.policy import PolicyEngine, PolicyRegistry, PolicyRule
 
 
 class ControlLoopTests(unittest.TestCase):
@@ -83,6 +83,57 @@ class ControlLoopTests(unittest.TestCase):
         self.assertFalse(result.decisions[0].approved)
         self.assertEqual(result.decisions[0].reason, "tenant_mismatch")
 
+    def test_uses_policy_registry_for_other_tenants(self) -> None:
+        def planner(incident: Incident):
+            yield (
+                Action(
+                    id="a-t2",
+                    incident_id=incident.id,
+                    tenant_id="t2",
+                    action_type="restart_service",
+                    command="systemctl restart worker",
+                ),
+                RiskProfile(impact=1, blast_radius=1, reversibility=5, confidence=0.95),
+            )
+
+        registry = PolicyRegistry(
+            PolicyRule(
+                tenant_id=tenant,
+                max_autonomy=AutonomyLevel.L2_BOUNDED_AUTO,
+                allowlisted_action_types={"restart_service"},
+            )
+            for tenant in ("t1", "t2")
+        )
+        loop = ControlLoop(registry, planner=planner, executor=lambda _a: "ok")
+        result = loop.run_once(self._incident())
+
+        self.assertTrue(result.decisions[0].approved)
+        self.assertEqual(loop.execution_log, ["a-t2:ok"])
+
+    def test_execution_log_is_bounded(self) -> None:
+        def planner(incident: Incident):
+            yield (
+                Action(
+                    id=f"{incident.id}-a",
+                    incident_id=incident.id,
+                    tenant_id="t1",
+                    action_type="restart_service",
+                    command="systemctl restart worker",
+                ),
+                RiskProfile(impact=1, blast_radius=1, reversibility=5, confidence=0.9),
+            )
+
+        rule = PolicyRule(
+            tenant_id="t1",
+            max_autonomy=AutonomyLevel.L2_BOUNDED_AUTO,
+            allowlisted_action_types={"restart_service"},
+        )
+        loop = ControlLoop(PolicyEngine(rule), planner=planner, executor=lambda _a: "ok", max_log_entries=2)
+        for n in range(5):
+            loop.run_once(Incident(id=f"i{n}", tenant_id="t1", source="datadog", severity="high", summary="s"))
+
+        self.assertEqual(loop.execution_log, ["i3-a:ok", "i4-a:ok"])
+
 
 if __name__ == "__main__":
     unittest.main()
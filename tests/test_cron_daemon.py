@@ -0,0 +1,171 @@
+import threading
+import unittest
+from datetime import datetime, timedelta
+
+from openclaw_sentinel.cron_daemon import CronDaemon, CronJob
+from openclaw_sentinel.reporting import ReportingStore
+from openclaw_sentinel.scheduler import CronSchedule
+
+
+class _Clock:
+    """Wall and monotonic clocks that only move when the test says so."""
+
+    def __init__(self, start: datetime) -> None:
+        self.wall = start
+        self.mono = 1000.0
+
+    def now(self) -> datetime:
+        return self.wall
+
+    def monotonic(self) -> float:
+        return self.mono
+
+    def advance(self, seconds: float, wall_only: bool = False) -> None:
+        self.wall += timedelta(seconds=seconds)
+        if not wall_only:
+            self.mono += seconds
+
+
+class CronDaemonTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = _Clock(datetime(2026, 10, 18, 12, 0, 30))
+        self.calls = []
+
+    def _daemon(self, *jobs, **kwargs) -> CronDaemon:
+        daemon = CronDaemon(jobs=list(jobs), wall_clock=self.clock.now, monotonic=self.clock.monotonic, **kwargs)
+        self.addCleanup(daemon.stop)
+        return daemon
+
+    def _job(self, expression: str, name: str = "job", **kwargs) -> CronJob:
+        return CronJob(name=name, schedule=CronSchedule.parse(expression), run=self.calls.append, **kwargs)
+
+    def test_fires_on_schedule_from_one_heap(self) -> None:
+        daemon = self._daemon(self._job("* * * * *", name="every"), self._job("*/2 * * * *", name="even"))
+        self.assertEqual(daemon.tick(), 30.0)
+
+        self.clock.advance(30)
+        for _ in range(4):
+            daemon.tick()
+            daemon.wait_idle(5)
+            self.clock.advance(60)
+
+        self.assertEqual(sorted(self.calls), ["even-1", "even-2", "every-1", "every-2", "every-3", "every-4"])
+
+    def test_slow_runs_do_not_drift_later_fires(self) -> None:
+        job = self._job("* * * * *")
+        daemon = self._daemon(job)
+        self.clock.advance(30)
+        daemon.tick()
+        daemon.wait_idle(5)
+        # The run took 20s of wall time; the next fire is still at the top of the minute.
+        self.clock.advance(20)
+        self.assertEqual(daemon.tick(), 40.0)
+
+    def test_skip_policy_drops_missed_fires(self) -> None:
+        store = ReportingStore()
+        job = self._job("* * * * *")
+        daemon = self._daemon(job, reporting=store)
+        self.clock.advance(30 + 5 * 60 + 10)
+
+        with self.assertLogs("openclaw_sentinel.cron_daemon", "WARNING"):
+            daemon.tick()
+        daemon.wait_idle(5)
+
+        self.assertEqual((self.calls, job.skipped), ([], 6))
+        self.assertEqual(store.labeled_snapshot()["cron_fires_skipped"], {("job",): 6})
+        self.assertEqual(daemon.tick(), 50.0)
+
+    def test_run_once_policy_coalesces_missed_fires(self) -> None:
+        job = self._job("* * * * *", catch_up="run_once")
+        daemon = self._daemon(job)
+        self.clock.advance(30 + 5 * 60 + 10)
+
+        with self.assertLogs("openclaw_sentinel.cron_daemon", "WARNING"):
+            daemon.tick()
+        daemon.wait_idle(5)
+
+        self.assertEqual((self.calls, job.skipped), (["job-1"], 5))
+
+    def test_wall_clock_stepping_back_rearms_entry(self) -> None:
+        daemon = self._daemon(self._job("* * * * *"))
+        self.clock.mono += 30
+        self.clock.advance(-10, wall_only=True)
+        self.assertEqual(daemon.tick(), 40.0)
+        self.assertEqual(self.calls, [])
+
+    def test_overlapping_fire_is_not_started(self) -> None:
+        release = threading.Event()
+        started = []
+
+        def slow(run_id: str) -> None:
+            started.append(run_id)
+            release.wait(5)
+
+        job = CronJob(name="slow", schedule=CronSchedule.parse("* * * * *"), run=slow, catch_up="run_once")
+        daemon = self._daemon(job)
+        self.addCleanup(release.set)
+        self.clock.advance(30)
+        daemon.tick()
+        self.clock.advance(60)
+        with self.assertLogs("openclaw_sentinel.cron_daemon", "WARNING"):
+            daemon.tick()
+
+        self.assertEqual((started, job.overlaps), (["slow-1"], 1))
+        release.set()
+        for _ in range(500):
+            if len(started) == 2:
+                break
+            threading.Event().wait(0.01)
+        daemon.wait_idle(5)
+        # run_once defers exactly one run until the overlapping one finished.
+        self.assertEqual(started, ["slow-1", "slow-2"])
+
+    def test_run_returns_after_max_runs(self) -> None:
+        clock = self.clock
+
+        def advancing_wait_daemon() -> CronDaemon:
+            daemon = self._daemon(self._job("* * * * *"))
+            original_wait = daemon._cond.wait
+
+            def wait(timeout=None):
+                # Sleep in fake time, once the last run finished, so run() needs no real waits.
+                while daemon._active:
+                    original_wait(0.01)
+                clock.advance(timeout or 0)
+                return original_wait(0)
+
+            daemon._cond.wait = wait
+            return daemon
+
+        daemon = advancing_wait_daemon()
+        daemon.run(max_runs=3)
+        self.assertEqual(self.calls, ["job-1", "job-2", "job-3"])
+        self.assertEqual(daemon.started_runs, 3)
+
+    def test_run_returns_when_no_job_can_fire(self) -> None:
+        daemon = self._daemon()
+        runner = threading.Thread(target=daemon.run, daemon=True)
+        runner.start()
+        runner.join(5)
+        self.assertFalse(runner.is_alive())
+
+    def test_failures_are_counted_and_do_not_stop_the_daemon(self) -> None:
+        def boom(_run_id: str) -> None:
+            raise RuntimeError("boom")
+
+        job = CronJob(name="bad", schedule=CronSchedule.parse("* * * * *"), run=boom)
+        daemon = self._daemon(job)
+        self.clock.advance(30)
+        with self.assertLogs("openclaw_sentinel.cron_daemon", "ERROR"):
+            daemon.tick()
+            daemon.wait_idle(5)
+        self.assertEqual(job.failures, 1)
+        self.assertEqual(daemon.tick(), 60.0)
+
+    def test_rejects_unknown_catch_up_policy(self) -> None:
+        with self.assertRaises(ValueError):
+            self._job("* * * * *", catch_up="all")
+
+
+if __name__ == "__main__":
+    unittest.main()
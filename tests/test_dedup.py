@@ -0,0 +1,94 @@
+import unittest
+
+from openclaw_sentinel.connectors import StaticConnector
+from openclaw_sentinel.dedup import IncidentDeduplicator
+from openclaw_sentinel.models import Action, AutonomyLevel, Incident
+from openclaw_sentinel.planner import RuleBasedPlanner
+from openclaw_sentinel.policy import PolicyEngine, PolicyRule
+from openclaw_sentinel.service import SentinelService
+from openclaw_sentinel.verification import VerificationService
+
+
+def _incident(incident_id="LatencyHigh", **tags) -> Incident:
+    return Incident(
+        id=incident_id,
+        tenant_id="t1",
+        source="grafana",
+        severity="critical",
+        summary="Latency is high",
+        tags=tags or {"rule_uid": "r-1"},
+    )
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class IncidentDeduplicatorTests(unittest.TestCase):
+    def test_repeat_within_ttl_is_a_hit(self) -> None:
+        clock = _Clock()
+        dedup = IncidentDeduplicator(ttl_seconds=60, clock=clock)
+
+        self.assertFalse(dedup.seen(_incident()))
+        clock.now = 59
+        self.assertTrue(dedup.seen(_incident()))
+        clock.now = 61
+        self.assertFalse(dedup.seen(_incident()))
+        self.assertEqual((dedup.hits, dedup.misses), (1, 2))
+
+    def test_tags_are_part_of_the_fingerprint(self) -> None:
+        dedup = IncidentDeduplicator()
+        self.assertFalse(dedup.seen(_incident(rule_uid="r-1")))
+        self.assertFalse(dedup.seen(_incident(rule_uid="r-2")))
+
+    def test_evicts_least_recently_used_beyond_max_entries(self) -> None:
+        dedup = IncidentDeduplicator(max_entries=2)
+        dedup.seen(_incident("a"))
+        dedup.seen(_incident("b"))
+        dedup.seen(_incident("a"))
+        dedup.seen(_incident("c"))
+
+        self.assertEqual(len(dedup), 2)
+        self.assertTrue(dedup.seen(_incident("a")))
+        self.assertFalse(dedup.seen(_incident("b")))
+
+    def test_service_skips_planner_and_executor_for_repeats(self) -> None:
+        executed = []
+
+        def executor(action: Action) -> str:
+            executed.append(action.id)
+            return "ok"
+
+        service = SentinelService(
+            connectors=[StaticConnector(source_name="grafana", incidents=[_incident()])],
+            policy_engine=PolicyEngine(
+                PolicyRule(
+                    tenant_id="t1",
+                    max_autonomy=AutonomyLevel.L2_BOUNDED_AUTO,
+                    allowlisted_action_types={"restart_service", "scale_worker"},
+                )
+            ),
+            planner=RuleBasedPlanner().plan,
+            executor=executor,
+            verifier=VerificationService(),
+            deduplicator=IncidentDeduplicator(),
+        )
+
+        first = service.run_cycle(cycle_id="c1")
+        second = service.run_cycle(cycle_id="c2")
+
+        self.assertEqual(first.actions_approved, 2)
+        self.assertEqual(second.incidents_seen, 1)
+        self.assertEqual(second.actions_approved, 0)
+        self.assertEqual(len(executed), 2)
+        metrics = service.reporting.snapshot()
+        self.assertEqual(metrics["dedup_hits"], 1)
+        self.assertEqual(metrics["dedup_misses"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
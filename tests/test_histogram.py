@@ -0,0 +1,68 @@
+import math
+import random
+import unittest
+
+from openclaw_sentinel.histogram import MAX_BUCKETS, LatencyHistogram
+from openclaw_sentinel.reporting import ReportingStore
+
+
+def _exact(samples, q):
+    ordered = sorted(samples)
+    return ordered[math.ceil(q * len(ordered)) - 1]
+
+
+class LatencyHistogramTests(unittest.TestCase):
+    def test_quantiles_are_within_bucket_error(self) -> None:
+        rng = random.Random(3)
+        samples = [rng.lognormvariate(-4, 1.5) for _ in range(20_000)]
+        histogram = LatencyHistogram()
+        for sample in samples:
+            histogram.record(sample)
+
+        for q in (0.5, 0.95, 0.99):
+            self.assertAlmostEqual(histogram.quantile(q) / _exact(samples, q), 1.0, delta=0.03)
+        self.assertEqual(histogram.count, 20_000)
+        self.assertEqual(histogram.quantile(1.0), max(samples))
+
+    def test_merge_equals_recording_everything_in_one(self) -> None:
+        rng = random.Random(4)
+        left, right, combined = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for n in range(1000):
+            sample = rng.expovariate(20)
+            (left if n % 2 else right).record(sample)
+            combined.record(sample)
+
+        left.merge(right)
+
+        self.assertEqual(left.buckets, combined.buckets)
+        self.assertAlmostEqual(left.total_seconds, combined.total_seconds)
+        self.assertEqual(left.summary(), combined.summary())
+
+    def test_memory_is_bounded_for_extreme_values(self) -> None:
+        histogram = LatencyHistogram()
+        for exponent in range(-12, 12):
+            histogram.record(10.0**exponent)
+        histogram.record(0.0)
+        self.assertLessEqual(len(histogram.buckets), MAX_BUCKETS)
+        self.assertEqual(LatencyHistogram().quantile(0.99), 0.0)
+
+
+class ReportingLatencyTests(unittest.TestCase):
+    def test_timer_feeds_snapshot_percentiles_and_legacy_counters(self) -> None:
+        store = ReportingStore()
+        for ms in range(1, 101):
+            store.record_latency("connector_fetch_grafana", ms / 1000)
+        with self.assertRaises(RuntimeError), store.timer("stage_execute"):
+            raise RuntimeError("executor failed")
+
+        snapshot = store.snapshot()
+        self.assertEqual(snapshot["connector_fetch_grafana_count"], 100)
+        self.assertEqual(snapshot["connector_fetch_grafana_ms_total"], 5050)
+        self.assertAlmostEqual(snapshot["connector_fetch_grafana_p95_ms"], 95, delta=3)
+        self.assertEqual(snapshot["connector_fetch_grafana_max_ms"], 100)
+        self.assertEqual(snapshot["stage_execute_count"], 1)
+        self.assertNotIn("connector_fetch_grafana_p95_ms", store.counter_snapshot())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,15 +1,22 @@
 import json
 import unittest
+from urllib import parse
 
 from openclaw_sentinel.http_clients import DatadogAPIClient, GrafanaAPIClient
 
 
 class _FakeResponse:
     def __init__(self, payload):
-        self._payload = payload
+        self._body = json.dumps(payload).encode("utf-8")
+        self.reads = 0
 
-    def read(self):
-        return json.dumps(self._payload).encode("utf-8")
+    def read(self, amt=None):
+        self.reads += 1
+        if amt is None:
+            chunk, self._body = self._body, b""
+        else:
+            chunk, self._body = self._body[:amt], self._body[amt:]
+        return chunk
 
     def __enter__(self):
         return self
@@ -30,6 +37,43 @@ class HTTPClientTests(unittest.TestCase):
         data = client.fetch_events()
         self.assertEqual(data[0]["id"], "1")
 
+    def test_datadog_client_follows_page_cursor(self):
+        pages = {
+            None: {"data": [{"id": "1"}, {"id": "2"}], "meta": {"page": {"after": "c2"}}},
+            "c2": {"data": [{"id": "3"}], "meta": {"page": {}}},
+        }
+        seen_params = []
+
+        def opener(req, timeout=10):
+            params = dict(parse.parse_qsl(parse.urlsplit(req.full_url).query))
+            seen_params.append(params)
+            return _FakeResponse(pages[params.get("page[cursor]")])
+
+        client = DatadogAPIClient(base_url="https://api.datadog.test", api_key="k", app_key="a", opener=opener)
+        ids = [event["id"] for event in client.iter_events(since_ms=1000, limit=2)]
+
+        self.assertEqual(ids, ["1", "2", "3"])
+        self.assertEqual(seen_params[0]["filter[from]"], "1000")
+        self.assertEqual(seen_params[1]["page[cursor]"], "c2")
+
+        seen_params.clear()
+        client.stream_chunk_size = 7
+        streamed = [event["id"] for event in client.iter_events(since_ms=1000, limit=2, stream=True)]
+        self.assertEqual(streamed, ["1", "2", "3"])
+        self.assertEqual(seen_params[1]["page[cursor]"], "c2")
+
+    def test_streaming_yields_before_the_body_is_fully_read(self):
+        alerts = [{"labels": {"alertname": f"A{n}"}} for n in range(50)]
+        response = _FakeResponse({"alerts": alerts})
+        client = GrafanaAPIClient(
+            base_url="https://grafana.test", api_token="token", opener=lambda req, timeout=10: response, stream_chunk_size=16
+        )
+
+        stream = client.iter_alerts()
+        self.assertEqual(next(stream), alerts[0])
+        self.assertLess(response.reads, 5)
+        self.assertEqual([alerts[0]] + list(stream), alerts)
+
     def test_grafana_client_fetch_alerts(self):
         def opener(req, timeout=10):
             self.assertIn("/api/alertmanager/grafana/api/v2/alerts", req.full_url)
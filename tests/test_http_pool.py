@@ -0,0 +1,125 @@
+import gzip
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib import error, request
+
+from openclaw_sentinel.http_clients import DatadogAPIClient, GrafanaAPIClient
+from openclaw_sentinel.http_pool import PooledTransport
+from openclaw_sentinel.reporting import ReportingStore
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    paths = []
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.paths.append(self.path)
+        if self.path.startswith("/moved"):
+            self.send_response(302)
+            self.send_header("Location", "/api/v2/events?moved=1")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path.startswith("/missing"):
+            body = b'{"error": "not_found"}'
+            self.send_response(404)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        if self.path.startswith("/api/v2/events"):
+            payload = {"data": [{"id": "dd-1"}]}
+        else:
+            payload = [{"labels": {"alertname": "CPUHigh"}}]
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:
+        return
+
+
+class PooledTransportTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.server.daemon_threads = True
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        _Handler.paths = []
+
+    def test_reuses_keep_alive_connection_across_clients(self) -> None:
+        reporting = ReportingStore()
+        transport = PooledTransport(reporting=reporting)
+        self.addCleanup(transport.close)
+        datadog = DatadogAPIClient(base_url=self.base_url, api_key="k", app_key="a", opener=transport)
+        grafana = GrafanaAPIClient(base_url=self.base_url, api_token="t", opener=transport)
+
+        self.assertEqual(datadog.fetch_events()[0]["id"], "dd-1")
+        self.assertEqual(grafana.fetch_alerts()[0]["labels"]["alertname"], "CPUHigh")
+        self.assertEqual(datadog.fetch_events()[0]["id"], "dd-1")
+
+        self.assertEqual(transport.handshakes, 1)
+        self.assertEqual(transport.reuses, 2)
+        metrics = reporting.snapshot()
+        self.assertEqual(metrics["http_pool_handshakes"], 1)
+        self.assertEqual(metrics["http_pool_reuses"], 2)
+
+    def test_idle_timeout_forces_new_connection(self) -> None:
+        transport = PooledTransport(idle_timeout_seconds=-1)
+        self.addCleanup(transport.close)
+        client = GrafanaAPIClient(base_url=self.base_url, api_token="t", opener=transport)
+
+        client.fetch_alerts()
+        client.fetch_alerts()
+
+        self.assertEqual(transport.handshakes, 2)
+        self.assertEqual(transport.reuses, 0)
+
+    def test_http_errors_raise_and_keep_connection_usable(self) -> None:
+        transport = PooledTransport(max_connections_per_host=1)
+        self.addCleanup(transport.close)
+        client = GrafanaAPIClient(base_url=self.base_url, api_token="t", alert_path="/missing", opener=transport)
+
+        with self.assertRaises(error.HTTPError) as ctx:
+            client.fetch_alerts()
+        self.assertEqual(ctx.exception.code, 404)
+
+        client.alert_path = "/alerts"
+        self.assertEqual(len(client.fetch_alerts()), 1)
+        self.assertEqual(transport.handshakes, 1)
+
+    def test_follows_redirects_on_the_pooled_connection(self) -> None:
+        transport = PooledTransport(proxies={})
+        self.addCleanup(transport.close)
+
+        with transport(request.Request(f"{self.base_url}/moved"), timeout=5) as resp:
+            payload = json.loads(resp.read())
+
+        self.assertEqual(payload["data"][0]["id"], "dd-1")
+        self.assertEqual(_Handler.paths, ["/moved", "/api/v2/events?moved=1"])
+        self.assertEqual(transport.handshakes, 1)
+
+    def test_proxied_hosts_bypass_the_pool(self) -> None:
+        transport = PooledTransport(proxies={"http": self.base_url, "no": "localhost"})
+        self.addCleanup(transport.close)
+
+        with transport(request.Request("http://grafana.invalid/alerts"), timeout=5) as resp:
+            self.assertEqual(json.loads(resp.read())[0]["labels"]["alertname"], "CPUHigh")
+
+        self.assertEqual(_Handler.paths, ["http://grafana.invalid/alerts"])
+        self.assertEqual(transport.handshakes, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
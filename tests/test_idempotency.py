@@ -0,0 +1,153 @@
+import hashlib
+import hmac
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from openclaw_sentinel.api import handle_webhook
+from openclaw_sentinel.connectors import StaticConnector
+from openclaw_sentinel.idempotency import IN_PROGRESS, IdempotencyCache, SQLiteIdempotencyStore
+from openclaw_sentinel.models import Action, AutonomyLevel, Incident, RiskProfile
+from openclaw_sentinel.policy import PolicyEngine, PolicyRule
+from openclaw_sentinel.rate_limit import SlidingWindowRateLimiter
+from openclaw_sentinel.service import SentinelService
+from openclaw_sentinel.verification import VerificationService
+from openclaw_sentinel.webhooks import WebhookConfig, WebhookSecrets, parse_webhook
+
+
+class IdempotencyCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.now = 1000.0
+
+    def _cache(self, **kwargs) -> IdempotencyCache:
+        return IdempotencyCache(clock=lambda: self.now, **kwargs)
+
+    def test_first_caller_processes_and_repeats_get_cached_response(self) -> None:
+        cache = self._cache(ttl_seconds=60)
+        self.assertIsNone(cache.begin("k"))
+        self.assertEqual(cache.begin("k"), IN_PROGRESS)
+
+        cache.complete("k", (202, {"ok": True}))
+        self.assertEqual(cache.begin("k"), (202, {"ok": True}))
+
+        self.now += 61
+        self.assertIsNone(cache.begin("k"))
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+
+    def test_server_errors_are_not_cached(self) -> None:
+        cache = self._cache()
+        cache.begin("k")
+        cache.complete("k", (503, {"error": "queue_full"}))
+        self.assertIsNone(cache.begin("k"))
+
+    def test_lru_is_bounded(self) -> None:
+        cache = self._cache(max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.begin(key)
+            cache.complete(key, (202, {"key": key}))
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.begin("a"))
+
+    def test_store_survives_restart(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = os.path.join(tmp.name, "idempotency.db")
+        store = SQLiteIdempotencyStore(path)
+        cache = self._cache(store=store)
+        cache.begin("k")
+        cache.complete("k", (202, {"ticket_id": "t-1"}))
+        store.close()
+
+        reopened = SQLiteIdempotencyStore(path)
+        self.addCleanup(reopened.close)
+        self.assertEqual(self._cache(store=reopened).begin("k"), (202, {"ticket_id": "t-1"}))
+        self.now += 86401
+        self.assertIsNone(self._cache(store=reopened).begin("k"))
+
+
+class DeliveryIdTests(unittest.TestCase):
+    def test_provider_ids(self) -> None:
+        cfg = WebhookConfig(tenant_id="t1", secrets=WebhookSecrets(telegram_secret_token="s", twitter_signature_secret="x"))
+        headers = {"x-telegram-bot-api-secret-token": "s"}
+        update = json.dumps({"update_id": 9, "message": {"message_id": 1, "chat": {"id": 5}}}).encode("utf-8")
+        message = json.dumps({"message": {"message_id": 1, "chat": {"id": 5}}}).encode("utf-8")
+        self.assertEqual(parse_webhook("telegram", headers, update, cfg)[1], "update-9")
+        self.assertEqual(parse_webhook("telegram", headers, message, cfg)[1], "5-1")
+        self.assertIsNone(parse_webhook("telegram", headers, b"{}", cfg)[1])
+
+
+class WebhookIdempotencyTests(unittest.TestCase):
+    def test_retried_delivery_does_not_execute_again(self) -> None:
+        executed = []
+
+        def planner(incident: Incident):
+            yield (
+                Action(
+                    id=f"{incident.id}-a1",
+                    incident_id=incident.id,
+                    tenant_id=incident.tenant_id,
+                    action_type="restart_service",
+                    command="systemctl restart worker",
+                ),
+                RiskProfile(impact=1, blast_radius=1, reversibility=5, confidence=0.95),
+            )
+
+        service = SentinelService(
+            connectors=[StaticConnector(source_name="empty", incidents=[])],
+            policy_engine=PolicyEngine(
+                PolicyRule(
+                    tenant_id="t1", max_autonomy=AutonomyLevel.L2_BOUNDED_AUTO, allowlisted_action_types={"restart_service"}
+                )
+            ),
+            planner=planner,
+            executor=lambda action: executed.append(action.id) or "ok",
+            verifier=VerificationService(),
+        )
+        cfg = WebhookConfig(tenant_id="t1", secrets=WebhookSecrets(twilio_signature_secret="wa"))
+        cache = IdempotencyCache()
+        limiter = SlidingWindowRateLimiter(max_requests=10, window_seconds=60)
+
+        def deliver(raw: bytes):
+            signature = "sha256=" + hmac.new(b"wa", raw, hashlib.sha256).hexdigest()
+            return handle_webhook(
+                path="/webhook/whatsapp",
+                headers={"content-type": "application/x-www-form-urlencoded", "x-openclaw-signature": signature},
+                raw_body=raw,
+                service=service,
+                webhook_cfg=cfg,
+                limiter=limiter,
+                idempotency=cache,
+            )
+
+        first = deliver(b"Body=restart&MessageSid=SM1&From=+1000")
+        retry = deliver(b"Body=restart&MessageSid=SM1&From=+1000")
+        other = deliver(b"Body=restart&MessageSid=SM2&From=+1000")
+
+        self.assertEqual(first, retry)
+        self.assertEqual(first[0], 202)
+        self.assertEqual(executed, ["SM1-a1", "SM2-a1"])
+        self.assertEqual(other[1]["cycle_id"], "webhook-whatsapp-SM2")
+        self.assertEqual(service.reporting.counter_snapshot()["webhook_duplicates"], 1)
+
+    def test_concurrent_duplicates_see_in_progress(self) -> None:
+        cache = IdempotencyCache()
+        results = []
+        barrier = threading.Barrier(8)
+
+        def claim() -> None:
+            barrier.wait()
+            results.append(cache.begin("k"))
+
+        threads = [threading.Thread(target=claim) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results.count(None), 1)
+        self.assertEqual(results.count(IN_PROGRESS), 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from openclaw_sentinel.api import handle_ingest_status, handle_webhook
+from openclaw_sentinel.connectors import StaticConnector
+from openclaw_sentinel.ingest import IncidentIngestQueue, IngestQueueFull
+from openclaw_sentinel.models import Action, AutonomyLevel, Incident, RiskProfile
+from openclaw_sentinel.policy import PolicyEngine, PolicyRule
+from openclaw_sentinel.rate_limit import SlidingWindowRateLimiter
+from openclaw_sentinel.service import SentinelService
+from openclaw_sentinel.verification import VerificationService
+from openclaw_sentinel.webhooks import WebhookConfig, WebhookSecrets
+
+
+def _service(executor=lambda _a: "ok") -> SentinelService:
+    def planner(incident: Incident):
+        yield (
+            Action(
+                id=f"{incident.id}-a1",
+                incident_id=incident.id,
+                tenant_id=incident.tenant_id,
+                action_type="restart_service",
+                command="systemctl restart worker",
+            ),
+            RiskProfile(impact=1, blast_radius=1, reversibility=5, confidence=0.95),
+        )
+
+    return SentinelService(
+        connectors=[StaticConnector(source_name="empty", incidents=[])],
+        policy_engine=PolicyEngine(
+            PolicyRule(tenant_id="t1", max_autonomy=AutonomyLevel.L2_BOUNDED_AUTO, allowlisted_action_types={"restart_service"})
+        ),
+        planner=planner,
+        executor=executor,
+        verifier=VerificationService(),
+    )
+
+
+def _incident(n: int) -> Incident:
+    return Incident(id=f"tg-{n}", tenant_id="t1", source="telegram", severity="medium", summary="restart")
+
+
+def _blocking_executor():
+    entered, release = threading.Event(), threading.Event()
+
+    def executor(_action) -> str:
+        entered.set()
+        release.wait(5)
+        return "ok"
+
+    return executor, entered, release
+
+
+class IncidentIngestQueueTests(unittest.TestCase):
+    def _queue(self, service, **kwargs) -> IncidentIngestQueue:
+        ingest = IncidentIngestQueue(service=service, **kwargs)
+        self.addCleanup(ingest.close)
+        return ingest
+
+    def _wait_state(self, ingest, ticket_id, state):
+        for _ in range(500):
+            status = ingest.status(ticket_id)
+            if status and status["state"] == state:
+                return status
+            threading.Event().wait(0.01)
+        self.fail(f"ticket {ticket_id} never reached {state}: {ingest.status(ticket_id)}")
+
+    def test_submit_returns_before_the_incident_runs(self) -> None:
+        executor, entered, release = _blocking_executor()
+        self.addCleanup(release.set)
+        ingest = self._queue(_service(executor), workers=1)
+
+        ticket = ingest.submit(_incident(1), "webhook-telegram-tg-1")
+        self.assertTrue(entered.wait(5))
+        self.assertEqual(ingest.status(ticket)["state"], "running")
+
+        release.set()
+        status = self._wait_state(ingest, ticket, "done")
+        self.assertEqual(status["incident_id"], "tg-1")
+        self.assertEqual(status["summary"]["actions_succeeded"], 1)
+        self.assertIsNone(ingest.status("missing"))
+
+    def test_full_queue_rejects_new_incidents(self) -> None:
+        executor, entered, release = _blocking_executor()
+        service = _service(executor)
+        ingest = self._queue(service, workers=1, max_queue=1)
+        self.addCleanup(release.set)
+
+        ingest.submit(_incident(1), "c1")
+        self.assertTrue(entered.wait(5))
+        ingest.submit(_incident(2), "c2")
+        with self.assertRaises(IngestQueueFull):
+            ingest.submit(_incident(3), "c3")
+        self.assertEqual(service.reporting.counter_snapshot()["ingest_rejected_full"], 1)
+
+    def test_failures_are_reported_per_ticket(self) -> None:
+        def broken(_action) -> str:
+            raise RuntimeError("executor down")
+
+        ingest = self._queue(_service(broken), workers=1)
+        with self.assertLogs("openclaw_sentinel.ingest", "ERROR"):
+            ticket = ingest.submit(_incident(1), "c1")
+            status = self._wait_state(ingest, ticket, "failed")
+        self.assertEqual(status["error"], "RuntimeError")
+
+    def test_durable_queue_requeues_unfinished_incidents(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = os.path.join(tmp.name, "ingest.db")
+        executor, entered, release = _blocking_executor()
+        self.addCleanup(release.set)
+        crashed = IncidentIngestQueue(service=_service(executor), workers=1, path=path)
+        self.addCleanup(crashed.close)
+        first = crashed.submit(_incident(1), "c1")
+        second = crashed.submit(_incident(2), "c2")
+        self.assertTrue(entered.wait(5))
+
+        # A new process on the same file picks up both the running and the queued ticket.
+        restarted = self._queue(_service(), workers=2, path=path)
+        self.assertEqual(self._wait_state(restarted, first, "done")["incident_id"], "tg-1")
+        self.assertEqual(self._wait_state(restarted, second, "done")["incident_id"], "tg-2")
+        release.set()
+
+
+class WebhookIngestTests(unittest.TestCase):
+    def test_webhook_is_acknowledged_with_ticket_and_status_url(self) -> None:
+        service = _service()
+        ingest = IncidentIngestQueue(service=service, workers=1)
+        self.addCleanup(ingest.close)
+        cfg = WebhookConfig(tenant_id="t1", secrets=WebhookSecrets(telegram_secret_token="telegram-secret"))
+        raw = json.dumps({"message": {"message_id": 7, "text": "restart", "chat": {"id": 42}}}).encode("utf-8")
+
+        status, body = handle_webhook(
+            path="/webhook/telegram",
+            headers={"x-telegram-bot-api-secret-token": "telegram-secret", "content-type": "application/json"},
+            raw_body=raw,
+            service=service,
+            webhook_cfg=cfg,
+            limiter=SlidingWindowRateLimiter(max_requests=10, window_seconds=60),
+            ingest=ingest,
+        )
+
+        self.assertEqual((status, body["status"], body["incident_id"]), (202, "queued", "tg-7"))
+        self.assertEqual(body["status_url"], f"/webhook/status/{body['ticket_id']}")
+        for _ in range(500):
+            code, progress = handle_ingest_status(body["status_url"], ingest)
+            if progress["state"] == "done":
+                break
+            threading.Event().wait(0.01)
+        self.assertEqual((code, progress["summary"]["cycle_id"]), (200, "webhook-telegram-tg-7"))
+        self.assertEqual(handle_ingest_status("/webhook/status/unknown", ingest)[0], 404)
+        self.assertEqual(handle_ingest_status(body["status_url"], None)[0], 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import json
+import random
+import unittest
+
+from openclaw_sentinel.json_stream import iter_json_array
+
+
+def _chunks(data: bytes, rng: random.Random):
+    pos = 0
+    while pos < len(data):
+        size = rng.randint(1, 9)
+        yield data[pos : pos + size]
+        pos += size
+
+
+class JSONStreamTests(unittest.TestCase):
+    def test_matches_json_loads_for_any_chunking(self) -> None:
+        rng = random.Random(7)
+        items = [
+            {"id": n, "title": "déjà vu ✓", "score": 12345.678e-2, "ok": n % 2 == 0, "tags": [None, "x"]}
+            for n in range(30)
+        ] + [10**12, -0.5, "tail"]
+        for top in (items, {"meta": {"page": 1}, "data": items, "links": {"next": "c2"}}):
+            body = json.dumps(top, ensure_ascii=False, indent=1).encode("utf-8")
+            for _ in range(20):
+                extras = {}
+                self.assertEqual(list(iter_json_array(_chunks(body, rng), key="data", extras=extras)), items)
+                if isinstance(top, dict):
+                    self.assertEqual(extras, {"meta": {"page": 1}, "links": {"next": "c2"}})
+
+    def test_numbers_split_across_chunks_are_not_truncated(self) -> None:
+        self.assertEqual(list(iter_json_array([b"[12", b"34, 5", b"6]"])), [1234, 56])
+
+    def test_empty_and_missing_arrays(self) -> None:
+        self.assertEqual(list(iter_json_array([b" [ ] "])), [])
+        self.assertEqual(list(iter_json_array([b"{}"], key="data")), [])
+        extras = {}
+        self.assertEqual(list(iter_json_array([b'{"data": null}'], key="data", extras=extras)), [])
+        self.assertEqual(extras, {"data": None})
+
+    def test_truncated_or_malformed_input_raises(self) -> None:
+        for body in (b'[{"id": 1}, {"id"', b'[1 2]', b'{"data": [1]', b"nope"):
+            with self.subTest(body=body), self.assertRaises(ValueError):
+                list(iter_json_array([body], key="data"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,18 @@
+import threading
+import types
 import unittest
 
 from openclaw_sentinel.live_connectors import LiveDatadogConnector, LiveGrafanaConnector
+from openclaw_sentinel.models import AutonomyLevel
+from openclaw_sentinel.policy import PolicyEngine, PolicyRule
+from openclaw_sentinel.service import SentinelService
+from openclaw_sentinel.verification import VerificationService
 
 
 class _DDClient:
+    def stream_events(self):
+        yield from self.fetch_events()
+
     def fetch_events(self):
         return [
             {
@@ -31,6 +40,20 @@ class _GrafanaClient:
         ]
 
 
+class _PagedDDClient:
+    def __init__(self):
+        self.events = []
+        self.calls = []
+
+    def iter_events(self, query, since_ms=None, limit=50, max_pages=100):
+        self.calls.append(since_ms)
+        return [e for e in self.events if e["attributes"]["timestamp"] >= since_ms]
+
+
+def _dd_event(event_id, timestamp_ms):
+    return {"id": event_id, "attributes": {"title": event_id, "status": "high", "timestamp": timestamp_ms}}
+
+
 class LiveConnectorTests(unittest.TestCase):
     def test_live_datadog_connector_maps_incident(self):
         connector = LiveDatadogConnector(client=_DDClient(), tenant_id="t1")
@@ -38,12 +61,96 @@ class LiveConnectorTests(unittest.TestCase):
         self.assertEqual(items[0].tenant_id, "t1")
         self.assertEqual(items[0].tags["monitor_id"], "m-1")
 
+    def test_incremental_datadog_connector_only_returns_new_events(self):
+        client = _PagedDDClient()
+        client.events = [_dd_event("e1", 5_000), _dd_event("e2", 6_000)]
+        connector = LiveDatadogConnector(
+            client=client, tenant_id="t1", incremental=True, lookback_seconds=10, clock=lambda: 10.0
+        )
+
+        def poll():
+            fetch = connector.fetch_incidents()
+            fetch.commit()
+            return [i.id for i in fetch]
+
+        first = poll()
+        client.events.append(_dd_event("e3", 6_000))
+        client.events.append(_dd_event("e4", 7_000))
+        second = poll()
+        third = poll()
+
+        self.assertEqual(first, ["e1", "e2"])
+        self.assertEqual(second, ["e3", "e4"])
+        self.assertEqual(third, [])
+        self.assertEqual(client.calls, [0, 6_000, 7_000])
+        self.assertEqual(connector.watermarks.get("t1", "status:error").ids, frozenset({"e4"}))
+
+    def test_incremental_datadog_connector_parses_iso_timestamps(self):
+        client = _PagedDDClient()
+        connector = LiveDatadogConnector(client=client, tenant_id="t1", incremental=True, clock=lambda: 10.0)
+        client.iter_events = lambda query, since_ms=None, limit=50, max_pages=100: [
+            {"id": "e1", "attributes": {"title": "x", "timestamp": "1970-01-01T00:00:20Z"}}
+        ]
+
+        fetch = connector.fetch_incidents()
+        self.assertIsNone(connector.watermarks.get("t1", "status:error"))
+        fetch.commit()
+
+        self.assertEqual(connector.watermarks.get("t1", "status:error").timestamp_ms, 20_000)
+
+    def test_abandoned_incremental_poll_does_not_move_watermark(self):
+        client = _PagedDDClient()
+        client.events = [_dd_event("e1", 5_000)]
+        release = threading.Event()
+        self.addCleanup(release.set)
+        paged = client.iter_events
+
+        def slow_iter_events(*args, **kwargs):
+            release.wait(5)
+            return paged(*args, **kwargs)
+
+        client.iter_events = slow_iter_events
+        connector = LiveDatadogConnector(
+            client=client, tenant_id="t1", incremental=True, lookback_seconds=10, clock=lambda: 10.0
+        )
+        service = SentinelService(
+            connectors=[connector],
+            policy_engine=PolicyEngine(PolicyRule(tenant_id="t1", max_autonomy=AutonomyLevel.L0_OBSERVE)),
+            planner=lambda _incident: [],
+            executor=lambda _action: "ok",
+            verifier=VerificationService(),
+            fetch_workers=2,
+            connector_timeout_seconds=0.1,
+        )
+        self.addCleanup(service.close)
+
+        self.assertEqual(service.run_cycle(cycle_id="cycle-1").incidents_seen, 0)
+        # The abandoned fetch completes in the background but is never committed.
+        release.set()
+        service._fetches[id(connector)].result(timeout=5)
+        self.assertIsNone(connector.watermarks.get("t1", "status:error"))
+
+        self.assertEqual(service.run_cycle(cycle_id="cycle-2").incidents_seen, 1)
+        self.assertEqual(connector.watermarks.get("t1", "status:error").ids, frozenset({"e1"}))
+
     def test_live_grafana_connector_maps_incident(self):
         connector = LiveGrafanaConnector(client=_GrafanaClient(), tenant_id="t1")
         items = list(connector.fetch_incidents())
         self.assertEqual(items[0].severity, "critical")
         self.assertEqual(items[0].summary, "Latency is high")
 
+    def test_streaming_connector_is_a_generator(self):
+        datadog = LiveDatadogConnector(client=_DDClient(), tenant_id="t1", streaming=True).fetch_incidents()
+
+        self.assertIsInstance(datadog, types.GeneratorType)
+        self.assertEqual(next(datadog).id, "dd1")
+
+    def test_live_grafana_connector_columnar_matches_objects(self):
+        objects = LiveGrafanaConnector(client=_GrafanaClient(), tenant_id="t1").fetch_incidents()
+        batch = LiveGrafanaConnector(client=_GrafanaClient(), tenant_id="t1", columnar=True).fetch_incidents()
+        self.assertEqual(batch.severities, ["critical"])
+        self.assertEqual(list(batch), list(objects))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,156 @@
+import gzip
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from openclaw_sentinel.http_pool import PooledTransport
+from openclaw_sentinel.metrics_exporter import GAUGE, DatadogMetricsExporter
+from openclaw_sentinel.reporting import ReportingStore
+
+
+class _IntakeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:  # noqa: N802
+        body = self.rfile.read(int(self.headers.get("Content-Length", "0")))
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        intake = self.server.intake
+        intake["gate"].wait(5)
+        with intake["lock"]:
+            status = intake["statuses"].pop(0) if intake["statuses"] else 202
+            intake["requests"].append((self.path, self.headers.get("DD-API-KEY"), json.loads(body), status))
+        self.send_response(status)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, format, *args) -> None:
+        return
+
+
+class DatadogMetricsExporterTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _IntakeHandler)
+        self.server.daemon_threads = True
+        self.gate = threading.Event()
+        self.gate.set()
+        self.server.intake = {"gate": self.gate, "lock": threading.Lock(), "statuses": [], "requests": []}
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.addCleanup(self.gate.set)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.transport = PooledTransport()
+        self.addCleanup(self.transport.close)
+
+    def _exporter(self, **kwargs) -> DatadogMetricsExporter:
+        kwargs.setdefault("flush_interval_seconds", 60.0)
+        kwargs.setdefault("backoff_base_seconds", 0.001)
+        exporter = DatadogMetricsExporter(base_url=self.base_url, api_key="k", opener=self.transport, **kwargs)
+        self.addCleanup(exporter.close)
+        return exporter
+
+    def _points(self):
+        return [
+            (series["metric"], point["value"], tuple(series["tags"]))
+            for _path, _key, payload, status in self.server.intake["requests"]
+            if status < 300
+            for series in payload["series"]
+            for point in series["points"]
+        ]
+
+    def test_flushes_full_batches_without_waiting_for_interval(self) -> None:
+        exporter = self._exporter(batch_size=2)
+        exporter.submit("a", 1, tags=["env:test"], timestamp=100)
+        exporter.submit("a", 2, tags=["env:test"], timestamp=110)
+        exporter.submit("b", 3, timestamp=100)
+        self.assertTrue(exporter.flush(timeout=5))
+
+        requests = self.server.intake["requests"]
+        self.assertEqual(len(requests), 2)
+        path, api_key, payload, _status = requests[0]
+        self.assertEqual((path, api_key), ("/api/v2/series", "k"))
+        self.assertEqual(
+            payload["series"],
+            [
+                {
+                    "metric": "a",
+                    "type": GAUGE,
+                    "points": [{"timestamp": 100, "value": 1.0}, {"timestamp": 110, "value": 2.0}],
+                    "tags": ["env:test"],
+                }
+            ],
+        )
+        self.assertEqual(exporter.sent, 3)
+
+    def test_retries_server_errors_but_not_client_errors(self) -> None:
+        self.server.intake["statuses"] = [503, 429]
+        exporter = self._exporter()
+        exporter.submit("a", 1)
+        exporter.flush(timeout=5)
+        self.assertEqual((exporter.sent, exporter.retries, exporter.failed), (1, 2, 0))
+
+        self.server.intake["statuses"] = [400]
+        exporter.submit("b", 1)
+        with self.assertLogs("openclaw_sentinel.metrics_exporter", "WARNING"):
+            exporter.flush(timeout=5)
+        self.assertEqual((exporter.sent, exporter.retries, exporter.failed), (1, 2, 1))
+        self.assertEqual(self._points(), [("a", 1.0, ())])
+
+    def test_gives_up_after_max_retries(self) -> None:
+        self.server.intake["statuses"] = [500, 500, 500]
+        exporter = self._exporter(max_retries=2)
+        exporter.submit("a", 1)
+        with self.assertLogs("openclaw_sentinel.metrics_exporter", "WARNING"):
+            exporter.flush(timeout=5)
+        self.assertEqual((exporter.sent, exporter.retries, exporter.failed), (0, 2, 1))
+
+    def _fill_while_sender_is_stuck(self, exporter: DatadogMetricsExporter) -> None:
+        self.gate.clear()
+        exporter.submit("stuck", 0)
+        # The sender picks up the first point and blocks in the POST; the rest queue up.
+        for _ in range(200):
+            if not exporter._points:
+                break
+            threading.Event().wait(0.005)
+        for value in range(1, 5):
+            exporter.submit("q", value)
+        self.gate.set()
+        exporter.flush(timeout=5)
+
+    def test_drop_newest_keeps_oldest_points(self) -> None:
+        exporter = self._exporter(batch_size=1, max_queue=2)
+        self._fill_while_sender_is_stuck(exporter)
+        self.assertEqual(exporter.dropped, 2)
+        self.assertEqual([value for name, value, _ in self._points() if name == "q"], [1.0, 2.0])
+
+    def test_drop_oldest_keeps_newest_points(self) -> None:
+        exporter = self._exporter(batch_size=1, max_queue=2, overflow="drop_oldest")
+        self._fill_while_sender_is_stuck(exporter)
+        self.assertEqual(exporter.dropped, 2)
+        self.assertEqual([value for name, value, _ in self._points() if name == "q"], [3.0, 4.0])
+
+    def test_exports_store_snapshot_with_labels_as_tags(self) -> None:
+        store = ReportingStore()
+        store.increment("cycles", 2)
+        store.increment_labeled("blocked_reason", ("allowlist",))
+        store.record_latency("stage_plan", 0.01)
+        exporter = self._exporter(reporting=store)
+        exporter.flush(timeout=5)
+
+        points = self._points()
+        self.assertIn(("openclaw_sentinel.cycles", 2.0, ()), points)
+        self.assertIn(("openclaw_sentinel.blocked_reason", 1.0, ("reason:allowlist",)), points)
+        self.assertIn("openclaw_sentinel.stage_plan.p95_ms", {name for name, _, _ in points})
+        self.assertEqual(store.counter_snapshot()["datadog_export_sent"], len(points))
+
+    def test_rejects_unknown_overflow_policy(self) -> None:
+        with self.assertRaises(ValueError):
+            DatadogMetricsExporter(base_url=self.base_url, api_key="k", overflow="spill")
+
+
+if __name__ == "__main__":
+    unittest.main()
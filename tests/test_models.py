@@ -0,0 +1,55 @@
+import dataclasses
+import json
+import pickle
+import unittest
+
+from openclaw_sentinel.models import Action, FrozenTags, Incident
+
+
+def _incident(incident_id: str = "i1", **tags) -> Incident:
+    return Incident(
+        id=incident_id,
+        tenant_id="".join("t1"),
+        source="".join("grafana"),
+        severity="critical",
+        summary="Latency is high",
+        tags=tags or {"rule_uid": "r-1"},
+    )
+
+
+class CompactModelTests(unittest.TestCase):
+    def test_equality_and_attribute_access_are_unchanged(self) -> None:
+        incident = _incident()
+
+        self.assertEqual(incident, _incident())
+        self.assertNotEqual(incident, _incident("i2"))
+        self.assertEqual(incident.tags, {"rule_uid": "r-1"})
+        self.assertEqual(incident.tags["rule_uid"], "r-1")
+        self.assertEqual(Incident(id="x", tenant_id="t", source="s", severity="low", summary="s").tags, {})
+        self.assertEqual(dataclasses.replace(incident, id="i2"), _incident("i2"))
+        self.assertFalse(hasattr(incident, "__dict__"))
+
+    def test_repeated_strings_and_tag_sets_are_shared(self) -> None:
+        first, second = _incident("i1"), _incident("i2")
+
+        self.assertIs(first.tenant_id, second.tenant_id)
+        self.assertIs(first.source, second.source)
+        self.assertIs(first.tags, second.tags)
+        action = Action(id="a1", incident_id="i1", tenant_id="".join("t1"), action_type="restart_service", command="c")
+        self.assertIs(action.tenant_id, first.tenant_id)
+
+    def test_tags_are_immutable_but_serialize_like_dicts(self) -> None:
+        incident = _incident()
+
+        with self.assertRaises(TypeError):
+            incident.tags["rule_uid"] = "r-2"
+        with self.assertRaises(TypeError):
+            incident.tags.update(extra="1")
+        self.assertIsInstance(incident.tags, FrozenTags)
+        self.assertEqual(json.loads(json.dumps(incident.tags)), {"rule_uid": "r-1"})
+        self.assertEqual(pickle.loads(pickle.dumps(incident)), incident)
+        self.assertEqual(hash(incident), hash(_incident()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import threading
+import time
+import unittest
+
+from openclaw_sentinel.connectors import StaticConnector
+from openclaw_sentinel.models import Action, AutonomyLevel, Incident
+from openclaw_sentinel.pipeline import PipelineConfig
+from openclaw_sentinel.planner import RuleBasedPlanner
+from openclaw_sentinel.policy import PolicyEngine, PolicyRule
+from openclaw_sentinel.service import SentinelService
+from openclaw_sentinel.verification import VerificationService
+
+
+def _incidents():
+    severities = ["critical", "high", "medium", "critical", "low", "high"]
+    return [
+        Incident(id=f"i{n}", tenant_id="t1" if n % 4 else "t2", source="datadog", severity=sev, summary="cpu")
+        for n, sev in enumerate(severities * 3)
+    ]
+
+
+class PipelineTests(unittest.TestCase):
+    def _service(self, executor, pipeline=None) -> SentinelService:
+        return SentinelService(
+            connectors=[StaticConnector(source_name="datadog", incidents=_incidents())],
+            policy_engine=PolicyEngine(
+                PolicyRule(
+                    tenant_id="t1",
+                    max_autonomy=AutonomyLevel.L2_BOUNDED_AUTO,
+                    allowlisted_action_types={"restart_service", "scale_worker"},
+                )
+            ),
+            planner=RuleBasedPlanner().plan,
+            executor=executor,
+            verifier=VerificationService(),
+            pipeline=pipeline,
+        )
+
+    def test_pipelined_summary_matches_sequential(self) -> None:
+        def executor(action: Action) -> str:
+            return "timeout" if action.incident_id == "i3" else "ok"
+
+        sequential = self._service(executor)
+        pipelined = self._service(executor, PipelineConfig(plan_workers=2, execute_workers=3, queue_size=2))
+
+        expected = sequential.run_cycle(cycle_id="c1")
+        actual = pipelined.run_cycle(cycle_id="c1")
+
+        self.assertEqual(actual, expected)
+        self.assertEqual(pipelined.reporting.counter_snapshot(timings=False), sequential.reporting.counter_snapshot(timings=False))
+
+    def test_actions_keep_plan_order_per_incident(self) -> None:
+        executed = []
+        lock = threading.Lock()
+
+        def executor(action: Action) -> str:
+            time.sleep(0.005)
+            with lock:
+                executed.append(action.id)
+            return "ok"
+
+        service = self._service(executor, PipelineConfig(plan_workers=1, execute_workers=4, queue_size=1))
+        service.run_cycle(cycle_id="c1")
+
+        for incident_id in {action_id.split(":")[0] for action_id in executed}:
+            per_incident = [a for a in executed if a.startswith(f"{incident_id}:")]
+            if len(per_incident) == 2:
+                self.assertEqual(per_incident, [f"{incident_id}:restart_worker", f"{incident_id}:scale_worker"])
+
+    def test_executor_error_propagates_to_caller(self) -> None:
+        def executor(_action: Action) -> str:
+            raise RuntimeError("kubectl unavailable")
+
+        service = self._service(executor, PipelineConfig(execute_workers=2))
+        with self.assertRaises(RuntimeError):
+            service.run_cycle(cycle_id="c1")
+
+    def test_rejects_empty_stage(self) -> None:
+        with self.assertRaises(ValueError):
+            PipelineConfig(execute_workers=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
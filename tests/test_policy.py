@@ -1,7 +1,10 @@
+import random
 import unittest
 
+from openclaw_sentinel import models
 from openclaw_sentinel.models import Action, AutonomyLevel, RiskProfile
-from openclaw_sentinel.policy import PolicyEngine, PolicyRule
+from openclaw_sentinel.policy import CommandMatcher, PolicyEngine, PolicyRegistry, PolicyRule
+from openclaw_sentinel.reporting import ReportingStore
 
 
 class PolicyEngineTests(unittest.TestCase):
@@ -67,6 +70,206 @@ class PolicyEngineTests(unittest.TestCase):
         self.assertTrue(decision.approved)
         self.assertEqual(decision.reason, "approved_for_auto")
 
+    def test_command_matcher_agrees_with_substring_scan(self) -> None:
+        rng = random.Random(7)
+        alphabet = "abc -/"
+        for _ in range(200):
+            patterns = {"".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(rng.randint(1, 12))}
+            matcher = CommandMatcher(patterns)
+            for _ in range(20):
+                command = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 16)))
+                expected = any(p in command for p in patterns)
+                self.assertEqual(matcher.search(command), expected, (patterns, command))
+
+    def test_empty_blocked_pattern_blocks_everything(self) -> None:
+        self.assertTrue(CommandMatcher({""}).search("systemctl restart worker"))
+
+    def test_rule_change_rebuilds_matcher(self) -> None:
+        action = Action(
+            id="a5",
+            incident_id="i1",
+            tenant_id="t1",
+            action_type="restart_service",
+            command="systemctl restart worker",
+        )
+        risk = RiskProfile(impact=1, blast_radius=1, reversibility=5, confidence=0.95)
+        version = self.rule.version
+        matcher = self.rule.command_matcher()
+        self.assertIs(self.rule.command_matcher(), matcher)
+        self.assertTrue(self.engine.evaluate(action, risk).approved)
+
+        self.rule.blocked_commands = self.rule.blocked_commands | {"systemctl restart"}
+
+        self.assertGreater(self.rule.version, version)
+        self.assertIsNot(self.rule.command_matcher(), matcher)
+        self.assertEqual(self.engine.evaluate(action, risk).reason, "command_blocked")
+
+    def test_in_place_set_edits_invalidate_caches(self) -> None:
+        action = Action(
+            id="a6",
+            incident_id="i1",
+            tenant_id="t1",
+            action_type="restart_service",
+            command="systemctl restart worker",
+        )
+        risk = RiskProfile(impact=1, blast_radius=1, reversibility=5, confidence=0.95)
+        self.assertTrue(self.engine.evaluate(action, risk).approved)
+
+        self.rule.blocked_commands.add("systemctl restart")
+        self.assertEqual(self.engine.evaluate(action, risk).reason, "command_blocked")
+
+        self.rule.blocked_commands.discard("systemctl restart")
+        self.rule.allowlisted_action_types.remove("restart_service")
+        self.assertEqual(self.engine.evaluate(action, risk).reason, "action_type_not_allowlisted")
+
+    def test_evaluate_batch_matches_scalar_path(self) -> None:
+        rng = random.Random(11)
+        actions, risks = [], []
+        for n in range(300):
+            actions.append(
+                Action(
+                    id=f"a{n}",
+                    incident_id="i1",
+                    tenant_id=rng.choice(["t1", "t1", "t2"]),
+                    action_type=rng.choice(["restart_service", "scale_worker", "delete_volume"]),
+                    command=rng.choice(["systemctl restart api", "rm -rf /tmp/x", "kubectl scale"]),
+                    requires_high_privilege=rng.random() < 0.1,
+                )
+            )
+            risks.append(
+                RiskProfile(
+                    impact=rng.randint(1, 5),
+                    blast_radius=rng.randint(1, 5),
+                    reversibility=rng.randint(1, 5),
+                    confidence=rng.random(),
+                )
+            )
+
+        self.assertEqual(self.engine.evaluate_batch(actions, risks), [self.engine.evaluate(a, r) for a, r in zip(actions, risks)])
+        with self.assertRaises(ValueError):
+            self.engine.evaluate_batch(actions, risks[:-1])
+
+
+class PolicyDecisionCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.rule = PolicyRule(
+            tenant_id="t1",
+            max_autonomy=AutonomyLevel.L2_BOUNDED_AUTO,
+            allowlisted_action_types={"restart_service"},
+            blocked_commands={"rm -rf"},
+        )
+        self.risk = RiskProfile(impact=1, blast_radius=1, reversibility=5, confidence=0.95)
+
+    def _action(self, n: int = 0, command: str = "systemctl restart api") -> Action:
+        return Action(
+            id=f"a{n}", incident_id=f"i{n}", tenant_id="t1", action_type="restart_service", command=command
+        )
+
+    def test_repeat_actions_hit_the_cache_and_keep_their_identity(self) -> None:
+        reporting = ReportingStore()
+        engine = PolicyEngine(self.rule, reporting=reporting)
+
+        first = engine.evaluate(self._action(1), self.risk)
+        second = engine.evaluate(self._action(2), self.risk)
+
+        self.assertEqual((first.approved, first.reason), (second.approved, second.reason))
+        self.assertEqual(second.action.id, "a2")
+        self.assertEqual((engine.hits, engine.misses), (1, 1))
+        self.assertEqual(engine.hit_rate(), 0.5)
+        metrics = reporting.snapshot()
+        self.assertEqual((metrics["policy_cache_hits"], metrics["policy_cache_misses"]), (1, 1))
+
+    def test_rule_change_invalidates_cached_decisions(self) -> None:
+        engine = PolicyEngine(self.rule)
+        self.assertTrue(engine.evaluate(self._action(), self.risk).approved)
+
+        self.rule.blocked_commands = {"systemctl"}
+        self.assertEqual(engine.evaluate(self._action(), self.risk).reason, "command_blocked")
+
+        engine.rule = PolicyRule(tenant_id="t1", allowlisted_action_types={"restart_service"})
+        self.assertEqual(engine.evaluate(self._action(), self.risk).reason, "autonomy_level_requires_human")
+        self.assertEqual(engine.hits, 0)
+
+    def test_cache_is_bounded_and_can_be_disabled(self) -> None:
+        engine = PolicyEngine(self.rule, cache_size=2)
+        for n in range(5):
+            engine.evaluate(self._action(command=f"restart {n}"), self.risk)
+        self.assertEqual(len(engine._cache), 2)
+
+        uncached = PolicyEngine(self.rule, cache_size=0)
+        uncached.evaluate(self._action(), self.risk)
+        uncached.evaluate(self._action(), self.risk)
+        self.assertEqual((uncached.hits, uncached.misses), (0, 0))
+
+    def test_batch_uses_and_fills_the_cache(self) -> None:
+        engine = PolicyEngine(self.rule)
+        actions = [self._action(n, command="rm -rf /" if n % 2 else "systemctl restart api") for n in range(6)]
+
+        decisions = engine.evaluate_batch(actions, [self.risk] * 6)
+
+        self.assertEqual([d.approved for d in decisions], [True, False] * 3)
+        self.assertEqual((engine.hits, engine.misses), (0, 6))
+        engine.evaluate_batch(actions, [self.risk] * 6)
+        self.assertEqual(engine.hits, 6)
+
+    def test_risk_score_is_memoized(self) -> None:
+        models._risk_score.cache_clear()
+        RiskProfile(2, 3, 4, 0.5).score()
+        RiskProfile(2, 3, 4, 0.5).score()
+        self.assertEqual(models._risk_score.cache_info().hits, 1)
+
+
+class PolicyRegistryTests(unittest.TestCase):
+    def _rule(self, tenant_id: str, **overrides) -> PolicyRule:
+        fields = dict(
+            tenant_id=tenant_id,
+            max_autonomy=AutonomyLevel.L2_BOUNDED_AUTO,
+            allowlisted_action_types={"restart_service"},
+            blocked_commands={"rm -rf"},
+        )
+        fields.update(overrides)
+        return PolicyRule(**fields)
+
+    def _action(self, tenant_id: str) -> Action:
+        return Action(
+            id=f"{tenant_id}-a",
+            incident_id="i1",
+            tenant_id=tenant_id,
+            action_type="restart_service",
+            command="systemctl restart worker",
+        )
+
+    def test_routes_by_action_tenant(self) -> None:
+        registry = PolicyRegistry(self._rule(f"t{n}") for n in range(1000))
+        registry.register(self._rule("t7", max_autonomy=AutonomyLevel.L1_ASSIST))
+        risk = RiskProfile(impact=1, blast_radius=1, reversibility=5, confidence=0.95)
+
+        self.assertEqual(len(registry), 1000)
+        self.assertTrue(registry.evaluate(self._action("t999"), risk).approved)
+        self.assertEqual(registry.evaluate(self._action("t7"), risk).reason, "autonomy_level_requires_human")
+        self.assertEqual(registry.evaluate(self._action("unknown"), risk).reason, "tenant_mismatch")
+
+    def test_evaluate_batch_scatters_results_back_in_order(self) -> None:
+        registry = PolicyRegistry([self._rule("t1"), self._rule("t2", max_autonomy=AutonomyLevel.L1_ASSIST)])
+        actions = [self._action(t) for t in ("t2", "t1", "unknown", "t1")]
+        risks = [RiskProfile(impact=1, blast_radius=1, reversibility=5, confidence=0.95)] * len(actions)
+
+        decisions = registry.evaluate_batch(actions, risks)
+
+        self.assertEqual(decisions, [registry.evaluate(a, r) for a, r in zip(actions, risks)])
+        self.assertEqual([d.action for d in decisions], actions)
+
+    def test_sync_only_replaces_changed_tenants(self) -> None:
+        registry = PolicyRegistry([self._rule("t1"), self._rule("t2"), self._rule("t3")])
+        untouched = registry.engine_for("t1")
+
+        changed = registry.sync([self._rule("t1"), self._rule("t2", blocked_commands={"drop"}), self._rule("t4")])
+
+        self.assertEqual(sorted(changed), ["t2", "t3", "t4"])
+        self.assertIs(registry.engine_for("t1"), untouched)
+        self.assertNotIn("t3", registry)
+        self.assertEqual(registry.engine_for("t2").rule.blocked_commands, {"drop"})
+
 
 if __name__ == "__main__":
     unittest.main()
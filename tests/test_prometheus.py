@@ -0,0 +1,97 @@
+import gzip
+import threading
+import unittest
+import urllib.request
+
+from openclaw_sentinel.api import serve
+from openclaw_sentinel.connectors import StaticConnector
+from openclaw_sentinel.policy import PolicyEngine, PolicyRule
+from openclaw_sentinel.prometheus import CONTENT_TYPE, PrometheusRenderer, accepts_gzip, render_prometheus
+from openclaw_sentinel.reporting import ReportingStore
+from openclaw_sentinel.service import SentinelService
+from openclaw_sentinel.verification import VerificationService
+
+
+class RenderPrometheusTests(unittest.TestCase):
+    def test_counters_labels_and_histograms(self) -> None:
+        store = ReportingStore()
+        store.increment("cycles", 3)
+        store.increment_labeled("blocked_reason", ('say "no"\n',))
+        for seconds in (0.0004, 0.003, 0.7, 90.0):
+            store.record_latency("stage_plan", seconds)
+
+        text = render_prometheus(store)
+
+        self.assertIn("# TYPE openclaw_sentinel_cycles_total counter\nopenclaw_sentinel_cycles_total 3\n", text)
+        self.assertIn('openclaw_sentinel_blocked_reason_total{reason="say \\"no\\"\\n"} 1\n', text)
+        self.assertIn("# TYPE openclaw_sentinel_stage_plan_seconds histogram\n", text)
+        self.assertIn('openclaw_sentinel_stage_plan_seconds_bucket{le="0.001"} 1\n', text)
+        self.assertIn('openclaw_sentinel_stage_plan_seconds_bucket{le="1"} 3\n', text)
+        self.assertIn('openclaw_sentinel_stage_plan_seconds_bucket{le="60"} 3\n', text)
+        self.assertIn('openclaw_sentinel_stage_plan_seconds_bucket{le="+Inf"} 4\n', text)
+        self.assertIn("openclaw_sentinel_stage_plan_seconds_count 4\n", text)
+        # The histogram already carries the count/sum record_latency mirrors into counters.
+        self.assertNotIn("stage_plan_count_total", text)
+        self.assertNotIn("stage_plan_ms_total_total", text)
+
+
+class PrometheusRendererTests(unittest.TestCase):
+    def test_renders_once_per_generation(self) -> None:
+        store = ReportingStore()
+        store.increment("cycles")
+        renderer = PrometheusRenderer(store)
+
+        first = renderer.render()
+        self.assertIs(renderer.render(), first)
+        self.assertEqual(renderer.renders, 1)
+
+        store.increment("cycles")
+        self.assertIn(b"openclaw_sentinel_cycles_total 2\n", renderer.render())
+        self.assertEqual(renderer.renders, 2)
+
+    def test_gzip_body_round_trips_and_is_cached(self) -> None:
+        store = ReportingStore()
+        store.increment("cycles")
+        renderer = PrometheusRenderer(store)
+
+        body = renderer.render(gzipped=True)
+        self.assertEqual(gzip.decompress(body), renderer.render())
+        self.assertIs(renderer.render(gzipped=True), body)
+        self.assertEqual(renderer.renders, 1)
+
+    def test_accepts_gzip(self) -> None:
+        self.assertTrue(accepts_gzip({"accept-encoding": "deflate, gzip;q=0.8"}))
+        self.assertFalse(accepts_gzip({"accept-encoding": "gzip;q=0"}))
+        self.assertFalse(accepts_gzip({"accept-encoding": "br"}))
+        self.assertFalse(accepts_gzip({}))
+
+
+class PrometheusEndpointTests(unittest.TestCase):
+    def test_endpoint_serves_exposition_text(self) -> None:
+        service = SentinelService(
+            connectors=[StaticConnector(source_name="datadog", incidents=[])],
+            policy_engine=PolicyEngine(PolicyRule(tenant_id="t1")),
+            planner=lambda _incident: [],
+            executor=lambda _action: "ok",
+            verifier=VerificationService(),
+        )
+        service.run_cycle("prom-test")
+        server = serve(service=service, host="127.0.0.1", port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics/prometheus"
+
+        with urllib.request.urlopen(url, timeout=5) as resp:
+            self.assertEqual(resp.headers["Content-Type"], CONTENT_TYPE)
+            plain = resp.read()
+        request = urllib.request.Request(url, headers={"Accept-Encoding": "gzip"})
+        with urllib.request.urlopen(request, timeout=5) as resp:
+            self.assertEqual(resp.headers["Content-Encoding"], "gzip")
+            self.assertEqual(gzip.decompress(resp.read()), plain)
+        self.assertIn(b"openclaw_sentinel_stage_cycle_seconds_count 1\n", plain)
+
+
+if __name__ == "__main__":
+    unittest.main()
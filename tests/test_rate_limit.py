@@ -1,6 +1,7 @@
+import threading
 import unittest
 
-from openclaw_sentinel.rate_limit import SlidingWindowRateLimiter
+from openclaw_sentinel.rate_limit import GCRARateLimiter, SlidingWindowRateLimiter
 
 
 class RateLimitTests(unittest.TestCase):
@@ -11,5 +12,61 @@ class RateLimitTests(unittest.TestCase):
         self.assertFalse(limiter.allow("k1"))
 
 
+class GCRARateLimiterTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.now = 100.0
+
+    def _limiter(self, **kwargs) -> GCRARateLimiter:
+        return GCRARateLimiter(clock=lambda: self.now, **kwargs)
+
+    def test_allows_burst_then_spaces_requests(self) -> None:
+        limiter = self._limiter(max_requests=3, window_seconds=60)
+        self.assertEqual([limiter.allow("k1") for _ in range(4)], [True, True, True, False])
+        self.assertTrue(limiter.allow("k2"))
+
+        self.now += 19
+        self.assertFalse(limiter.allow("k1"))
+        self.now += 1
+        self.assertTrue(limiter.allow("k1"))
+        self.assertFalse(limiter.allow("k1"))
+
+    def test_recovered_keys_are_evicted(self) -> None:
+        limiter = self._limiter(max_requests=2, window_seconds=10)
+        for index in range(1000):
+            limiter.allow(f"ip-{index}")
+        self.now += 5.1
+        limiter.allow("fresh")
+        self.assertEqual(len(limiter), 1)
+
+    def test_tracked_keys_are_capped(self) -> None:
+        limiter = self._limiter(max_requests=1, window_seconds=60, max_keys=3)
+        for key in ("a", "b", "c", "d"):
+            self.assertTrue(limiter.allow(key))
+        self.assertEqual(len(limiter), 3)
+        self.assertFalse(limiter.allow("d"))
+        # "a" was least recently seen and was forgotten, so it starts over.
+        self.assertTrue(limiter.allow("a"))
+
+    def test_thread_safe_admission_count(self) -> None:
+        limiter = self._limiter(max_requests=50, window_seconds=60)
+        allowed = []
+        barrier = threading.Barrier(8)
+
+        def hammer() -> None:
+            barrier.wait()
+            allowed.append(sum(limiter.allow("shared") for _ in range(100)))
+
+        threads = [threading.Thread(target=hammer) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sum(allowed), 50)
+
+    def test_rejects_invalid_limits(self) -> None:
+        with self.assertRaises(ValueError):
+            GCRARateLimiter(max_requests=0, window_seconds=60)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,9 @@
+import json
+import threading
 import unittest
 
-from openclaw_sentinel.reporting import ReportingStore
+from openclaw_sentinel.models import CycleSummary
+from openclaw_sentinel.reporting import ReportingStore, RollingCycleStats
 
 
 class ReportingTests(unittest.TestCase):
@@ -18,6 +21,93 @@ class ReportingTests(unittest.TestCase):
         self.assertIn("actions_approved: 3", digest)
         self.assertIn("approved_action_success_rate_pct: 66.67", digest)
 
+    def test_concurrent_increments_are_not_lost(self) -> None:
+        store = ReportingStore()
+        barrier = threading.Barrier(8)
+
+        def work() -> None:
+            barrier.wait()
+            for _ in range(5000):
+                store.increment("webhooks")
+                store.increment_labeled("incidents_by_source", ("t1", "slack"))
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        snapshot = store.snapshot()
+        self.assertEqual(snapshot["webhooks"], 40_000)
+        self.assertEqual(snapshot["incidents_by_source_t1_slack"], 40_000)
+
+    def test_shards_of_finished_threads_are_folded(self) -> None:
+        store = ReportingStore()
+        for _ in range(50):
+            thread = threading.Thread(target=store.increment, args=("requests",))
+            thread.start()
+            thread.join()
+        store.increment("requests")
+
+        self.assertLessEqual(len(store._shards), 2)
+        self.assertEqual(store.snapshot()["requests"], 51)
+
+    def test_labeled_counters_flatten_to_legacy_keys(self) -> None:
+        store = ReportingStore()
+        store.increment_labeled("blocked_reason", ("command_blocked",))
+        store.increment_labeled("blocked_reason", ("command_blocked",), 2)
+        store.restore({"blocked_reason_command_blocked": 1, "stage_plan_count": 2, "stage_plan_ms_total": 5})
+
+        self.assertEqual(store.snapshot()["blocked_reason_command_blocked"], 4)
+        self.assertEqual(store.labeled_snapshot(), {"blocked_reason": {("command_blocked",): 4}})
+        self.assertEqual(store.label_names["blocked_reason"], ("reason",))
+        self.assertEqual(store.latency_keys(), ["stage_plan"])
+
+    def test_counter_state_round_trips_labels(self) -> None:
+        store = ReportingStore()
+        store.increment("incidents_seen", 2)
+        store.increment_labeled("incidents_by_source", ("tenant_a", "grafana"))
+        store.record_latency("stage_plan", 0.01)
+
+        restored = ReportingStore()
+        restored.restore(json.loads(json.dumps(store.counter_state())))
+
+        self.assertEqual(restored.unlabeled_snapshot(), store.unlabeled_snapshot())
+        self.assertEqual(restored.labeled_snapshot(), {"incidents_by_source": {("tenant_a", "grafana"): 1}})
+        self.assertEqual(restored.latency_keys(), ["stage_plan"])
+
+    def test_counters_attribute_stays_compatible(self) -> None:
+        store = ReportingStore(counters={"incidents_seen": 3})
+        store.increment("incidents_seen")
+        store.counters["actions_failed"] = 2
+        store.counters["incidents_seen"] = 10
+
+        self.assertEqual(store.snapshot()["incidents_seen"], 10)
+        self.assertEqual(dict(store.counters), {"incidents_seen": 10, "actions_failed": 2})
+        store.counters = {"actions_failed": 1}
+        self.assertEqual(dict(store.counters), {"actions_failed": 1})
+        store.increment_labeled("blocked_reason", ("kill_switch",))
+        del store.counters["actions_failed"]
+        self.assertNotIn("actions_failed", store.counters)
+        self.assertEqual(dict(store.counters), {"blocked_reason_kill_switch": 1})
+        store.counters.clear()
+        self.assertEqual(len(store.counters), 0)
+        self.assertEqual(store.labeled_snapshot(), {})
+
+    def test_rolling_cycle_stats_keeps_fixed_number_of_windows(self) -> None:
+        now = [0.0]
+        stats = RollingCycleStats(window_seconds=3600, windows=2, clock=lambda: now[0])
+        for hour in range(4):
+            now[0] = hour * 3600 + 10
+            stats(CycleSummary("c", incidents_seen=2, actions_approved=1, actions_blocked=1, actions_succeeded=1))
+            stats(CycleSummary("c", incidents_seen=1, actions_approved=0, actions_blocked=0, actions_succeeded=0))
+
+        windows = stats.per_window()
+        self.assertEqual([w["window_start"] for w in windows], [7200, 10800])
+        self.assertEqual(windows[-1]["incidents_seen"], 3)
+        self.assertEqual(stats.totals["cycles"], 8)
+        self.assertEqual(stats.totals["incidents_seen"], 12)
+
 
 if __name__ == "__main__":
     unittest.main()
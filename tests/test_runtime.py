@@ -48,6 +48,15 @@ class RuntimeTests(unittest.TestCase):
         self.assertEqual(summaries[0].cycle_id, "cycle-1")
         self.assertEqual(summaries[1].cycle_id, "cycle-2")
 
+        streamed = []
+        returned = service.run_forever(interval_seconds=0, max_cycles=3, sink=streamed.append)
+        self.assertEqual(returned, [])
+        self.assertEqual([s.cycle_id for s in streamed], ["cycle-1", "cycle-2", "cycle-3"])
+
+        cycles = service.iter_cycles(interval_seconds=0)
+        self.assertEqual(next(cycles).cycle_id, "cycle-1")
+        self.assertEqual(next(cycles).cycle_id, "cycle-2")
+
 
 if __name__ == "__main__":
     unittest.main()
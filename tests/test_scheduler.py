@@ -1,9 +1,32 @@
+import random
 import unittest
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from openclaw_sentinel.scheduler import CronParseError, CronSchedule
 
 
+def _scan_next_after(schedule: CronSchedule, dt: datetime) -> datetime:
+    """The original minute-by-minute scanner, kept as the reference implementation."""
+    candidate = dt.replace(second=0, microsecond=0) + timedelta(minutes=1)
+    for _ in range(366 * 24 * 60):
+        if schedule.matches(candidate):
+            return candidate
+        candidate += timedelta(minutes=1)
+    raise CronParseError("unable to find next cron execution within search window")
+
+
+def _random_field(rng: random.Random, minimum: int, maximum: int, star_odds: float) -> str:
+    roll = rng.random()
+    if roll < star_odds:
+        return "*"
+    if roll < star_odds + 0.15:
+        return f"*/{rng.randint(1, maximum - minimum + 1)}"
+    if roll < star_odds + 0.3:
+        start = rng.randint(minimum, maximum)
+        return f"{start}-{rng.randint(start, maximum)}"
+    return ",".join(str(rng.randint(minimum, maximum)) for _ in range(rng.randint(1, 3)))
+
+
 class SchedulerTests(unittest.TestCase):
     def test_parse_and_match_every_five_minutes(self) -> None:
         sched = CronSchedule.parse("*/5 * * * *")
@@ -15,6 +38,53 @@ class SchedulerTests(unittest.TestCase):
         nxt = sched.next_after(datetime(2026, 2, 15, 14, 5, 22))
         self.assertEqual(nxt, datetime(2026, 2, 15, 14, 30))
 
+    def test_next_after_crosses_month_and_year_boundaries(self) -> None:
+        self.assertEqual(
+            CronSchedule.parse("*/5 * * * *").next_after(datetime(2026, 12, 31, 23, 58)), datetime(2027, 1, 1, 0, 0)
+        )
+        # Day and weekday must both match: the next Friday the 13th.
+        self.assertEqual(CronSchedule.parse("0 3 13 * 5").next_after(datetime(2026, 10, 18)), datetime(2026, 11, 13, 3, 0))
+
+    def test_next_after_finds_leap_days_beyond_a_year(self) -> None:
+        sched = CronSchedule.parse("0 3 29 2 *")
+        self.assertEqual(sched.next_after(datetime(2026, 10, 18)), datetime(2028, 2, 29, 3, 0))
+
+    def test_parse_rejects_schedules_that_never_fire(self) -> None:
+        for expression in ("0 0 30 2 *", "0 0 31 4,6,9,11 *"):
+            with self.assertRaises(CronParseError):
+                CronSchedule.parse(expression)
+
+    def test_next_after_matches_minute_scanner(self) -> None:
+        rng = random.Random(20)
+        base = datetime(2024, 1, 1)
+        for _ in range(30):
+            expression = " ".join(
+                (
+                    _random_field(rng, 0, 59, 0.3),
+                    _random_field(rng, 0, 23, 0.3),
+                    _random_field(rng, 1, 31, 0.7),
+                    _random_field(rng, 1, 12, 0.7),
+                    _random_field(rng, 0, 6, 0.7),
+                )
+            )
+            try:
+                sched = CronSchedule.parse(expression)
+            except CronParseError:
+                continue
+            start = base + timedelta(minutes=rng.randrange(3 * 366 * 24 * 60), seconds=rng.randrange(60))
+            try:
+                expected = _scan_next_after(sched, start)
+            except CronParseError:
+                # The scanner gives up after a year; the field walk may still find a later match.
+                try:
+                    found = sched.next_after(start)
+                except CronParseError:
+                    continue
+                self.assertGreater(found - start, timedelta(days=365), expression)
+                self.assertTrue(sched.matches(found), expression)
+                continue
+            self.assertEqual(sched.next_after(start), expected, (expression, start))
+
     def test_invalid_expression(self) -> None:
         with self.assertRaises(CronParseError):
             CronSchedule.parse("* * *")
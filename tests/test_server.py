@@ -0,0 +1,149 @@
+import http.client
+import json
+import threading
+import time
+import unittest
+from http.server import ThreadingHTTPServer
+
+from openclaw_sentinel.api import serve
+from openclaw_sentinel.connectors import StaticConnector
+from openclaw_sentinel.policy import PolicyEngine, PolicyRule
+from openclaw_sentinel.server import BoundedHTTPServer
+from openclaw_sentinel.service import SentinelService
+from openclaw_sentinel.verification import VerificationService
+
+
+def _service() -> SentinelService:
+    return SentinelService(
+        connectors=[StaticConnector(source_name="datadog", incidents=[])],
+        policy_engine=PolicyEngine(PolicyRule(tenant_id="t1")),
+        planner=lambda _incident: [],
+        executor=lambda _action: "ok",
+        verifier=VerificationService(),
+    )
+
+
+class BoundedHTTPServerTests(unittest.TestCase):
+    def _start(self, **options) -> BoundedHTTPServer:
+        self.service = _service()
+        server = serve(service=self.service, host="127.0.0.1", port=0, **options)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.port = server.server_address[1]
+        return server
+
+    def _connection(self) -> http.client.HTTPConnection:
+        conn = http.client.HTTPConnection("127.0.0.1", self.port, timeout=5)
+        self.addCleanup(conn.close)
+        return conn
+
+    def test_default_keeps_thread_per_connection_server(self) -> None:
+        server = serve(service=_service(), host="127.0.0.1", port=0)
+        self.addCleanup(server.server_close)
+        self.assertIsInstance(server, ThreadingHTTPServer)
+
+    def test_serves_many_requests_over_one_connection(self) -> None:
+        self.assertIsInstance(self._start(workers=2), BoundedHTTPServer)
+        conn = self._connection()
+
+        conn.request("GET", "/health")
+        resp = conn.getresponse()
+        self.assertEqual((resp.status, json.loads(resp.read())), (200, {"status": "ok"}))
+        sock = conn.sock
+        conn.request("POST", "/run-cycle", body=json.dumps({"cycle_id": "ka"}), headers={"Content-Type": "application/json"})
+        resp = conn.getresponse()
+        self.assertEqual(json.loads(resp.read())["cycle_id"], "ka")
+        conn.request("GET", "/metrics")
+        resp = conn.getresponse()
+        self.assertEqual(resp.status, 200)
+        resp.read()
+
+        self.assertIs(conn.sock, sock)
+        self.assertEqual(resp.version, 11)
+
+    def test_idle_keep_alive_connection_does_not_delay_new_ones(self) -> None:
+        self._start(workers=1, keep_alive_seconds=5.0)
+        idle = self._connection()
+        idle.request("GET", "/health")
+        idle.getresponse().read()
+
+        started = time.monotonic()
+        fresh = self._connection()
+        fresh.request("GET", "/health")
+        self.assertEqual(fresh.getresponse().status, 200)
+        self.assertLess(time.monotonic() - started, 1.0)
+
+    def test_rejects_oversized_bodies_without_reading_them(self) -> None:
+        self._start(workers=1, max_body_bytes=16)
+        conn = self._connection()
+        conn.request("POST", "/run-cycle", body=b"x" * 1024)
+        resp = conn.getresponse()
+
+        self.assertEqual((resp.status, json.loads(resp.read())), (413, {"error": "payload_too_large"}))
+        self.assertEqual(resp.getheader("Connection"), "close")
+        self.assertEqual(self.service.reporting.counter_snapshot()["http_body_too_large"], 1)
+
+    def test_rejects_chunked_bodies_and_closes(self) -> None:
+        self._start(workers=1)
+        conn = self._connection()
+        # One write, so the 411 cannot race the client still sending chunks.
+        conn.request("POST", "/run-cycle", body=b'17\r\n{"cycle_id": "chunked"}\r\n0\r\n\r\n', headers={"Transfer-Encoding": "chunked"})
+        resp = conn.getresponse()
+
+        self.assertEqual((resp.status, json.loads(resp.read())), (411, {"error": "length_required"}))
+        self.assertEqual(resp.getheader("Connection"), "close")
+        self.assertEqual(self.service.reporting.counter_snapshot()["http_length_required"], 1)
+
+    def test_overload_gets_fast_503(self) -> None:
+        entered, release = threading.Event(), threading.Event()
+        self.addCleanup(release.set)
+
+        class _BlockingConnector:
+            source_name = "slow"
+
+            def fetch_incidents(self):
+                entered.set()
+                release.wait(5)
+                return []
+
+        server = self._start(workers=1, max_pending=1)
+        self.service.connectors = [_BlockingConnector()]
+        # Occupies the only worker inside a cycle.
+        busy = self._connection()
+
+        def run_cycle() -> None:
+            busy.request("POST", "/run-cycle", body=b"{}")
+            busy.getresponse().read()
+
+        busy_thread = threading.Thread(target=run_cycle)
+        busy_thread.start()
+        self.assertTrue(entered.wait(5))
+        queued = self._connection()
+        queued.connect()
+        for _ in range(500):
+            if server.has_pending():
+                break
+            threading.Event().wait(0.01)
+
+        rejected = self._connection()
+        rejected.request("GET", "/health")
+        resp = rejected.getresponse()
+        self.assertEqual(resp.status, 503)
+        self.assertEqual(resp.getheader("Retry-After"), "1")
+        self.assertEqual(json.loads(resp.read()), {"error": "overloaded"})
+        self.assertEqual(self.service.reporting.counter_snapshot()["http_rejected_overload"], 1)
+
+        release.set()
+        busy_thread.join(5)
+        queued.request("GET", "/health")
+        self.assertEqual(queued.getresponse().status, 200)
+
+    def test_rejects_invalid_pool_sizes(self) -> None:
+        with self.assertRaises(ValueError):
+            serve(service=_service(), host="127.0.0.1", port=0, workers=1, max_pending=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
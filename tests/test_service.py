@@ -1,4 +1,7 @@
+import threading
+import time
 import unittest
+from dataclasses import dataclass
 
 from openclaw_sentinel.connectors import StaticConnector
 from openclaw_sentinel.models import Action, AutonomyLevel, Incident, RiskProfile
@@ -7,6 +10,37 @@ from openclaw_sentinel.service import SentinelService
 from openclaw_sentinel.verification import VerificationService
 
 
+@dataclass
+class _BlockingConnector:
+    source_name: str
+    release: threading.Event
+
+    def fetch_incidents(self):
+        self.release.wait(5)
+        return []
+
+
+@dataclass
+class _FailingConnector:
+    source_name: str = "broken"
+
+    def fetch_incidents(self):
+        raise RuntimeError("upstream 500")
+
+
+def _allow_restart_service(incident: Incident):
+    yield (
+        Action(
+            id=f"{incident.id}-a1",
+            incident_id=incident.id,
+            tenant_id="t1",
+            action_type="restart_service",
+            command="systemctl restart worker",
+        ),
+        RiskProfile(impact=1, blast_radius=1, reversibility=5, confidence=0.95),
+    )
+
+
 class SentinelServiceTests(unittest.TestCase):
     def test_run_cycle_tracks_approved_blocked_and_success(self) -> None:
         incidents = [
@@ -68,6 +102,102 @@ class SentinelServiceTests(unittest.TestCase):
         self.assertEqual(metrics["actions_blocked"], 1)
         self.assertEqual(metrics["actions_succeeded"], 1)
 
+    def _fan_out_service(self, connectors, **kwargs) -> SentinelService:
+        return SentinelService(
+            connectors=connectors,
+            policy_engine=PolicyEngine(
+                PolicyRule(
+                    tenant_id="t1",
+                    max_autonomy=AutonomyLevel.L2_BOUNDED_AUTO,
+                    allowlisted_action_types={"restart_service"},
+                )
+            ),
+            planner=_allow_restart_service,
+            executor=lambda _action: "ok",
+            verifier=VerificationService(),
+            **kwargs,
+        )
+
+    def test_concurrent_fetch_returns_partial_results_when_connector_times_out(self) -> None:
+        release = threading.Event()
+        self.addCleanup(release.set)
+        fast = StaticConnector(
+            source_name="grafana",
+            incidents=[Incident(id="g1", tenant_id="t1", source="grafana", severity="high", summary="latency")],
+        )
+        service = self._fan_out_service(
+            [_BlockingConnector(source_name="datadog", release=release), fast],
+            fetch_workers=2,
+            connector_timeout_seconds=0.05,
+        )
+
+        started = time.monotonic()
+        summary = service.run_cycle(cycle_id="cycle-1")
+
+        self.assertLess(time.monotonic() - started, 2.0)
+        self.assertEqual(summary.incidents_seen, 1)
+        self.assertEqual(summary.actions_succeeded, 1)
+        metrics = service.reporting.snapshot()
+        self.assertEqual(metrics["connector_timeouts_datadog"], 1)
+        self.assertEqual(metrics["connector_fetch_grafana_count"], 1)
+
+    def test_concurrent_fetch_counts_failures_and_keeps_connector_order(self) -> None:
+        first = StaticConnector(
+            source_name="datadog",
+            incidents=[Incident(id="d1", tenant_id="t1", source="datadog", severity="high", summary="cpu")],
+        )
+        second = StaticConnector(
+            source_name="grafana",
+            incidents=[Incident(id="g1", tenant_id="t1", source="grafana", severity="high", summary="latency")],
+        )
+        service = self._fan_out_service([first, _FailingConnector(), second], fetch_workers=3)
+
+        fetched = [incident.id for incident in service._iter_incidents()]
+
+        self.assertEqual(fetched, ["d1", "g1"])
+        self.assertEqual(service.reporting.snapshot()["connector_failures_broken"], 1)
+
+    def test_hung_connector_is_not_resubmitted_and_pool_is_reused(self) -> None:
+        release = threading.Event()
+        self.addCleanup(release.set)
+        hung = _BlockingConnector(source_name="datadog", release=release)
+        service = self._fan_out_service([hung], fetch_workers=2, connector_timeout_seconds=0.05)
+        self.addCleanup(service.close)
+
+        for cycle in range(3):
+            service.run_cycle(cycle_id=f"cycle-{cycle}")
+        pool = service._fetch_pool
+
+        labeled = service.reporting.labeled_snapshot()
+        self.assertEqual(labeled["connector_timeouts"], {("datadog",): 1})
+        self.assertEqual(labeled["connector_busy"], {("datadog",): 2})
+        release.set()
+        service._fetches[id(hung)].result(timeout=5)
+        service.run_cycle(cycle_id="cycle-3")
+        self.assertIs(service._fetch_pool, pool)
+        self.assertEqual(service.reporting.labeled_snapshot()["connector_busy"], {("datadog",): 2})
+
+    def test_streaming_source_is_drained_before_actions_run(self) -> None:
+        events = []
+
+        @dataclass
+        class _StreamingConnector:
+            source_name: str = "datadog"
+
+            def fetch_incidents(self):
+                for n in range(2):
+                    yield Incident(id=f"d{n}", tenant_id="t1", source="datadog", severity="high", summary="cpu")
+                events.append("stream_closed")
+
+        service = self._fan_out_service([_StreamingConnector()])
+        service.executor = lambda action: events.append(action.id) or "ok"
+
+        summary = service.run_cycle(cycle_id="cycle-1")
+
+        self.assertEqual(summary.actions_succeeded, 2)
+        self.assertEqual(events, ["stream_closed", "d0-a1", "d1-a1"])
+        self.assertEqual(service.reporting.snapshot()["connector_fetch_datadog_count"], 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,107 @@
+import os
+import tempfile
+import time
+import unittest
+
+from openclaw_sentinel.connectors import StaticConnector
+from openclaw_sentinel.models import AutonomyLevel, Incident
+from openclaw_sentinel.planner import RuleBasedPlanner
+from openclaw_sentinel.policy import PolicyEngine, PolicyRule
+from openclaw_sentinel.prometheus import render_prometheus
+from openclaw_sentinel.reporting import ReportingStore
+from openclaw_sentinel.service import SentinelService
+from openclaw_sentinel.state_store import SQLiteStateStore
+from openclaw_sentinel.verification import VerificationService
+
+
+class SQLiteStateStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "state.db")
+
+    def _store(self, **kwargs) -> SQLiteStateStore:
+        store = SQLiteStateStore(path=self.path, **kwargs)
+        self.addCleanup(store.close)
+        return store
+
+    def _service(self, store: SQLiteStateStore) -> SentinelService:
+        return SentinelService(
+            connectors=[
+                StaticConnector(
+                    source_name="grafana",
+                    incidents=[Incident(id="g1", tenant_id="t1", source="grafana", severity="critical", summary="slow")],
+                )
+            ],
+            policy_engine=PolicyEngine(
+                PolicyRule(
+                    tenant_id="t1",
+                    max_autonomy=AutonomyLevel.L2_BOUNDED_AUTO,
+                    allowlisted_action_types={"restart_service"},
+                )
+            ),
+            planner=RuleBasedPlanner().plan,
+            executor=lambda _action: "ok",
+            verifier=VerificationService(),
+            state_store=store,
+        )
+
+    def test_service_persists_incidents_decisions_outcomes_and_cycles(self) -> None:
+        store = self._store(batch_size=1000)
+        self._service(store).run_cycle(cycle_id="c1")
+        self.assertTrue(store.flush(timeout=5))
+
+        self.assertEqual(store.records("incident")[0]["payload"]["id"], "g1")
+        reasons = sorted(r["payload"]["reason"] for r in store.records("decision"))
+        self.assertEqual(reasons, ["action_type_not_allowlisted", "approved_for_auto"])
+        self.assertTrue(store.records("outcome")[0]["payload"]["success"])
+        self.assertEqual(store.records("cycle")[0]["payload"]["actions_succeeded"], 1)
+        self.assertEqual(store.latest_counters()["counters"]["incidents_seen"], 1)
+
+    def test_counters_survive_restart(self) -> None:
+        store = self._store(fsync="always")
+        self._service(store).run_cycle(cycle_id="c1")
+        store.close()
+
+        reopened = self._store()
+        reporting = ReportingStore()
+        reporting.restore(reopened.latest_counters())
+        self.assertEqual(reporting.snapshot()["actions_approved"], 1)
+        self.assertEqual(reporting.labeled_snapshot()["blocked_reason"], {("action_type_not_allowlisted",): 1})
+        exposition = render_prometheus(reporting)
+        self.assertIn('openclaw_sentinel_blocked_reason_total{reason="action_type_not_allowlisted"} 1', exposition)
+        self.assertNotIn("blocked_reason_action_type", exposition)
+        self.assertNotIn("stage_plan_count_total", exposition)
+
+    def test_always_mode_returns_after_the_record_is_committed(self) -> None:
+        store = self._store(fsync="always", flush_interval_seconds=60)
+        store.record_incident(Incident(id="g1", tenant_id="t1", source="grafana", severity="critical", summary="slow"))
+
+        self.assertEqual(store.written, 1)
+        self.assertEqual(store.records("incident")[0]["ref"], "g1")
+
+    def test_compaction_applies_retention(self) -> None:
+        store = self._store(retention_seconds=0.05)
+        store.record_cycle(self._service(store).run_cycle(cycle_id="old"))
+        store.flush()
+        time.sleep(0.1)
+
+        store.compact()
+
+        self.assertEqual(store.records("cycle"), [])
+
+    def test_full_queue_drops_instead_of_blocking(self) -> None:
+        store = self._store(max_queue=1, flush_interval_seconds=5)
+        for n in range(200):
+            store.record_incident(Incident(id=f"i{n}", tenant_id="t1", source="x", severity="low", summary="s"))
+        store.flush()
+        self.assertGreater(store.dropped, 0)
+        self.assertEqual(store.written + store.dropped, 200)
+
+    def test_rejects_unknown_fsync_mode(self) -> None:
+        with self.assertRaises(ValueError):
+            SQLiteStateStore(path=self.path, fsync="sometimes")
+
+
+if __name__ == "__main__":
+    unittest.main()